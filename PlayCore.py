@@ -5,9 +5,10 @@ import math
 from typing import Dict, List, Tuple
 from collections import deque
 
-from localLibraries.PlayCoreLibraries import ScreenObject, blit_fps
-
-pygame.init()
+from localLibraries.PlayCoreLibraries import ScreenObject
+from localLibraries.AssetManager import assets
+from localLibraries.FrameProfiler import FrameProfiler
+from localLibraries.DirtyRectRenderer import DirtyRectRenderer
 
 # ----------------------------- Tunables ------------------------------------
 SHINE_ENABLED   = False   # 반짝(샤인) 기본 끔
@@ -43,7 +44,7 @@ class Square:
         # 회전은 비용이 큼 → 개수는 작고, 나머지 최적화로 여유 확보
         rotated_surface = pygame.transform.rotate(self.surface, self.angle)
         rect = rotated_surface.get_rect(center=(self.x, self.y))
-        screen.blit(rotated_surface, rect.topleft)
+        return screen.blit(rotated_surface, rect.topleft)
 
 # --------------------------------- Helpers ---------------------------------
 def clamp01(x): return 0.0 if x < 0 else 1.0 if x > 1 else x
@@ -245,13 +246,22 @@ class PlayCoreMenu(ScreenObject):
     DARK_BLUE   = (10, 10, 40)
     DARK_PURPLE = (40, 10, 70)
 
-    def __init__(self, width, height, show_fps=False):
+    def __init__(self, width, height, show_fps=False, on_first_frame=None):
         super().__init__(width, height)
         self.show_fps = show_fps
+        self.profiler = FrameProfiler(show_fps)
+        # 첫 프레임이 화면에 나간 직후 한 번 호출 (부팅 시간 측정용)
+        self.on_first_frame = on_first_frame
+
+        # Dirty-rect 상태 (loop 진입 시 다시 초기화)
+        self.renderer = DirtyRectRenderer((width, height))
+        self._drawn_scroll = None
+        self._drawn_modal = None
+        self._drawn_tiles = {}
 
         # Fonts
-        self.fontH1 = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", 48)
-        self.fontP  = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", 24)
+        self.fontH1 = assets.font("data/fonts/SairaCondensed-Light.ttf", 48)
+        self.fontP  = assets.font("data/fonts/SairaCondensed-Light.ttf", 24)
 
         # Title text (사전 렌더)
         self.title_text_surface = self.fontH1.render("DSHS PlayCore", True, (255, 255, 255))
@@ -468,6 +478,13 @@ class PlayCoreMenu(ScreenObject):
         view_l = self.scroll_x - 100
         view_r = self.scroll_x + self.width + 100
 
+        # 스크롤/모달 변화는 전체, 그 외엔 모양이 바뀐 타일만 dirty
+        scroll_px = int(self.scroll_x)
+        if scroll_px != self._drawn_scroll or self.modal is not self._drawn_modal:
+            self.renderer.mark_full()
+        self._drawn_scroll = scroll_px
+        self._drawn_modal = self.modal
+
         for i, tile in enumerate(self.tiles):
             base = self.tile_rects[i]
             if base.right < view_l or base.left > view_r:
@@ -482,7 +499,7 @@ class PlayCoreMenu(ScreenObject):
             radius = 24 if i == 0 else 20
 
             # 그림자
-            screen.blit(self._tile_shadow(rect, radius), (rect.x-9, rect.y-6))
+            shadow_rect = screen.blit(self._tile_shadow(rect, radius), (rect.x-9, rect.y-6))
 
             # 카드 본체 (캐시)
             body = self._card_body_cache.get(rect.w, rect.h, radius, tile["color"], alpha=228)
@@ -496,6 +513,14 @@ class PlayCoreMenu(ScreenObject):
             idx = int((phase % 1.0) * PATTERN_FRAMES) % PATTERN_FRAMES
             screen.blit(frames[idx], rect.topleft)
 
+            # 이전에 그린 자리(hover 때의 큰 카드/외곽선/그림자)도 같이 갱신해야 잔상이 안 남음
+            state = (tuple(rect), hovered, idx)
+            drawn = shadow_rect.union(rect)
+            prev = self._drawn_tiles.get(i)
+            if SHINE_ENABLED or prev is None or prev[0] != state:
+                self.renderer.mark(drawn if prev is None else drawn.union(prev[1]))
+                self._drawn_tiles[i] = (state, drawn)
+
             # 상단 옅은 그라디언트 (캐시)
             grad = self._tile_assets[key]["grad"]
             screen.blit(grad, rect.topleft)
@@ -523,9 +548,10 @@ class PlayCoreMenu(ScreenObject):
 
         self._draw_scrollbar(screen)
 
-        # 모달 열려 있으면 그리기
+        # 모달 열려 있으면 그리기 (버튼 hover 때문에 카드 영역은 매 프레임 갱신)
         if self.modal is not None:
             self.modal.draw(screen)
+            self.renderer.mark(self.modal.rect.inflate(24, 24))
 
     # ------------------------------- Input ----------------------------------
     def _open_confirm_modal(self, title):
@@ -641,7 +667,7 @@ class PlayCoreMenu(ScreenObject):
 
     def draw_squares(self, screen):
         for sq in self.squares:
-            sq.draw(screen)
+            self.renderer.mark(sq.draw(screen))
 
     # --------------------------------- Loop ---------------------------------
     def loop(self, screen):
@@ -649,8 +675,13 @@ class PlayCoreMenu(ScreenObject):
         running = True
         frame_cnt = 0
 
+        self.renderer = DirtyRectRenderer(screen.get_size())
+        self._drawn_tiles.clear()
+
         while running:
+            self.profiler.begin_frame()
             dt_ms = clock.tick(60)
+            self.profiler.idle()
             dt = dt_ms / 1000.0
 
             self.frame_count += 1
@@ -666,6 +697,7 @@ class PlayCoreMenu(ScreenObject):
                         self.modal.handle_event(event)
                     else:
                         self.handle_mouse(event)
+            self.profiler.mark("events")
 
             # 모달 결과
             if self.modal is not None and self.modal.result is not None:
@@ -719,6 +751,8 @@ class PlayCoreMenu(ScreenObject):
                     self.scroll_x = self.snap_target_x
                     self.snap_target_x = None
 
+            self.profiler.mark("update")
+
             # Background (프리렌더된 그라디언트 사용)
             screen.blit(self._bg, (0, 0))
             self.update_squares(dt)
@@ -727,14 +761,17 @@ class PlayCoreMenu(ScreenObject):
             # Tiles (+ 모달)
             self.draw_tiles(screen)
 
-            if self.show_fps:
-                blit_fps(screen, clock)
+            self.renderer.mark(self.profiler.draw(screen, clock))
 
-            pygame.display.flip()
+            self.renderer.present()
+            self.profiler.mark("flip")
+            if frame_cnt == 0 and self.on_first_frame is not None:
+                self.on_first_frame()
             frame_cnt += 1
 
 # ------------------------------- Run ---------------------------------------
 if __name__ == "__main__":
+    pygame.init()
     WIDTH, HEIGHT = 1280, 720
     # 하드웨어 더블버퍼 & vsync (가능한 경우) → 안정된 프레임
     try:
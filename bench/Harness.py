@@ -0,0 +1,397 @@
+import os
+import time
+import random
+import builtins
+import tempfile
+
+import numpy as np
+import pygame
+
+from localLibraries.InputReplay import InputRecorder, InputReplayer, Recording, ReplayFinished
+from localLibraries.SaveStore import saves
+from localLibraries.Leaderboard import leaderboard
+
+
+DRAW_FUNCS = ("line", "lines", "aaline", "aalines", "circle", "rect", "polygon", "arc", "ellipse")
+
+PHASES = ("events", "update", "draw", "flip", "frame")
+
+
+class BenchFinished(Exception):
+    """flip()에서 목표 프레임 수에 도달하면 던져서 씬 루프를 빠져나옴"""
+
+
+class SimClock:
+    """
+    Drop-in for pygame.time.Clock that never sleeps.
+
+    Every tick advances a shared simulated time by exactly 1/60 s, so scenes see
+    the same dt they would at a locked 60 FPS while the harness runs uncapped.
+    """
+    sim_ms = 0.0
+    step_ms = 1000 / 60
+
+    def __init__(self):
+        self._last = SimClock.sim_ms
+        self._time = 0
+
+    def tick(self, framerate=0):
+        SimClock.sim_ms += SimClock.step_ms
+        now = int(SimClock.sim_ms)
+        self._time = now - int(self._last)
+        self._last = SimClock.sim_ms
+        return self._time
+
+    tick_busy_loop = tick
+
+    def get_time(self):
+        return self._time
+
+    def get_rawtime(self):
+        return self._time
+
+    def get_fps(self):
+        return 1000 / SimClock.step_ms
+
+    @staticmethod
+    def get_ticks():
+        return int(SimClock.sim_ms)
+
+    @staticmethod
+    def wait(ms):
+        SimClock.sim_ms += ms
+        return int(ms)
+
+
+class InputScript:
+    """
+    Per-frame scripted mouse/keyboard input.
+
+    Gestures are registered against frame numbers; the harness calls step(frame)
+    once per frame to move the fake cursor and collect the events to post.
+    """
+    def __init__(self, start_pos=(0, 0)):
+        self.pos = start_pos
+        self.buttons = (False, False, False)
+        self.moves = {}
+        self.events = {}
+
+    def _add(self, frame, ev_type, **attrs):
+        self.events.setdefault(frame, []).append((ev_type, attrs))
+
+    def move(self, frame, pos):
+        self.moves[frame] = (int(pos[0]), int(pos[1]))
+
+    def tap(self, frame, pos, hold=3, button=1):
+        self.move(frame, pos)
+        self._add(frame, pygame.MOUSEBUTTONDOWN, button=button)
+        self._add(frame + hold, pygame.MOUSEBUTTONUP, button=button)
+
+    def drag(self, frame, start, end, frames=20, button=1):
+        self.move(frame, start)
+        self._add(frame, pygame.MOUSEBUTTONDOWN, button=button)
+        for i in range(1, frames + 1):
+            t = i / frames
+            self.move(frame + i, (start[0] + (end[0] - start[0]) * t, start[1] + (end[1] - start[1]) * t))
+            self._add(frame + i, pygame.MOUSEMOTION)
+        self._add(frame + frames + 1, pygame.MOUSEBUTTONUP, button=button)
+
+    def key(self, frame, key):
+        self._add(frame, pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+        self._add(frame + 1, pygame.KEYUP, key=key, mod=0, unicode="", scancode=0)
+
+    def step(self, frame):
+        prev = self.pos
+        self.pos = self.moves.get(frame, self.pos)
+
+        out = []
+        for ev_type, attrs in self.events.get(frame, ()):
+            if ev_type == pygame.MOUSEBUTTONDOWN:
+                self.buttons = (True, self.buttons[1], self.buttons[2])
+                out.append(pygame.event.Event(ev_type, pos=self.pos, **attrs))
+            elif ev_type == pygame.MOUSEBUTTONUP:
+                self.buttons = (False, self.buttons[1], self.buttons[2])
+                out.append(pygame.event.Event(ev_type, pos=self.pos, **attrs))
+            elif ev_type == pygame.MOUSEMOTION:
+                rel = (self.pos[0] - prev[0], self.pos[1] - prev[1])
+                out.append(pygame.event.Event(ev_type, pos=self.pos, rel=rel, buttons=tuple(int(b) for b in self.buttons)))
+            else:
+                out.append(pygame.event.Event(ev_type, **attrs))
+        return out
+
+
+class TimedScreen(pygame.Surface):
+    """blit/fill on the screen surface count towards the draw phase"""
+    timer = None
+
+    def blit(self, *args, **kwargs):
+        t = time.perf_counter()
+        r = super().blit(*args, **kwargs)
+        self.timer.draw += time.perf_counter() - t
+        return r
+
+    def blits(self, *args, **kwargs):
+        t = time.perf_counter()
+        r = super().blits(*args, **kwargs)
+        self.timer.draw += time.perf_counter() - t
+        return r
+
+    def fill(self, *args, **kwargs):
+        t = time.perf_counter()
+        r = super().fill(*args, **kwargs)
+        self.timer.draw += time.perf_counter() - t
+        return r
+
+
+class FrameTimer:
+    def __init__(self, frames, warmup, script):
+        self.frames = frames
+        self.warmup = warmup
+        self.script = script
+
+        self.frame = 0
+        self.events = 0.0
+        self.draw = 0.0
+        self.frame_start = time.perf_counter()
+        self.pending = script.step(0)
+        self.posted = False
+
+        self.samples = {phase: [] for phase in PHASES}
+
+        # trace 모드: 프레임이 끝날 때마다 probe()가 돌려준 씬 상태를 쌓음
+        self.probe = None
+        self.trace = []
+
+    def restart(self):
+        """씬 생성 중에 쌓인 draw/events 시간을 버리고 프레임 측정을 새로 시작"""
+        self.events = 0.0
+        self.draw = 0.0
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self, flip_time):
+        now = time.perf_counter()
+        total = now - self.frame_start
+        if self.frame >= self.warmup:
+            self.samples["events"].append(self.events)
+            self.samples["draw"].append(self.draw)
+            self.samples["flip"].append(flip_time)
+            self.samples["update"].append(max(0.0, total - self.events - self.draw - flip_time))
+            self.samples["frame"].append(total)
+        if self.probe is not None:
+            self.trace.append(self.probe())
+
+        self.frame += 1
+        self.events = 0.0
+        self.draw = 0.0
+        self.pending = self.script.step(self.frame)
+        self.posted = False
+        self.frame_start = time.perf_counter()
+
+        if self.frame >= self.warmup + self.frames:
+            raise BenchFinished
+
+    def summary(self):
+        out = {}
+        for phase, values in self.samples.items():
+            if not values:
+                out[phase] = None
+                continue
+            ms = np.asarray(values) * 1000.0
+            out[phase] = {
+                "p50": round(float(np.percentile(ms, 50)), 4),
+                "p95": round(float(np.percentile(ms, 95)), 4),
+                "p99": round(float(np.percentile(ms, 99)), 4),
+                "max": round(float(ms.max()), 4),
+                "mean": round(float(ms.mean()), 4),
+            }
+        return out
+
+
+class Patches:
+    """Swaps pygame's clock/input/display hooks for the harness and restores them on exit"""
+    def __init__(self, timer):
+        self.timer = timer
+        self.saved = []
+        self.save_dir = tempfile.TemporaryDirectory(prefix="playcore-bench-")
+
+    def set(self, owner, name, value):
+        self.saved.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, value)
+
+    def __enter__(self):
+        timer = self.timer
+        real_get = pygame.event.get
+        real_flip = pygame.display.flip
+        real_update = pygame.display.update
+
+        def event_get(*args, **kwargs):
+            t = time.perf_counter()
+            if not timer.posted:
+                for ev in timer.pending:
+                    pygame.event.post(ev)
+                timer.posted = True
+            r = real_get(*args, **kwargs)
+            timer.events += time.perf_counter() - t
+            return r
+
+        def present(real):
+            def wrapped(*args, **kwargs):
+                t = time.perf_counter()
+                real(*args, **kwargs)
+                timer.end_frame(time.perf_counter() - t)
+            return wrapped
+
+        def timed_draw(real):
+            def wrapped(*args, **kwargs):
+                t = time.perf_counter()
+                r = real(*args, **kwargs)
+                timer.draw += time.perf_counter() - t
+                return r
+            return wrapped
+
+        real_open = builtins.open
+        save_dir = self.save_dir.name
+
+        def sandboxed_open(file, mode="r", *args, **kwargs):
+            # 벤치 중에는 세이브 파일을 임시 폴더로 돌려서 실제 기록을 건드리지 않음
+            if isinstance(file, str) and "/playdata/" in file.replace(os.sep, "/"):
+                redirected = os.path.join(save_dir, file.replace("/", "_").replace(os.sep, "_"))
+                if any(m in mode for m in "wax+") or os.path.exists(redirected):
+                    file = redirected
+            return real_open(file, mode, *args, **kwargs)
+
+        self.set(builtins, "open", sandboxed_open)
+        # 세이브 스토어도 임시 폴더의 새 스냅샷으로 (옛 saves.txt 기록에서 시작, 끝나면 원래 캐시로 복구)
+        self.set(saves, "path", os.path.join(save_dir, "saves.json"))
+        self.set(saves, "_data", None)
+        self.set(leaderboard, "path", os.path.join(save_dir, "runs.jsonl"))
+        self.set(leaderboard, "_boards", None)
+        self.set(pygame.time, "Clock", SimClock)
+        self.set(pygame.time, "get_ticks", SimClock.get_ticks)
+        self.set(pygame.time, "wait", SimClock.wait)
+        self.set(pygame.time, "delay", SimClock.wait)
+        self.set(pygame.event, "get", event_get)
+        self.set(pygame.mouse, "get_pos", lambda: timer.script.pos)
+        self.set(pygame.mouse, "get_pressed", lambda num_buttons=3: timer.script.buttons + (False,) * (num_buttons - 3))
+        self.set(pygame.display, "flip", present(real_flip))
+        self.set(pygame.display, "update", present(real_update))
+        for name in DRAW_FUNCS:
+            self.set(pygame.draw, name, timed_draw(getattr(pygame.draw, name)))
+        return self
+
+    def __exit__(self, *exc):
+        saves.flush()
+        leaderboard.flush()
+        for owner, name, value in reversed(self.saved):
+            setattr(owner, name, value)
+        self.saved.clear()
+        self.save_dir.cleanup()
+        return False
+
+
+def seed_all(seed):
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def run_scenario(scenario, frames=600, warmup=60, seed=0, size=(1280, 720), replay=None, overlay=False, trace=False):
+    """
+    Runs one scenario headless for warmup + frames frames and returns a JSON-able report.
+
+    With `replay` (a Recording) the scripted input is replaced by the recorded
+    frames, and the run also ends when the recording runs out. `overlay` builds the
+    scene with show_fps=True so the FrameProfiler overlay cost is included.
+    `trace` adds the scenario's probe() output for every frame (warmup included)
+    under "trace", for comparing simulation state between two versions of a scene.
+
+    Times are in milliseconds. draw = pygame.draw.* calls plus blit/fill on the
+    screen, events = pygame.event.get, flip = display flip/update, and update is
+    whatever is left of the frame.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    if replay is not None:
+        size = replay.size
+        seed = replay.seed
+
+    pygame.init()
+    width, height = size
+    display = pygame.display.set_mode(size)
+
+    SimClock.sim_ms = 0.0
+    seed_all(seed)
+
+    if replay is None:
+        script = scenario.script(width, height, warmup + frames, random.Random(seed))
+    else:
+        script = InputScript()
+    timer = FrameTimer(frames, warmup, script)
+
+    screen = TimedScreen(size)
+    TimedScreen.timer = timer
+    screen.blit(display, (0, 0))
+
+    loop_returns = []
+    with Patches(timer):
+        replayer = InputReplayer(replay) if replay is not None else None
+        try:
+            if replayer is not None:
+                replayer.__enter__()
+
+            build_start = time.perf_counter()
+            scene = scenario.build(width, height, show_fps=overlay)
+            build_time = time.perf_counter() - build_start
+            if trace:
+                timer.probe = lambda: scenario.probe(scene)
+            timer.restart()
+
+            while True:
+                frame_before = timer.frame
+                result = scenario.run(scene, screen)
+                loop_returns.append(str(result[0]) if isinstance(result, tuple) else str(result))
+                if timer.frame == frame_before or replayer is not None:
+                    # 녹화는 루프 한 번 분량이고, 한 프레임도 그리지 않고 빠져나오면 무한 루프가 되므로 중단
+                    break
+                scenario.reset(scene)
+        except (BenchFinished, ReplayFinished):
+            pass
+        finally:
+            if replayer is not None:
+                replayer.__exit__(None, None, None)
+
+    report = {
+        "scene": scenario.name,
+        "frames": len(timer.samples["frame"]),
+        "warmup": warmup,
+        "seed": seed,
+        "size": list(size),
+        "build_ms": round(build_time * 1000.0, 3),
+        "overlay": overlay,
+        "loop_returns": loop_returns,
+        "phases": timer.summary(),
+    }
+    if replay is not None:
+        report["replay_frames"] = len(replay)
+    if trace:
+        report["trace"] = timer.trace
+    return report
+
+
+def record_scenario(scenario, path, seed=None, size=(1280, 720)):
+    """
+    Opens a real window and records a human playing the scenario's scene until the
+    loop returns or the window is closed. Returns the Recording that was saved.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode(size)
+    pygame.display.set_caption(f"DSHS PlayCore - recording {scenario.name}")
+
+    recorder = InputRecorder(path, seed=seed, scene=scenario.key, size=size)
+    try:
+        with recorder:
+            scene = scenario.build(*size)
+            scenario.run(scene, screen)
+    except SystemExit:
+        pass
+    return recorder.recording
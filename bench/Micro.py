@@ -0,0 +1,178 @@
+"""
+Micro-benchmarks: one hot function timed outside of any scene loop.
+
+    python -m bench micro collision --lines 5000
+    python -m bench micro kernel --ticks 20000     (scalar vs NumPy hit test, must agree exactly)
+"""
+import math
+import time
+import random
+
+import numpy as np
+
+from scenes.Lynez import Player, LineIndex, BATCH_MIN
+
+
+def lynez_lines(width, height, count, rng):
+    """Lynez가 스크롤하며 만드는 것과 같은 분포의 선 count개 (위쪽으로 height/7마다 2/3 확률)"""
+    lines = []
+    scrolly = 0
+    while len(lines) < count:
+        scrolly -= height / 7
+        if rng.randint(1, 3) <= 2:
+            base_y = scrolly - height / 10
+            base_x = rng.randint(0, width)
+            lines.append([[base_x, base_y], [base_x + (rng.random() - 0.5) * width * 2 / 3,
+                                             base_y + (rng.random() - 0.5) * height / 5]])
+    return lines
+
+
+def collision_samples(lines, width, height, ticks, rng):
+    """(이전 위치, 속도) 샘플 - 절반은 아무 선을 향해 떨어지고 절반은 빈 곳"""
+    samples = []
+    for i in range(ticks):
+        if i % 2 == 0:
+            (x1, y1), (x2, y2) = rng.choice(lines)
+            t = rng.random()
+            x, y = x1 + (x2 - x1) * t, y1 + (y2 - y1) * t - rng.uniform(0, 6)
+        else:
+            x = rng.uniform(0, width)
+            y = rng.uniform(min(line[0][1] for line in lines[-10:]), height)
+        samples.append((x, y, rng.uniform(-4, 4), rng.uniform(-8, 2) * height / 1280))
+    return samples
+
+
+def run_collision(player, sample, lines, indexed):
+    x, y, speedx, speedy = sample
+    player.x, player.y, player.speedx, player.speedy = x, y, speedx, speedy
+    player.update()
+    prev = (x, y)
+    if indexed:
+        player.handle_collision(lines, prev, [])
+    else:
+        hit = player.first_hit_scalar(lines, prev)
+        if hit is not None:
+            player.bounce(lines[hit][0], lines[hit][1], prev)
+    return player.x, player.y, player.speedx, player.speedy
+
+
+def bench_collision(lines=5000, ticks=2000, seed=0, size=(1280, 720)):
+    width, height = size
+    rng = random.Random(seed)
+    world = lynez_lines(width, height, lines, rng)
+    samples = collision_samples(world, width, height, ticks, rng)
+
+    index = LineIndex(height / 8)
+    index.extend(world)
+    player = Player(width / 2, height / 2, 0, 0, height / 80, (0, 0, 0), height)
+
+    report = {"bench": "collision", "lines": len(world), "ticks": ticks, "seed": seed, "size": list(size)}
+    results = {}
+    for name, indexed, target in (("linear", False, list(index)), ("indexed", True, index)):
+        start = time.perf_counter()
+        results[name] = [run_collision(player, sample, target, indexed) for sample in samples]
+        report[f"{name}_us"] = round((time.perf_counter() - start) / ticks * 1e6, 2)
+
+    bounce = 11 * player.adj_constant   # 선에 맞으면 speedy가 이 값으로 바뀜
+    report["hits"] = sum(1 for result in results["linear"] if result[3] == bounce)
+    report["candidates"] = round(sum(len(index.query(x, y, x + vx, y - vy)) for x, y, vx, vy in samples) / ticks, 2)
+    report["same_results"] = results["linear"] == results["indexed"]
+    report["summary"] = (f"{report['lines']} lines, linear {report['linear_us']:.1f} us, "
+                         f"indexed {report['indexed_us']:.1f} us per tick")
+    return report
+
+
+def kernel_case(rng, count, width, height):
+    """
+    Player motion plus `count` candidate lines around it. Besides random lines
+    crossing the path, it mixes in the edge cases of the scalar test: horizontal
+    and vertical lines, lines collinear with the motion, endpoints exactly on
+    the path, lines through the previous position, zero-length lines and a
+    player that didn't move.
+    """
+    px, py = rng.uniform(0, width), rng.uniform(0, height)
+    if rng.random() < 0.05:
+        dx = dy = 0.0
+    else:
+        dx, dy = rng.choice((rng.uniform(-8, 8), 0.0)), rng.uniform(-12, 12)
+    cx, cy = px + dx, py + dy
+    speedy = -dy if rng.random() < 0.9 else rng.uniform(-1, 1)
+
+    lines = []
+    for _ in range(count):
+        kind = rng.randrange(7)
+        t = rng.random()
+        mx, my = px + dx * t, py + dy * t
+        if kind == 0:
+            w = rng.uniform(5, 200)
+            lines.append(((mx - w, my), (mx + rng.uniform(5, 200), my)))
+        elif kind == 1:
+            lines.append(((mx, my - rng.uniform(5, 50)), (mx, my + rng.uniform(5, 50))))
+        elif kind == 2:
+            lines.append(((px - dx, py - dy), (cx + dx * t, cy + dy * t)))
+        elif kind == 3:
+            lines.append(((mx, my), (mx + rng.uniform(-100, 100), my + rng.uniform(-100, 100))))
+        elif kind == 4:
+            lines.append(((px, py), (px + rng.uniform(-100, 100), py + rng.uniform(-100, 100))))
+        elif kind == 5:
+            lines.append(((mx, my), (mx, my)))
+        else:
+            a = rng.uniform(0, 6.283)
+            r = rng.uniform(5, 150)
+            ux, uy = r * math.cos(a), r * math.sin(a)
+            lines.append(((mx - ux, my - uy), (mx + ux * rng.uniform(0.2, 1), my + uy * rng.uniform(0.2, 1))))
+    return (px, py), (cx, cy), speedy, lines
+
+
+def nearby_case(rng, count, width, height):
+    """시간 측정용: 경로 근처(같은 띠)에 있지만 대부분은 경로를 지나지 않는 선들"""
+    px, py = rng.uniform(0, width), rng.uniform(0, height)
+    cx, cy = px + rng.uniform(-8, 8), py + rng.uniform(-12, 12)
+    lines = []
+    for _ in range(count):
+        x, y = rng.uniform(px - 300, px + 300), rng.uniform(py - 60, py + 60)
+        lines.append(((x, y), (x + rng.uniform(-400, 400), y + rng.uniform(-140, 140))))
+    return (px, py), (cx, cy), cy - py, lines
+
+
+def bench_kernel(lines=64, ticks=20000, seed=0, size=(1280, 720)):
+    width, height = size
+    rng = random.Random(seed)
+    player = Player(0, 0, 0, 0, height / 80, (0, 0, 0), height)
+
+    # 같은 corpus를 두 경로로 돌려서 고른 선이 하나라도 다르면 실패
+    corpus = [kernel_case(rng, rng.randint(1, lines), width, height) for _ in range(ticks)]
+    mismatches = 0
+    hits = 0
+    for prev, cur, speedy, case in corpus:
+        player.x, player.y = cur
+        player.speedy = speedy
+        scalar = player.first_hit_scalar(case, prev)
+        if scalar != player.first_hit_batch(np.array(case, dtype=float).reshape(-1, 4), prev):
+            mismatches += 1
+        hits += scalar is not None
+
+    timings = {}
+    for count in (1, 2, 4, 8, 12, 16, 32, 64, 128):
+        cases = [nearby_case(rng, count, width, height) for _ in range(200)]
+        # batch는 LineIndex.endpoints()처럼 이미 배열로 된 후보를 받음
+        arrays = [np.array(case, dtype=float).reshape(-1, 4) for _, _, _, case in cases]
+        for name, method, inputs in (("scalar", player.first_hit_scalar, [case for *_, case in cases]),
+                                     ("batch", player.first_hit_batch, arrays)):
+            start = time.perf_counter()
+            for (prev, cur, speedy, _), case in zip(cases, inputs):
+                player.x, player.y = cur
+                player.speedy = speedy
+                method(case, prev)
+            timings.setdefault(name, {})[count] = round((time.perf_counter() - start) / len(cases) * 1e6, 2)
+
+    return {"bench": "kernel", "cases": ticks, "max_lines": lines, "seed": seed, "hits": hits,
+            "mismatches": mismatches, "batch_min": BATCH_MIN, "us_per_call": timings,
+            "same_results": mismatches == 0,
+            "summary": f"{ticks} cases, {hits} hits, {mismatches} mismatches between scalar and batch"}
+
+
+MICRO = {
+    "collision": bench_collision,
+    "kernel": bench_kernel,
+}
@@ -0,0 +1,236 @@
+import math
+import importlib
+
+import pygame
+
+from bench.Harness import InputScript
+
+
+class Scenario:
+    """
+    A benchmarkable scene: how to build it, how to drive it and how to re-enter it.
+
+    `module`/`cls` are imported lazily so `python -m bench list` stays cheap.
+    `probe(scene)` returns the simulation state to compare in `python -m bench trace`.
+    """
+    def __init__(self, name, module, cls, script, reset=None, run=None, probe=None):
+        self.name = name
+        self.module = module
+        self.cls = cls
+        self._script = script
+        self._reset = reset
+        self._run = run
+        self._probe = probe
+
+    @property
+    def key(self):
+        return f"{self.module}:{self.cls}"
+
+    def build(self, width, height, show_fps=False):
+        scene_cls = getattr(importlib.import_module(self.module), self.cls)
+        if show_fps:
+            return scene_cls(width, height, show_fps=True)
+        return scene_cls(width, height)
+
+    def script(self, width, height, frames, rng):
+        return self._script(width, height, frames, rng)
+
+    def run(self, scene, screen):
+        if self._run is not None:
+            return self._run(scene, screen)
+        return scene.loop(screen)
+
+    def reset(self, scene):
+        if self._reset is not None:
+            self._reset(scene)
+
+    @property
+    def traceable(self):
+        return self._probe is not None
+
+    def probe(self, scene):
+        return self._probe(scene)
+
+
+### Scripts ###
+
+def lynez_script(width, height, frames, rng):
+    # 메뉴에서 탭해서 시작 -> 플레이 중엔 짧은 탭으로 선을 계속 그림 (게임오버 시 탭으로 메뉴 복귀)
+    script = InputScript((width // 2, height // 2))
+    frame = 20
+    while frame < frames:
+        pos = (rng.randint(int(width * 0.2), int(width * 0.8)), rng.randint(int(height * 0.4), int(height * 0.9)))
+        script.tap(frame, pos)
+        frame += rng.randint(30, 60)
+    return script
+
+
+def airship_script(width, height, frames, rng):
+    # 커서를 좌우로 흔들면서 주기적으로 탭 (시작/재시작 포함)
+    script = InputScript((width // 2, height * 3 // 4))
+    for frame in range(frames):
+        x = width / 2 + math.sin(frame / 45) * width * 0.35
+        script.move(frame, (x, height * 3 / 4))
+    frame = 20
+    while frame < frames:
+        script.tap(frame, (width / 2 + math.sin(frame / 45) * width * 0.35, height * 3 / 4))
+        frame += rng.randint(90, 150)
+    return script
+
+
+def avoidmine_script(width, height, frames, rng):
+    # 탭해서 시작한 뒤 커서를 화면 곳곳으로 옮겨 다님 (게임오버 시 탭으로 메뉴 복귀)
+    script = InputScript((width // 2, height // 2))
+    pos = (width // 2, height // 2)
+    frame = 20
+    while frame < frames:
+        script.tap(frame, pos)
+        for _ in range(rng.randint(3, 8)):
+            target = (rng.randint(0, width - 1), rng.randint(0, height - 1))
+            steps = rng.randint(10, 30)
+            for i in range(1, steps + 1):
+                t = i / steps
+                script.move(frame + i, (pos[0] + (target[0] - pos[0]) * t, pos[1] + (target[1] - pos[1]) * t))
+            pos = target
+            frame += steps
+        frame += rng.randint(20, 40)
+    return script
+
+
+def magiccat_script(width, height, frames, rng):
+    # 가로/세로 획을 번갈아 그어서 유령을 처치
+    script = InputScript((width // 2, height // 2))
+    frame = 30
+    horizontal = True
+    while frame < frames:
+        cx, cy = rng.randint(int(width * 0.3), int(width * 0.7)), rng.randint(int(height * 0.3), int(height * 0.7))
+        if horizontal:
+            script.drag(frame, (cx - width * 0.15, cy), (cx + width * 0.15, cy), frames=12)
+        else:
+            script.drag(frame, (cx, cy - height * 0.2), (cx, cy + height * 0.2), frames=12)
+        horizontal = not horizontal
+        frame += rng.randint(25, 45)
+    return script
+
+
+def playcore_script(width, height, frames, rng):
+    # 타일 위에서 좌우로 드래그만 함 (탭은 확인 모달을 띄우므로 사용하지 않음)
+    script = InputScript((width // 2, height // 2))
+    frame = 30
+    direction = -1
+    while frame < frames:
+        start = (width // 2, height // 2)
+        end = (width // 2 + direction * rng.randint(int(width * 0.1), int(width * 0.4)), height // 2)
+        script.drag(frame, start, end, frames=rng.randint(8, 24))
+        direction *= -1
+        frame += rng.randint(60, 120)
+    return script
+
+
+def howto_script(width, height, frames, rng):
+    # 드래그 + 방향키로 캐러셀을 돌리고, 가끔 중앙 카드를 열었다 닫음
+    script = InputScript((width // 2, height // 2))
+    frame = 30
+    while frame < frames:
+        action = rng.random()
+        if action < 0.5:
+            dx = rng.choice((-1, 1)) * rng.randint(int(width * 0.1), int(width * 0.3))
+            script.drag(frame, (width // 2, height // 2), (width // 2 + dx, height // 2), frames=rng.randint(8, 20))
+            frame += rng.randint(60, 100)
+        elif action < 0.8:
+            script.key(frame, rng.choice((pygame.K_RIGHT, pygame.K_LEFT)))
+            frame += rng.randint(40, 80)
+        else:
+            script.key(frame, pygame.K_RIGHT)
+            script.tap(frame + 60, (width // 2, height // 2), hold=2)
+            script.tap(frame + 180, (5, 5), hold=2)
+            frame += 260
+    return script
+
+
+### Resets ###
+
+def reset_lynez(scene):
+    scene.load_screen(0)
+
+
+def reset_airship(scene):
+    scene.load_screen(0)
+
+
+def reset_avoidmine(scene):
+    scene.load_screen(0)
+
+
+def reset_magiccat(scene):
+    scene.reset()
+
+
+def reset_playcore(scene):
+    scene.modal = None
+    scene.pending_select_title = None
+
+
+def reset_howto(scene):
+    scene.go_back_requested = False
+
+
+### Probes ###
+# 렌더링과 무관한 시뮬레이션 상태만 (숫자 리스트로) 뽑음 - 최적화 전후 비교용
+
+def _points(*points):
+    return [round(float(v), 6) for point in points for v in point]
+
+
+def _stripe_middles(background):
+    """줄무늬 앞/뒤 선이 터널 가운데 선과 만나는 점 (줄무늬가 Line 두 개였을 때의 middle_point와 같은 값)"""
+    if len(background.stripe_spawns) == 0:
+        return []
+    front, behind = background.stripe_positions()
+    points = []
+    for i in sorted(range(len(front)), key=lambda i: background.stripe_areas[i]):  # 옆면 순서대로 (안정 정렬)
+        number = int(background.stripe_areas[i])
+        middle = background.middle_lines[number]
+        for c in (float(front[i]), float(behind[i])):
+            if number % 2 == 0:
+                points.append(((c - middle.y_intercept) / middle.slope, c))
+            else:
+                points.append((c, middle.slope * c + middle.y_intercept))
+    return points
+
+
+def probe_airship(scene):
+    background = scene.background
+    stripes = _stripe_middles(background)
+    walls = [line.middle_point for wall in scene.walls for line in wall.edge.values()]
+    return {
+        "state": scene.state,
+        "score": scene.curr_score,
+        "crash": scene.airship.crash,
+        "airship": _points(scene.airship.location, (scene.airship.angle,)),
+        "walls": _points(*walls),
+        "stripes": _points(*stripes),
+        "signal": list(scene.signalLight.frame),
+        "overlay": round(float(scene.surface_alpha), 6),
+        "explosion": len(scene.airship.explosion),
+    }
+
+
+SCENARIOS = {
+    "lynez": Scenario("lynez", "scenes.Lynez", "LynezMainScreen", lynez_script, reset_lynez),
+    "airship": Scenario("airship", "scenes.Airship", "AirshipMainScreen", airship_script, reset_airship,
+                        probe=probe_airship),
+    "avoidmine": Scenario("avoidmine", "scenes.AvoidMine", "AvoidMineMainScreen", avoidmine_script, reset_avoidmine),
+    "magiccat": Scenario("magiccat", "scenes.MagicCatAcademy", "GameScreen", magiccat_script, reset_magiccat),
+    "playcore": Scenario("playcore", "PlayCore", "PlayCoreMenu", playcore_script, reset_playcore),
+    "howto": Scenario("howto", "scenes.howto", "PlayCoreMenu", howto_script, reset_howto),
+}
+
+
+def scenario_for_key(key):
+    """녹화 파일에 적힌 "module:Class"로 시나리오를 찾음 (목록에 없으면 스크립트 없이 새로 만듦)"""
+    for scenario in SCENARIOS.values():
+        if scenario.key == key:
+            return scenario
+    module, cls = key.split(":")
+    return Scenario(cls, module, cls, script=None)
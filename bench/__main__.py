@@ -0,0 +1,242 @@
+"""
+Headless frame-time benchmark for the PlayCore scenes.
+
+    python -m bench list
+    python -m bench run lynez --frames 600 --seed 0
+    python -m bench run all --out bench.json
+    python -m bench record lynez --out hitch.pcrp      (opens a window, play until the scene exits)
+    python -m bench run --replay hitch.pcrp
+    python -m bench trace airship --out before.json      (per-frame simulation state)
+    python -m bench trace airship --compare before.json  (exit 1 at the first differing frame)
+    python -m bench check                                (compare against the traces in bench/references)
+    python -m bench check --update                       (rewrite them after an intended simulation change)
+    python -m bench micro collision --lines 5000         (one hot function, no scene)
+
+Run from the repository root (assets are loaded with relative paths).
+"""
+import io
+import sys
+import gzip
+import json
+import argparse
+
+from bench.Harness import run_scenario, record_scenario
+from bench.Scenarios import SCENARIOS, scenario_for_key
+from bench.Micro import MICRO
+from localLibraries.InputReplay import Recording
+
+
+def parse_size(text):
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+def cmd_list(args):
+    for name, scenario in SCENARIOS.items():
+        print(f"{name:10s} {scenario.module}.{scenario.cls}")
+
+
+def cmd_run(args):
+    if args.replay:
+        replay = Recording.load(args.replay)
+        scenario = scenario_for_key(replay.scene)
+        if args.scene is not None and SCENARIOS.get(args.scene) is not scenario:
+            sys.exit(f"{args.replay} was recorded on {replay.scene}, not {args.scene}")
+        scenarios = [scenario]
+    elif args.scene is None:
+        sys.exit("run: give a scene name or --replay FILE")
+    else:
+        replay = None
+        scenarios = list(SCENARIOS.values()) if args.scene == "all" else [SCENARIOS[args.scene]]
+
+    reports = []
+    for scenario in scenarios:
+        name = scenario.name
+        report = run_scenario(scenario, frames=args.frames, warmup=args.warmup,
+                              seed=args.seed, size=args.size, replay=replay, overlay=args.overlay)
+        reports.append(report)
+        print(f"{name}: frame p50 {report['phases']['frame']['p50']:.2f} ms, "
+              f"p99 {report['phases']['frame']['p99']:.2f} ms", file=sys.stderr)
+
+    out = reports[0] if len(reports) == 1 else reports
+    text = json.dumps(out, indent=2)
+    if args.out:
+        with open(args.out, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+def first_difference(expected, actual, tol):
+    """두 trace에서 처음으로 달라지는 (프레임, 키) - 숫자는 tol까지 같은 것으로 봄"""
+    def same(a, b):
+        if isinstance(a, list) and isinstance(b, list):
+            return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+        if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+            return abs(a - b) <= tol
+        return a == b
+
+    for frame, (want, got) in enumerate(zip(expected, actual)):
+        for key in want:
+            if not same(want[key], got.get(key)):
+                return frame, key
+    if len(expected) != len(actual):
+        return min(len(expected), len(actual)), "frames"
+    return None
+
+
+# python -m bench check이 확인하는 기준 trace: (trace 파일, 씬, 입력 recording 또는 None, seed, 프레임 수)
+# 시뮬레이션을 일부러 바꾸는 커밋은 check --update로 다시 만들어서 같이 커밋
+REFERENCES = (
+    ("bench/references/airship_60hz.trace.json.gz", None, "bench/references/airship_60hz.pcrp", None, 3000),
+    ("bench/references/airship_seed0.trace.json.gz", "airship", None, 0, 3600),
+)
+
+
+def open_trace(path, mode="rt"):
+    if not path.endswith(".gz"):
+        return open(path, mode, encoding="utf-8")
+    # mtime=0: 같은 trace면 바이트까지 같은 파일이 나오도록 (다시 만들어도 diff가 생기지 않음)
+    return io.TextIOWrapper(gzip.GzipFile(path, mode.replace("t", "b"), mtime=0), encoding="utf-8")
+
+
+def trace_scene(scene, replay_path, seed, frames, size=(1280, 720)):
+    if replay_path:
+        replay = Recording.load(replay_path)
+        scenario = scenario_for_key(replay.scene)
+    elif scene is None:
+        sys.exit("trace: give a scene name or --replay FILE")
+    else:
+        replay = None
+        scenario = SCENARIOS[scene]
+    if not scenario.traceable:
+        sys.exit(f"trace: {scenario.name} has no state probe")
+
+    report = run_scenario(scenario, frames=frames, warmup=0, seed=seed, size=size, replay=replay, trace=True)
+    return scenario.name, {key: report[key] for key in ("scene", "seed", "size", "trace")}
+
+
+def compare_trace(name, out, path, tol):
+    """달라진 곳이 있으면 설명 문자열, 같으면 None"""
+    with open_trace(path) as file:
+        expected = json.load(file)["trace"]
+    diff = first_difference(expected, out["trace"], tol)
+    if diff is None:
+        print(f"{name}: {len(out['trace'])} frames match {path}", file=sys.stderr)
+        return None
+    frame, key = diff
+    if key != "frames":
+        print(f"expected: {expected[frame][key]}\nactual:   {out['trace'][frame][key]}", file=sys.stderr)
+    return f"{name}: differs from {path} at frame {frame} ({key})"
+
+
+def write_trace(name, out, path):
+    with open_trace(path, "wt") as file:
+        json.dump(out, file)
+    print(f"{name}: {len(out['trace'])} frames -> {path}", file=sys.stderr)
+
+
+def cmd_trace(args):
+    name, out = trace_scene(args.scene, args.replay, args.seed, args.frames, args.size)
+    if args.out:
+        write_trace(name, out, args.out)
+    if args.compare:
+        failure = compare_trace(name, out, args.compare, args.tol)
+        if failure is not None:
+            sys.exit(failure)
+
+
+def cmd_check(args):
+    failures = []
+    for path, scene, replay_path, seed, frames in REFERENCES:
+        name, out = trace_scene(scene, replay_path, seed, frames)
+        if args.update:
+            write_trace(name, out, path)
+            continue
+        failure = compare_trace(name, out, path, args.tol)
+        if failure is not None:
+            failures.append(failure)
+    if failures:
+        sys.exit("\n".join(failures))
+
+
+def cmd_record(args):
+    recording = record_scenario(SCENARIOS[args.scene], args.out, seed=args.seed, size=args.size)
+    print(f"recorded {len(recording)} frames of {recording.scene} (seed {recording.seed}) -> {args.out}",
+          file=sys.stderr)
+
+
+def cmd_micro(args):
+    options = {name: value for name, value in (("lines", args.lines), ("ticks", args.ticks)) if value is not None}
+    report = MICRO[args.bench](seed=args.seed, size=args.size, **options)
+    print(f"{args.bench}: {report['summary']}", file=sys.stderr)
+    if not report["same_results"]:
+        print(f"{args.bench}: results differ from the reference path", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    if not report["same_results"]:
+        sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Headless frame-time benchmark")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_list = sub.add_parser("list", help="list available scenes")
+    p_list.set_defaults(func=cmd_list)
+
+    p_run = sub.add_parser("run", help="run a scene with scripted input")
+    p_run.add_argument("scene", nargs="?", choices=list(SCENARIOS) + ["all"])
+    p_run.add_argument("--frames", type=int, default=600, help="measured frames (default 600)")
+    p_run.add_argument("--warmup", type=int, default=60, help="frames run before measuring (default 60)")
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--size", type=parse_size, default=(1280, 720), help="WIDTHxHEIGHT (default 1280x720)")
+    p_run.add_argument("--out", help="write the JSON report here instead of stdout")
+    p_run.add_argument("--overlay", action="store_true", help="enable the frame profiler overlay (show_fps)")
+    p_run.add_argument("--replay", help="drive the scene from an input recording instead of the script")
+    p_run.set_defaults(func=cmd_run)
+
+    p_trace = sub.add_parser("trace", help="dump or compare a scene's per-frame simulation state")
+    p_trace.add_argument("scene", nargs="?", choices=[name for name, s in SCENARIOS.items() if s.traceable])
+    p_trace.add_argument("--frames", type=int, default=1800, help="frames to trace (default 1800)")
+    p_trace.add_argument("--seed", type=int, default=0)
+    p_trace.add_argument("--size", type=parse_size, default=(1280, 720), help="WIDTHxHEIGHT (default 1280x720)")
+    p_trace.add_argument("--replay", help="drive the scene from an input recording instead of the script")
+    p_trace.add_argument("--out", help="write the trace here")
+    p_trace.add_argument("--compare", help="trace file from an earlier --out to check against")
+    p_trace.add_argument("--tol", type=float, default=1e-6, help="allowed difference for numbers (default 1e-6)")
+    p_trace.set_defaults(func=cmd_trace)
+
+    p_check = sub.add_parser("check", help="compare the traceable scenes against the stored reference traces")
+    p_check.add_argument("--update", action="store_true", help="rewrite the references instead of comparing")
+    p_check.add_argument("--tol", type=float, default=1e-6, help="allowed difference for numbers (default 1e-6)")
+    p_check.set_defaults(func=cmd_check)
+
+    p_record = sub.add_parser("record", help="record a played session for later --replay")
+    p_record.add_argument("scene", choices=list(SCENARIOS))
+    p_record.add_argument("--out", required=True, help="recording file to write")
+    p_record.add_argument("--seed", type=int, default=None, help="RNG seed (random if omitted)")
+    p_record.add_argument("--size", type=parse_size, default=(1280, 720), help="WIDTHxHEIGHT (default 1280x720)")
+    p_record.set_defaults(func=cmd_record)
+
+    p_micro = sub.add_parser("micro", help="time one hot function outside of a scene")
+    p_micro.add_argument("bench", choices=list(MICRO))
+    p_micro.add_argument("--lines", type=int, help="collision: lines in the world (default 5000), "
+                                                  "kernel: most candidate lines per case (default 64)")
+    p_micro.add_argument("--ticks", type=int, help="checks to run (default 2000 / kernel 20000)")
+    p_micro.add_argument("--seed", type=int, default=0)
+    p_micro.add_argument("--size", type=parse_size, default=(1280, 720), help="WIDTHxHEIGHT (default 1280x720)")
+    p_micro.add_argument("--out", help="write the JSON report here instead of stdout")
+    p_micro.set_defaults(func=cmd_micro)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import threading
+from collections import OrderedDict
+
+import pygame
+
+
+class AssetManager:
+    """
+    Process-wide cache for images and fonts.
+
+    Every asset is decoded, flipped, scaled and converted once, then the same
+    Surface / Font object is handed out to every caller. Surfaces returned by
+    the manager are shared, so callers must never draw on them (copy first).
+
+    Image keys are (path, size, flip_x, flip_y, convert) where convert is one of
+    "alpha" (convert_alpha), "opaque" (convert) or None (raw decode).
+
+    Full-size sources are kept in an LRU of at most `source_budget` bytes so the
+    sizes, flips and source_size() lookups of one file share a single decode
+    without every large original staying in memory for good.
+    """
+
+    def __init__(self, source_budget=32 * 1024 * 1024):
+        self._images = {}
+        self._fonts = {}
+        self._source_sizes = {}
+        self._sources = OrderedDict()   # (path, convert) -> 원본 크기 Surface
+        self._source_bytes = 0
+        self.source_budget = source_budget
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------- Images ---------------------------------
+    def image(self, path, size=None, flip_x=False, flip_y=False, convert="alpha"):
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (path, size, bool(flip_x), bool(flip_y), convert)
+
+        surf = self._images.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        with self._lock:
+            surf = self._images.get(key)
+            if surf is not None:
+                self.hits += 1
+                return surf
+            self.misses += 1
+
+            if size is None and not (flip_x or flip_y):
+                surf = self._source(path, convert)
+            else:
+                surf = self._images.get((path, None, False, False, convert))
+                if surf is None:
+                    surf = self._source(path, convert)
+                if flip_x or flip_y:
+                    surf = pygame.transform.flip(surf, flip_x, flip_y)
+                if size is not None and size != surf.get_size():
+                    surf = pygame.transform.scale(surf, size)
+
+            self._images[key] = surf
+            return surf
+
+    def image_to_width(self, path, width, flip_x=False, flip_y=False, convert="alpha"):
+        """Scales the image to `width`, keeping the aspect ratio of the source file."""
+        src_w, src_h = self.source_size(path)
+        size = (int(width), int(width * (src_h / src_w)))
+        return self.image(path, size, flip_x, flip_y, convert)
+
+    def image_to_height(self, path, height, flip_x=False, flip_y=False, convert="alpha"):
+        """Scales the image to `height`, keeping the aspect ratio of the source file."""
+        src_w, src_h = self.source_size(path)
+        size = (int(height * (src_w / src_h)), int(height))
+        return self.image(path, size, flip_x, flip_y, convert)
+
+    def source_size(self, path):
+        size = self._source_sizes.get(path)
+        if size is None:
+            with self._lock:
+                # 크기만 보고 버리지 않고 원본 LRU에 남겨 둠 (바로 뒤의 image() 호출이 다시 디코드하지 않도록)
+                size = self._source(path, None).get_size()
+        return size
+
+    def _source(self, path, convert):
+        # 원본은 source_budget 안에서만 LRU로 유지 (4000x2000 같은 원본이 메모리를 계속 잡지 않도록)
+        key = (path, convert)
+        surf = self._sources.get(key)
+        if surf is not None:
+            self._sources.move_to_end(key)
+            return surf
+
+        raw = self._sources.get((path, None))
+        if raw is None:
+            raw = self._load(path)
+        surf = self._convert(raw, convert)
+
+        for k, v in (((path, None), raw), (key, surf)):
+            if k not in self._sources:
+                self._sources[k] = v
+                self._source_bytes += v.get_pitch() * v.get_height()
+        self._sources.move_to_end(key)
+        # 방금 쓴 것은 예산을 넘어도 남겨 둠 (바로 다음 크기/반전에서 또 씀)
+        while self._source_bytes > self.source_budget and len(self._sources) > 2:
+            _, old = self._sources.popitem(last=False)
+            self._source_bytes -= old.get_pitch() * old.get_height()
+        return surf
+
+    def _load(self, path):
+        surf = pygame.image.load(path)
+        self._source_sizes[path] = surf.get_size()
+        return surf
+
+    def _convert(self, surf, convert):
+        # convert()/convert_alpha() need a display mode; fall back to the raw decode without one
+        if convert is None or pygame.display.get_surface() is None:
+            return surf
+        if convert == "alpha":
+            return surf.convert_alpha()
+        if convert == "opaque":
+            return surf.convert()
+        raise ValueError(f"Unknown convert mode: {convert}")
+
+    # -------------------------------- Fonts ---------------------------------
+    def font(self, path, size):
+        key = (path, int(size))
+
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is not None:
+                self.hits += 1
+                return font
+            self.misses += 1
+
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(path, int(size))
+            self._fonts[key] = font
+            return font
+
+    # ------------------------------- Reports --------------------------------
+    def total_bytes(self):
+        total = 0
+        for surf in self._images.values():
+            total += surf.get_pitch() * surf.get_height()
+        return total
+
+    def report(self):
+        return {
+            "images": len(self._images),
+            "fonts": len(self._fonts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_bytes": self.total_bytes(),
+            "source_bytes": self._source_bytes,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._fonts.clear()
+            self._source_sizes.clear()
+            self._sources.clear()
+            self._source_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+assets = AssetManager()
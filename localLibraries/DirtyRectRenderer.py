@@ -0,0 +1,80 @@
+import os
+
+import pygame
+
+
+# PLAYCORE_DIRTY_RECTS=0 으로 끄면 항상 전체 flip (디버깅용)
+ENABLED = os.environ.get("PLAYCORE_DIRTY_RECTS", "1") != "0"
+
+
+class DirtyRectRenderer:
+    """
+    Opt-in replacement for pygame.display.flip() on mostly static screens.
+
+        renderer.mark(rect, ...)    # regions whose pixels changed this frame
+        renderer.mark_full()        # everything changed (scroll, state switch, ...)
+        renderer.present()          # instead of pygame.display.flip()
+
+    The scene still draws the whole frame; only the marked regions (plus the ones
+    marked last frame, so moved objects get erased) are pushed to the window.
+    When the dirty area is larger than `threshold` of the screen it falls back to
+    a full flip, and a frame with nothing marked uploads nothing.
+    """
+    def __init__(self, size, threshold=0.5, enabled=None):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.threshold = threshold
+        self.enabled = ENABLED if enabled is None else enabled
+
+        self.rects = []
+        self.prev_rects = []
+        self.full = True  # 첫 프레임은 항상 전체
+
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.idle_frames = 0
+
+    def mark(self, *rects):
+        for rect in rects:
+            if rect is None:
+                continue
+            rect = pygame.Rect(rect).clip(self.screen_rect)
+            if rect.w > 0 and rect.h > 0:
+                self.rects.append(rect)
+
+    def mark_full(self):
+        self.full = True
+
+    @staticmethod
+    def _merge(rects):
+        # 겹치는 사각형끼리 합쳐서 update 호출 수와 중복 영역을 줄임
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            i = 0
+            while i < len(merged):
+                if rect.colliderect(merged[i]):
+                    rect.union_ip(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+        return merged
+
+    def present(self):
+        rects = self._merge(self.rects + self.prev_rects)
+        area = sum(r.w * r.h for r in rects)
+
+        if not self.enabled or self.full or area > self.threshold * self.screen_rect.w * self.screen_rect.h:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            # 빈 리스트여도 호출 (벤치/리플레이가 display.update를 프레임 경계로 씀)
+            pygame.display.update(rects)
+            if rects:
+                self.partial_frames += 1
+            else:
+                self.idle_frames += 1
+
+        self.prev_rects = self.rects
+        self.rects = []
+        self.full = False
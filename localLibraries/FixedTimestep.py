@@ -0,0 +1,58 @@
+class FixedTimestep:
+    """
+    Accumulator that runs a simulation at a fixed rate inside a variable-rate render loop.
+
+        dt_ms = clock.tick(fps)
+        for _ in range(timestep.advance(dt_ms)):
+            tick()                          # always exactly timestep.step_ms of game time
+        render(timestep.alpha)              # 0..1 between the previous and the latest tick
+
+    If more than `max_steps` ticks are owed (a long hitch), the extra ones are dropped
+    instead of being caught up, so one slow frame can't snowball into the next.
+
+    Frame times within `snap_ms` of a whole number of ticks count as exactly that
+    many: Clock.tick() reports whole milliseconds (16, 17, 17, ... at 60 FPS), which
+    would otherwise give the odd frame with zero or two ticks. The rounding is not
+    thrown away: it adds up in `snap_error` and goes back into the accumulator
+    once it reaches half a tick, so game time keeps up with wall time (a display
+    that steadily delivers 17 ms frames gets an extra tick every 50 frames instead
+    of running 2% slow), while 16/17 jitter still gives exactly one tick a frame.
+    """
+    def __init__(self, rate=60, max_steps=5, snap_ms=1.0):
+        self.rate = rate
+        self.step_ms = 1000.0 / rate
+        self.max_steps = max_steps
+        self.snap_ms = snap_ms
+        self.accumulator = 0.0
+        self.snap_error = 0.0   # 스냅으로 반올림한 만큼 (틱 단위)
+        self.ticks = 0
+        self.dropped = 0
+
+    def advance(self, dt_ms):
+        # 누적은 틱 단위로 (ms로 나누면 50ms / 16.67ms 같은 딱 떨어지는 경우에 부동소수 오차로 한 틱이 빠짐)
+        owed = dt_ms / self.step_ms
+        whole = round(owed)
+        if whole >= 1 and abs(dt_ms - whole * self.step_ms) < self.snap_ms:
+            self.snap_error += owed - whole
+            owed = whole
+            if abs(self.snap_error) >= 0.5:
+                owed += self.snap_error
+                self.snap_error = 0.0
+        self.accumulator += owed
+        steps = int(self.accumulator)
+        if steps > self.max_steps:
+            self.dropped += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator %= 1
+        else:
+            self.accumulator -= steps
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator)
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.snap_error = 0.0
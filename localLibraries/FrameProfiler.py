@@ -0,0 +1,180 @@
+import time
+from collections import deque
+
+import pygame
+
+from localLibraries.AssetManager import assets
+
+
+PHASES = ("events", "update", "draw", "flip")
+
+PHASE_COLORS = {
+    "events": (240, 200, 80),
+    "update": (80, 150, 255),
+    "draw": (90, 220, 120),
+    "flip": (240, 90, 90),
+}
+
+_DRAW_FUNCS = ("line", "lines", "aaline", "aalines", "circle", "rect", "polygon", "arc", "ellipse")
+_draw_calls = [0]
+_draw_hooked = False
+
+
+def _hook_draw_calls():
+    """pygame.draw.* 호출 수를 세는 래퍼를 한 번만 설치 (프로파일러가 켜져 있을 때만)"""
+    global _draw_hooked
+    if _draw_hooked:
+        return
+    _draw_hooked = True
+
+    def counted(real):
+        def wrapped(*args, **kwargs):
+            _draw_calls[0] += 1
+            return real(*args, **kwargs)
+        return wrapped
+
+    for name in _DRAW_FUNCS:
+        setattr(pygame.draw, name, counted(getattr(pygame.draw, name)))
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timer with an on-screen overlay.
+
+        profiler.begin_frame()      # top of the loop
+        profiler.idle()             # right after clock.tick(), drops the sleep
+        profiler.mark("events")     # time since the previous mark goes to "events"
+        profiler.mark("update") / profiler.mark("draw")   (may repeat, it accumulates)
+        profiler.draw(screen, clock)
+        pygame.display.flip()
+        profiler.mark("flip")
+
+    With enabled=False every method is a no-op, so it can stay in the loops.
+    """
+    def __init__(self, enabled=True, history=240, pos=(10, 10), refresh=15):
+        self.enabled = enabled
+        if not enabled:
+            self.begin_frame = self.idle = self.mark = self.draw = _noop
+            return
+
+        _hook_draw_calls()
+
+        self.pos = pos
+        self.refresh = refresh
+        self.font = assets.font("data/fonts/SairaCondensed-Light.ttf", 16)
+        self.labels = {p: self.font.render(p, True, PHASE_COLORS[p]) for p in PHASES}
+
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.last = time.perf_counter()
+        self.frame_cnt = 0
+        self.draw_calls_start = _draw_calls[0]
+
+        # (end time, total ms, {phase: ms}, draw calls)
+        self.frames = deque(maxlen=history)
+
+        self.graph_w, self.graph_h = history, 60
+        self.graph_ms = 1000 / 30  # 그래프 높이 = 33.3ms
+        self.graph = pygame.Surface((self.graph_w, self.graph_h))
+        self.graph.fill((20, 20, 24))
+
+        self.panel = None
+        self.overlay_ms = deque(maxlen=60)
+
+    # ------------------------------ Timing ----------------------------------
+    def begin_frame(self):
+        now = time.perf_counter()
+        if self.frame_cnt > 0:
+            total = sum(self.current.values())
+            draw_calls = _draw_calls[0] - self.draw_calls_start
+            self.frames.append((now, total, self.current, draw_calls))
+            self._plot(total, self.current)
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.draw_calls_start = _draw_calls[0]
+        self.last = now
+        self.frame_cnt += 1
+
+    def idle(self):
+        self.last = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + (now - self.last) * 1000.0
+        self.last = now
+
+    # ------------------------------ Overlay ---------------------------------
+    def _plot(self, total, phases):
+        self.graph.scroll(-1, 0)
+        x = self.graph_w - 1
+        self.graph.fill((20, 20, 24), (x, 0, 1, self.graph_h))
+
+        scale = self.graph_h / self.graph_ms
+        y = self.graph_h
+        for phase in PHASES:
+            h = phases.get(phase, 0.0) * scale
+            if h <= 0:
+                continue
+            top = max(0, int(y - h))
+            self.graph.fill(PHASE_COLORS[phase], (x, top, 1, max(1, int(y) - top)))
+            y -= h
+            if y <= 0:
+                break
+
+        # 16.7ms 기준선
+        self.graph.set_at((x, int(self.graph_h - (1000 / 60) * scale)), (200, 200, 200))
+
+    def _build_panel(self, clock):
+        now = time.perf_counter()
+        recent = [f for f in self.frames if now - f[0] <= 1.0] or list(self.frames)[-1:]
+        if not recent:
+            return
+
+        n = len(recent)
+        worst = max(f[1] for f in recent)
+        avg_total = sum(f[1] for f in recent) / n
+        avg_phase = {p: sum(f[2].get(p, 0.0) for f in recent) / n for p in PHASES}
+        draw_calls = recent[-1][3]
+        fps = clock.get_fps() if clock is not None else 0.0
+
+        overlay = sum(self.overlay_ms) / len(self.overlay_ms) if self.overlay_ms else 0.0
+        head = self.font.render(
+            f"FPS {int(fps)}  {avg_total:.2f} ms  worst {worst:.2f} ms  {draw_calls} draws  overlay {overlay:.2f} ms",
+            True, (255, 255, 255))
+
+        line_h = self.font.get_linesize()
+        bar_max = 120
+        w = max(self.graph_w, 60 + bar_max + 60, head.get_width()) + 12
+        h = 6 + line_h + 4 + self.graph_h + 4 + line_h * len(PHASES) + 6
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        panel.blit(head, (6, 6))
+
+        y = 6 + line_h + 4 + self.graph_h + 4
+        for phase in PHASES:
+            ms = avg_phase[phase]
+            panel.blit(self.labels[phase], (6, y))
+            bar = min(bar_max, int(ms / (1000 / 60) * bar_max))
+            panel.fill(PHASE_COLORS[phase], (60, y + line_h // 3, max(1, bar), max(2, line_h // 3)))
+            panel.blit(self.font.render(f"{ms:.2f}", True, (255, 255, 255)), (60 + bar_max + 6, y))
+            y += line_h
+
+        self.panel = panel
+        self.graph_pos = (6, 6 + line_h + 4)
+
+    def draw(self, screen, clock=None):
+        # 오버레이 자체 비용은 페이즈에 넣지 않고 따로 표시
+        self.mark("draw")
+        if self.panel is None or self.frame_cnt % self.refresh == 0:
+            self._build_panel(clock)
+        rect = None
+        if self.panel is not None:
+            rect = screen.blit(self.panel, self.pos)
+            screen.blit(self.graph, (self.pos[0] + self.graph_pos[0], self.pos[1] + self.graph_pos[1]))
+        now = time.perf_counter()
+        self.overlay_ms.append((now - self.last) * 1000.0)
+        self.last = now
+        # 그린 영역 (DirtyRectRenderer.mark 용, 꺼져 있으면 None)
+        return rect
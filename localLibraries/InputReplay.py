@@ -0,0 +1,356 @@
+import time
+import zlib
+import struct
+import random
+
+import numpy as np
+import pygame
+
+
+MAGIC = b"PCRP"
+VERSION = 1
+
+### Binary layout ###
+# header : magic(4s) version(B) seed(Q) width(H) height(H) scene_len(H) scene(utf-8) frame_count(I)
+# body   : zlib( frame* )
+# frame  : dt_ms(H) mouse_x(h) mouse_y(h) buttons(B) n_events(H) event*
+# event  : code(B) payload (see EVENT_FORMATS)
+HEADER = struct.Struct("<4sBQHHH")
+FRAME = struct.Struct("<HhhBH")
+COUNT = struct.Struct("<I")
+
+EV_BUTTONDOWN, EV_BUTTONUP, EV_MOTION, EV_KEYDOWN, EV_KEYUP, EV_WHEEL = range(1, 7)
+
+EVENT_CODES = {
+    pygame.MOUSEBUTTONDOWN: EV_BUTTONDOWN,
+    pygame.MOUSEBUTTONUP: EV_BUTTONUP,
+    pygame.MOUSEMOTION: EV_MOTION,
+    pygame.KEYDOWN: EV_KEYDOWN,
+    pygame.KEYUP: EV_KEYUP,
+    pygame.MOUSEWHEEL: EV_WHEEL,
+}
+EVENT_TYPES = {code: ev_type for ev_type, code in EVENT_CODES.items()}
+
+EVENT_FORMATS = {
+    EV_BUTTONDOWN: struct.Struct("<hhB"),  # x, y, button
+    EV_BUTTONUP: struct.Struct("<hhB"),
+    EV_MOTION: struct.Struct("<hhhhB"),    # x, y, rel_x, rel_y, buttons
+    EV_KEYDOWN: struct.Struct("<iHHB"),    # key, mod, scancode, len(unicode) + utf-8 bytes
+    EV_KEYUP: struct.Struct("<iHHB"),
+    EV_WHEEL: struct.Struct("<hh"),        # x, y
+}
+
+
+class ReplayFinished(Exception):
+    """녹화된 프레임을 모두 재생하면 flip()에서 발생"""
+
+
+def seed_rngs(seed):
+    random.seed(seed)
+    np.random.seed(seed % (2 ** 32))
+
+
+def _buttons_mask(buttons):
+    mask = 0
+    for i, pressed in enumerate(buttons[:8]):
+        if pressed:
+            mask |= 1 << i
+    return mask
+
+
+def _mask_buttons(mask, num_buttons=3):
+    return tuple(bool(mask & (1 << i)) for i in range(num_buttons))
+
+
+def encode_event(event):
+    """pygame 이벤트 -> (code, fields). 재생에 필요 없는 이벤트(QUIT, 창 이벤트 등)는 None"""
+    code = EVENT_CODES.get(event.type)
+    if code in (EV_BUTTONDOWN, EV_BUTTONUP):
+        return code, (event.pos[0], event.pos[1], event.button)
+    if code == EV_MOTION:
+        return code, (event.pos[0], event.pos[1], event.rel[0], event.rel[1], _buttons_mask(event.buttons))
+    if code in (EV_KEYDOWN, EV_KEYUP):
+        return code, (event.key, event.mod, getattr(event, "scancode", 0), getattr(event, "unicode", ""))
+    if code == EV_WHEEL:
+        return code, (event.x, event.y)
+    return None
+
+
+def decode_event(code, fields):
+    ev_type = EVENT_TYPES[code]
+    if code in (EV_BUTTONDOWN, EV_BUTTONUP):
+        x, y, button = fields
+        return pygame.event.Event(ev_type, pos=(x, y), button=button)
+    if code == EV_MOTION:
+        x, y, rx, ry, mask = fields
+        return pygame.event.Event(ev_type, pos=(x, y), rel=(rx, ry), buttons=tuple(int(b) for b in _mask_buttons(mask)))
+    if code in (EV_KEYDOWN, EV_KEYUP):
+        key, mod, scancode, text = fields
+        return pygame.event.Event(ev_type, key=key, mod=mod, scancode=scancode, unicode=text)
+    x, y = fields
+    return pygame.event.Event(ev_type, x=x, y=y)
+
+
+class Recording:
+    """
+    In-memory recording: the RNG seed, what was recorded and one entry per frame.
+
+    frames[i] = (dt_ms, (mouse_x, mouse_y), buttons_mask, [(code, fields), ...])
+    """
+    def __init__(self, seed, scene="", size=(0, 0), frames=None):
+        self.seed = seed
+        self.scene = scene
+        self.size = size
+        self.frames = frames if frames is not None else []
+
+    def __len__(self):
+        return len(self.frames)
+
+    def save(self, path):
+        body = bytearray()
+        for dt, pos, buttons, events in self.frames:
+            body += FRAME.pack(min(dt, 0xFFFF), pos[0], pos[1], buttons, len(events))
+            for code, fields in events:
+                body += bytes((code,))
+                if code in (EV_KEYDOWN, EV_KEYUP):
+                    key, mod, scancode, text = fields
+                    raw = text.encode("utf-8")[:255]
+                    body += EVENT_FORMATS[code].pack(key, mod & 0xFFFF, scancode & 0xFFFF, len(raw)) + raw
+                else:
+                    body += EVENT_FORMATS[code].pack(*fields)
+
+        scene = self.scene.encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.seed, self.size[0], self.size[1], len(scene)))
+            file.write(scene)
+            file.write(COUNT.pack(len(self.frames)))
+            file.write(zlib.compress(bytes(body), 9))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, seed, width, height, scene_len = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an input recording")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported recording version {version}")
+        offset = HEADER.size
+        scene = data[offset:offset + scene_len].decode("utf-8")
+        offset += scene_len
+        (count,) = COUNT.unpack_from(data, offset)
+        body = zlib.decompress(data[offset + COUNT.size:])
+
+        frames = []
+        offset = 0
+        for _ in range(count):
+            dt, x, y, buttons, n_events = FRAME.unpack_from(body, offset)
+            offset += FRAME.size
+            events = []
+            for _ in range(n_events):
+                code = body[offset]
+                offset += 1
+                fmt = EVENT_FORMATS[code]
+                fields = fmt.unpack_from(body, offset)
+                offset += fmt.size
+                if code in (EV_KEYDOWN, EV_KEYUP):
+                    key, mod, scancode, text_len = fields
+                    fields = (key, mod, scancode, body[offset:offset + text_len].decode("utf-8"))
+                    offset += text_len
+                events.append((code, fields))
+            frames.append((dt, (x, y), buttons, events))
+
+        return cls(seed, scene, (width, height), frames)
+
+
+class _Patcher:
+    def __init__(self):
+        self._saved = []
+
+    def _set(self, owner, name, value):
+        self._saved.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, value)
+
+    def _restore(self):
+        for owner, name, value in reversed(self._saved):
+            setattr(owner, name, value)
+        self._saved.clear()
+
+
+class InputRecorder(_Patcher):
+    """
+    Records every frame's input while active.
+
+        with InputRecorder("run.pcrp", scene="scenes.Lynez:LynezMainScreen", size=(w, h)):
+            scene = LynezMainScreen(w, h)
+            scene.loop(screen)
+
+    Seeds random / np.random on entry (build the scene inside the block), samples
+    the mouse once per frame and makes get_ticks() follow the recorded clock so
+    the replay sees exactly the same values. The file is written on exit, also
+    when the loop leaves through sys.exit().
+    """
+    def __init__(self, path, seed=None, scene="", size=(0, 0)):
+        super().__init__()
+        self.path = path
+        if seed is None:
+            seed = time.time_ns() & 0xFFFFFFFF
+        self.recording = Recording(seed, scene, size)
+
+        self._dt = 0
+        self._ticks = 0
+        self._events = []
+        self._pos = (0, 0)
+        self._buttons = 0
+
+    def _sample_mouse(self, get_pos, get_pressed):
+        self._pos = tuple(get_pos())
+        self._buttons = _buttons_mask(get_pressed())
+
+    def _end_frame(self):
+        self.recording.frames.append((self._dt, self._pos, self._buttons, self._events))
+        self._dt = 0
+        self._events = []
+
+    def __enter__(self):
+        seed_rngs(self.recording.seed)
+
+        real_get = pygame.event.get
+        real_get_pos = pygame.mouse.get_pos
+        real_get_pressed = pygame.mouse.get_pressed
+        real_flip = pygame.display.flip
+        real_update = pygame.display.update
+        real_clock = pygame.time.Clock
+        recorder = self
+
+        class RecordingClock(real_clock):
+            def tick(self, framerate=0):
+                dt = super().tick(framerate)
+                recorder._dt += dt
+                recorder._ticks += dt
+                return dt
+
+        def event_get(*args, **kwargs):
+            events = real_get(*args, **kwargs)
+            for event in events:
+                encoded = encode_event(event)
+                if encoded is not None:
+                    recorder._events.append(encoded)
+            return events
+
+        def present(real):
+            def wrapped(*args, **kwargs):
+                r = real(*args, **kwargs)
+                recorder._end_frame()
+                recorder._sample_mouse(real_get_pos, real_get_pressed)
+                return r
+            return wrapped
+
+        self._sample_mouse(real_get_pos, real_get_pressed)
+
+        self._set(pygame.time, "Clock", RecordingClock)
+        self._set(pygame.time, "get_ticks", lambda: recorder._ticks)
+        self._set(pygame.event, "get", event_get)
+        self._set(pygame.mouse, "get_pos", lambda: recorder._pos)
+        self._set(pygame.mouse, "get_pressed", lambda num_buttons=3: _mask_buttons(recorder._buttons, num_buttons))
+        self._set(pygame.display, "flip", present(real_flip))
+        self._set(pygame.display, "update", present(real_update))
+        return self
+
+    def __exit__(self, *exc):
+        self._restore()
+        if self._events or self._dt:
+            self._end_frame()
+        self.recording.save(self.path)
+        return False
+
+
+class InputReplayer(_Patcher):
+    """
+    Feeds a Recording back into a scene loop frame by frame.
+
+    Clock.tick() returns the recorded dt without sleeping (pass realtime=True to
+    also pace at the recorded speed) and flip() raises ReplayFinished once every
+    recorded frame has been presented. Build the scene inside the block so it
+    sees the recorded RNG seed.
+    """
+    def __init__(self, recording, realtime=False):
+        super().__init__()
+        if isinstance(recording, str):
+            recording = Recording.load(recording)
+        self.recording = recording
+        self.realtime = realtime
+
+        self.frame = 0
+        self._ticks = 0
+        self._delivered = False
+
+    def _current(self):
+        return self.recording.frames[min(self.frame, len(self.recording.frames) - 1)]
+
+    def __enter__(self):
+        if not self.recording.frames:
+            raise ReplayFinished
+        seed_rngs(self.recording.seed)
+
+        prev_get = pygame.event.get
+        prev_flip = pygame.display.flip
+        prev_update = pygame.display.update
+        real_clock = pygame.time.Clock
+        replayer = self
+
+        class ReplayClock:
+            def __init__(self):
+                self._time = 0
+                self._pacer = real_clock() if replayer.realtime else None
+
+            def tick(self, framerate=0):
+                if self._pacer is not None:
+                    self._pacer.tick(framerate)
+                self._time = replayer._current()[0]
+                replayer._ticks += self._time
+                return self._time
+
+            tick_busy_loop = tick
+
+            def get_time(self):
+                return self._time
+
+            def get_rawtime(self):
+                return self._time
+
+            def get_fps(self):
+                return 1000 / self._time if self._time else 0.0
+
+        def event_get(*args, **kwargs):
+            prev_get(*args, **kwargs)  # 실제 큐는 비워 둠 (창 이벤트가 쌓이지 않도록)
+            if replayer._delivered:
+                return []
+            replayer._delivered = True
+            return [decode_event(code, fields) for code, fields in replayer._current()[3]]
+
+        def present(prev):
+            def wrapped(*args, **kwargs):
+                r = prev(*args, **kwargs)
+                replayer.frame += 1
+                replayer._delivered = False
+                if replayer.frame >= len(replayer.recording.frames):
+                    raise ReplayFinished
+                return r
+            return wrapped
+
+        self._set(pygame.time, "Clock", ReplayClock)
+        self._set(pygame.time, "get_ticks", lambda: replayer._ticks)
+        self._set(pygame.time, "wait", lambda ms: int(ms))
+        self._set(pygame.time, "delay", lambda ms: int(ms))
+        self._set(pygame.event, "get", event_get)
+        self._set(pygame.mouse, "get_pos", lambda: replayer._current()[1])
+        self._set(pygame.mouse, "get_pressed", lambda num_buttons=3: _mask_buttons(replayer._current()[2], num_buttons))
+        self._set(pygame.display, "flip", present(prev_flip))
+        self._set(pygame.display, "update", present(prev_update))
+        return self
+
+    def __exit__(self, *exc):
+        self._restore()
+        return False
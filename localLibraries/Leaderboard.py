@@ -0,0 +1,291 @@
+import os
+import json
+import time
+import uuid
+import atexit
+import bisect
+import threading
+
+
+# 부팅마다 새로 만들어지는 id (같은 키오스크 세션의 판들을 묶어 볼 때 사용)
+SESSION = uuid.uuid4().hex[:12]
+
+# 게임마다 남겨 두는 최대 기록 수 (점수가 낮은 기록부터 정리됨)
+MAX_RUNS = 5000
+
+
+def rank_label(rank, count):
+    """게임오버 화면에 띄울 순위 문구"""
+    return f"Rank {rank} of {count}"
+
+
+class Run:
+    __slots__ = ("game", "score", "duration", "time", "session")
+
+    def __init__(self, game, score, duration=0.0, time=0.0, session=""):
+        self.game = game
+        self.score = score
+        self.duration = duration
+        self.time = time
+        self.session = session
+
+    def to_json(self):
+        return {"game": self.game, "score": self.score, "duration": round(self.duration, 3),
+                "time": round(self.time, 3), "session": self.session}
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data["game"], data["score"], data.get("duration", 0.0), data.get("time", 0.0), data.get("session", ""))
+
+
+class GameBoard:
+    """
+    One game's runs, kept sorted best-first.
+
+    `keys` holds -score in ascending order, parallel to `runs`, so rank and
+    insert position are a bisect: rank(score) = 1 + number of strictly higher
+    scores. Equal scores keep their arrival order.
+    """
+    def __init__(self):
+        self.keys = []
+        self.runs = []
+
+    def __len__(self):
+        return len(self.runs)
+
+    def rank(self, score):
+        return bisect.bisect_left(self.keys, -score) + 1
+
+    def add(self, run):
+        rank = self.rank(run.score)
+        i = bisect.bisect_right(self.keys, -run.score)
+        self.keys.insert(i, -run.score)
+        self.runs.insert(i, run)
+        return rank
+
+    def top(self, n):
+        return self.runs[:n]
+
+    def prune(self, keep):
+        removed = max(0, len(self.runs) - keep)
+        if removed:
+            del self.keys[keep:]
+            del self.runs[keep:]
+        return removed
+
+
+class Leaderboard:
+    """
+    Every finished run of every game, with indexed rank / top-N queries.
+
+        rank = leaderboard.record("Lynez", score, duration)   # rank of this run
+        leaderboard.rank("Lynez", score)                      # rank a score would get
+        leaderboard.top("Lynez", 10)                          # best runs first
+
+    Runs are stored as an append-only JSON-lines journal. New lines are written
+    by a background thread (append + fsync), so record() never touches the disk.
+    A torn last line from a power cut is skipped on load. If the journal cannot
+    be read at all, the session starts from what was read and only appends.
+
+    Each game keeps at most `max_runs` runs. When the journal holds twice as many
+    lines as live runs, it is compacted: rewritten from memory to a temp file and
+    os.replace()d over the old one.
+    """
+    def __init__(self, path="data/playdata/runs.jsonl", max_runs=MAX_RUNS):
+        self.path = path
+        self.max_runs = max_runs
+
+        self._boards = None
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._pending = []       # 아직 파일에 안 쓴 줄
+        self._compact = False
+        self._readable = True    # False면 journal 일부를 못 읽었으므로 압축(덮어쓰기) 금지
+        self._version = 0
+        self._written = 0
+        self._journal_lines = 0
+        self._writer = None
+
+    ### Loading ###
+
+    def load(self):
+        """journal을 읽어 인덱스를 만듦 (이미 만들어져 있으면 아무것도 안 함)"""
+        with self._lock:
+            if self._boards is None:
+                self._boards = self._read()
+        return self
+
+    def _read(self):
+        boards = {}
+        lines = 0
+        torn = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if not line.endswith("\n"):
+                        torn = True  # 마지막 줄에 줄바꿈이 없으면 다음 기록이 그 줄에 붙어버림
+                    try:
+                        run = Run.from_json(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        torn = True  # 전원이 나가면서 잘린 줄
+                        continue
+                    lines += 1
+                    board = boards.get(run.game)
+                    if board is None:
+                        board = boards[run.game] = GameBoard()
+                    board.keys.append(-run.score)
+                    board.runs.append(run)
+        except FileNotFoundError:
+            pass
+        except (OSError, UnicodeDecodeError) as e:
+            # 읽은 데까지만으로 시작하고, 새 기록은 덧붙이기만 함 (압축하면 못 읽은 기록이 사라짐)
+            print(f"[leaderboard] could not read {self.path}, not compacting it this session: {e}")
+            self._readable = False
+            torn = False
+
+        for board in boards.values():
+            order = sorted(range(len(board.runs)), key=board.keys.__getitem__)  # 안정 정렬 -> 동점은 먼저 온 순
+            board.keys = [board.keys[i] for i in order]
+            board.runs = [board.runs[i] for i in order]
+            board.prune(self.max_runs)
+
+        self._journal_lines = lines
+        if torn:
+            # 잘린 줄 뒤에 바로 덧붙이면 다음 기록까지 망가지므로 깨끗하게 다시 씀
+            self._compact = True
+            self._version += 1
+            self._start_writer()
+        return boards
+
+    def _board(self, game):
+        if self._boards is None:
+            self.load()
+        board = self._boards.get(game)
+        if board is None:
+            board = self._boards[game] = GameBoard()
+        return board
+
+    ### Queries ###
+
+    def rank(self, game, score):
+        return self._board(game).rank(score)
+
+    def top(self, game, n=10):
+        return self._board(game).top(n)
+
+    def count(self, game):
+        return len(self._board(game))
+
+    ### Recording ###
+
+    def record(self, game, score, duration=0.0):
+        """판 하나를 기록하고 그 판의 순위를 반환 (디스크 쓰기는 백그라운드)"""
+        run = Run(game, score, duration, time.time(), SESSION)
+        self.load()
+        with self._lock:
+            board = self._board(game)
+            rank = board.add(run)
+            board.prune(self.max_runs)
+
+            self._pending.append(json.dumps(run.to_json()) + "\n")
+            self._journal_lines += 1
+            if self._readable and self._journal_lines > 2 * max(1, sum(len(b) for b in self._boards.values())):
+                self._compact = True
+            self._version += 1
+            self._start_writer()
+            self._changed.notify_all()
+        return rank
+
+    def compact(self):
+        """journal을 현재 남아 있는 기록만으로 다시 씀"""
+        self.load()
+        with self._lock:
+            if not self._readable:
+                return
+            self._compact = True
+            self._version += 1
+            self._start_writer()
+            self._changed.notify_all()
+
+    def flush(self, timeout=2.0):
+        with self._lock:
+            target = self._version
+            return self._changed.wait_for(lambda: self._written >= target, timeout)
+
+    def _start_writer(self):
+        # _lock을 잡은 상태에서 호출됨
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="Leaderboard", daemon=True)
+            self._writer.start()
+            atexit.register(self.flush)
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                self._changed.wait_for(lambda: self._written < self._version)
+                version = self._version
+                path = self.path
+                compact = self._compact
+                if compact:
+                    # 목록만 복사하고 직렬화는 락 밖에서 (record()가 기다리지 않도록)
+                    runs = [run for board in self._boards.values() for run in board.runs]
+                else:
+                    text = "".join(self._pending)
+                self._pending.clear()
+                self._compact = False
+
+            if compact:
+                runs.sort(key=lambda run: run.time)
+                text = "".join(json.dumps(run.to_json()) + "\n" for run in runs)
+                lines = len(runs)
+
+            try:
+                if compact:
+                    self._rewrite(path, text)
+                else:
+                    self._append(path, text)
+            except OSError as e:
+                print(f"[leaderboard] could not write {path}: {e}")
+                with self._lock:
+                    # 못 쓴 내용은 다시 대기열로 (압축은 다음에 다시 시도)
+                    if compact:
+                        self._compact = True
+                    else:
+                        self._pending.insert(0, text)
+                time.sleep(1.0)
+                continue
+
+            with self._lock:
+                if compact:
+                    # 압축 중에 들어온 줄은 _pending에 남아 다음 바퀴에 덧붙음
+                    self._journal_lines = lines + len(self._pending)
+                self._written = version
+                self._changed.notify_all()
+
+    @staticmethod
+    def _append(path, text):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+
+    @staticmethod
+    def _rewrite(path, text):
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, path)
+        if hasattr(os, "O_DIRECTORY"):
+            fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+
+leaderboard = Leaderboard()
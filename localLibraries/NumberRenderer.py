@@ -0,0 +1,82 @@
+import pygame
+
+
+class GlyphAtlas:
+    """
+    Digits (and whole words like "Best ") rendered once for one font + color.
+
+    compose() lays them out side by side on a new surface instead of
+    rasterizing the string again. Digit advances in our fonts add up to exactly
+    font.size() of the whole number, so the result lines up with font.render().
+    Anything that isn't made of digits (a minus sign kerns against the digit
+    after it) is rendered whole instead.
+    """
+    DIGITS = "0123456789"
+
+    def __init__(self, font, color, antialias=True):
+        self.font = font
+        self.color = tuple(color)[:3]
+        self.antialias = antialias
+
+        self.glyphs = {c: self._render(c) for c in self.DIGITS}
+        self.words = {}
+        self.height = self.glyphs["0"].get_height()
+
+    def _render(self, text):
+        return self.font.render(text, self.antialias, self.color)
+
+    def word(self, text):
+        surf = self.words.get(text)
+        if surf is None:
+            surf = self.words[text] = self._render(text)
+        return surf
+
+    def compose(self, text, prefix=""):
+        if not text.isdigit() or not text.isascii():
+            return self._render(prefix + text)
+        pieces = [self.word(prefix)] if prefix else []
+        pieces += [self.glyphs[c] for c in text]
+
+        surf = pygame.Surface((sum(p.get_width() for p in pieces), self.height), pygame.SRCALPHA)
+        surf.fill(self.color + (0,))
+        # 안티앨리어싱 글리프는 알파만 그대로 옮겨야 가장자리가 어두워지지 않음 (투명 배경 위에 일반 blit하면 색이 섞임)
+        flags = pygame.BLEND_RGBA_MAX if self.antialias else 0
+        x = 0
+        for piece in pieces:
+            surf.blit(piece, (x, 0), special_flags=flags)
+            x += piece.get_width()
+        return surf
+
+
+_atlases = {}
+
+def glyph_atlas(font, color, antialias=True):
+    """폰트/색 조합마다 아틀라스 하나를 공유 (폰트는 AssetManager가 같은 객체를 돌려줌)"""
+    key = (font, tuple(color)[:3], antialias)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font, color, antialias)
+    return atlas
+
+
+class NumberRenderer:
+    """
+    One on-screen number (a score, a counter) with an optional fixed prefix.
+
+        self.score_text = NumberRenderer(self.h1, self.white)
+        surf = self.score_text.render(self.curr_score)   # same surface until the value changes
+
+    The composed surface is kept until the value changes, so a steady score
+    costs a single blit per frame.
+    """
+    def __init__(self, font, color, prefix="", antialias=True):
+        self.atlas = glyph_atlas(font, color, antialias)
+        self.prefix = prefix
+        self.value = None
+        self.surface = None
+
+    def render(self, value):
+        if self.surface is None or value != self.value:
+            self.value = value
+            self.surface = self.atlas.compose(str(value), self.prefix)
+        return self.surface
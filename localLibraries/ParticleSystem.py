@@ -0,0 +1,251 @@
+import numpy as np
+import pygame
+
+
+### Sprites ###
+# draw.circle은 중심/반지름을 정수로 잘라서 그리므로, 반지름별로 한 번 그려 둔 원을 blit해도 픽셀이 같음
+
+_sprites = {}
+
+def circle_sprite(color, radius):
+    key = (color, radius)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        colorkey = (0, 0, 0) if color[:3] != (0, 0, 0) else (255, 255, 255)
+        sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1))
+        sprite.fill(colorkey)
+        sprite.set_colorkey(colorkey, pygame.RLEACCEL)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        _sprites[key] = sprite
+    return sprite
+
+_tables = {}
+
+def sprite_table(color, max_radius):
+    """table[r] = 반지름 r인 원 (blit 목록을 만들 때 dict 조회 대신 인덱스로)"""
+    table = _tables.get(color)
+    if table is None:
+        table = _tables[color] = [None]
+    while len(table) <= max_radius:
+        table.append(circle_sprite(color, len(table)))
+    return table
+
+
+class ParticleSystem:
+    """
+    Same-colored circle particles stored as NumPy arrays (one slot per particle).
+
+    Each tick (k = ticks at 60Hz) every particle moves as
+        x    += vx * k,  then x += (target_x - x) * pull'   (pull = 0: no homing)
+        y    -= vy * k                                     (vy points up, as in the scenes)
+        vy   -= gravity * k
+        size -= shrink * k,  then size -= size * decay'
+    where pull' / decay' are the per-tick rates scaled to k ticks. A particle dies
+    once its size is <= min_size; the hole is filled by a survivor from the end
+    of the live range (swap-remove), so nothing is shifted.
+
+    draw() interpolates between the last two ticks and blits one cached circle
+    sprite per on-screen particle with Surface.blits(). The circle's center is
+    moved up-left by size * center_shift (the Lynez trail is drawn that way).
+    """
+    FIELDS = ("x", "y", "vx", "vy", "size", "shrink", "target_x", "prev_x", "prev_y", "prev_size")
+
+    def __init__(self, color, capacity=64, gravity=0.0, pull=0.0, decay=0.0, min_size=0.0, center_shift=0.0):
+        self.color = tuple(color)
+        self.gravity = gravity
+        self.pull = pull
+        self.decay = decay
+        self.min_size = min_size
+        self.center_shift = center_shift
+
+        self.count = 0
+        self.capacity = 0
+        self._grow(max(1, capacity))
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, capacity):
+        for name in self.FIELDS:
+            old = getattr(self, name, None)
+            new = np.zeros(capacity)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    ### Spawning ###
+
+    def emit(self, x, y, vx=0.0, vy=0.0, size=1.0, shrink=0.0, target_x=0.0):
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.size[i] = self.prev_size[i] = size
+        self.shrink[i] = shrink
+        self.target_x[i] = target_x
+        self.count += 1
+
+    def emit_many(self, x, y, vx=0.0, vy=0.0, size=1.0, shrink=0.0, target_x=0.0):
+        """배열(또는 스칼라)로 여러 개를 한 번에 추가"""
+        x = np.asarray(x, dtype=float)
+        n = x.size
+        start = self.count
+        if start + n > self.capacity:
+            capacity = self.capacity
+            while start + n > capacity:
+                capacity *= 2
+            self._grow(capacity)
+        end = start + n
+        self.x[start:end] = self.prev_x[start:end] = x
+        self.y[start:end] = self.prev_y[start:end] = y
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.size[start:end] = self.prev_size[start:end] = size
+        self.shrink[start:end] = shrink
+        self.target_x[start:end] = target_x
+        self.count = end
+
+    def clear(self):
+        self.count = 0
+
+    ### Simulation ###
+
+    def update(self, k=1):
+        n = self.count
+        if n == 0:
+            return
+        x, y, vy, size = self.x[:n], self.y[:n], self.vy[:n], self.size[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        self.prev_size[:n] = size
+
+        x += self.vx[:n] * k
+        if self.pull:
+            x += (self.target_x[:n] - x) * (1 - (1 - self.pull) ** k)
+        y -= vy * k
+        if self.gravity:
+            vy -= self.gravity * k
+        size -= self.shrink[:n] * k
+        if self.decay:
+            size -= size * (1 - (1 - self.decay) ** k)
+
+        alive = size > self.min_size
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            # 앞쪽 [0, live)의 빈자리를 뒤쪽 [live, n)의 생존자로 채움
+            holes = np.flatnonzero(~alive[:live])
+            movers = np.flatnonzero(alive[live:]) + live
+            for name in self.FIELDS:
+                array = getattr(self, name)
+                array[holes] = array[movers]
+            self.count = live
+
+    ### Rendering ###
+
+    def draw(self, screen, scrollx=0, scrolly=0, alpha=1, color=None):
+        n = self.count
+        if n == 0:
+            return
+        x, y, size = self.x[:n], self.y[:n], self.size[:n]
+        if alpha != 1:
+            x = self.prev_x[:n] + (x - self.prev_x[:n]) * alpha
+            y = self.prev_y[:n] + (y - self.prev_y[:n]) * alpha
+            size = self.prev_size[:n] + (size - self.prev_size[:n]) * alpha
+        if self.center_shift:
+            x = x - size * self.center_shift
+            y = y - size * self.center_shift
+
+        radius = size.astype(int)
+        # 정수로 자른 위치에서 스크롤을 빼고 다시 자름 (draw.circle과 같은 반올림)
+        left = np.trunc(np.trunc(x) - scrollx).astype(int) - radius
+        top = np.trunc(np.trunc(y) - scrolly).astype(int) - radius
+
+        # 반지름이 1 미만이거나 화면 밖이면 건너뜀
+        width, height = screen.get_size()
+        visible = (radius >= 1) & (left < width) & (top < height) & (left + 2 * radius >= 0) & (top + 2 * radius >= 0)
+        if not visible.all():
+            left, top, radius = left[visible], top[visible], radius[visible]
+            if len(radius) == 0:
+                return
+
+        table = sprite_table(self.color if color is None else tuple(color), int(radius.max()))
+        screen.blits(zip(map(table.__getitem__, radius.tolist()), zip(left.tolist(), top.tolist())), doreturn=False)
+
+
+class Burst:
+    """
+    One-shot radial burst of circle particles (an explosion).
+
+        explosion = Burst(colors, speed=(2, 6), lifetime=(30, 60), radius=(2, 5))
+        explosion.fire(x, y, 150)       # once, when it goes off
+        explosion.update(k)             # every tick afterwards
+        explosion.draw(screen, offset_x, offset_y)
+
+    fire() draws every particle's angle, speed, lifetime, radius and color
+    from np.random in one go (seeded by InputReplay, so replays repeat it)
+    into flat arrays; nothing exists before that. Particles fly in straight
+    lines and disappear once their lifetime (in 60Hz ticks) runs out. Like
+    the old per-object version, update() drops expired particles before
+    moving the rest, and draw() skips those whose lifetime is already <= 0.
+
+    draw() blits one cached circle sprite per particle with Surface.blits(),
+    in spawn order so overlapping colors stack the same way.
+    """
+    def __init__(self, colors, speed=(2, 6), lifetime=(30, 60), radius=(2, 5)):
+        self.colors = [tuple(color) for color in colors]
+        self.speed_range = speed
+        self.lifetime_range = lifetime
+        self.radius_range = radius
+
+        # sprites[색 번호 * (최대 반지름 + 1) + 반지름]
+        stride = radius[1] + 1
+        self.stride = stride
+        self.sprites = [sprite for color in self.colors for sprite in sprite_table(color, radius[1])[:stride]]
+
+        self.fired = False
+        self.clear()
+
+    def __len__(self):
+        return len(self.x)
+
+    def clear(self):
+        self.x = self.y = self.vx = self.vy = self.lifetime = np.zeros(0)
+        self.radius = self.sprite = np.zeros(0, dtype=int)
+
+    def fire(self, x, y, number):
+        angle = np.random.uniform(0, 2 * np.pi, number)
+        speed = np.random.uniform(*self.speed_range, number)
+        self.x = np.full(number, float(x))
+        self.y = np.full(number, float(y))
+        self.vx = np.cos(angle) * speed
+        self.vy = np.sin(angle) * speed
+        self.lifetime = np.random.randint(self.lifetime_range[0], self.lifetime_range[1] + 1, number).astype(float)
+        self.radius = np.random.randint(self.radius_range[0], self.radius_range[1] + 1, number)
+        self.sprite = np.random.randint(0, len(self.colors), number) * self.stride + self.radius
+        self.fired = True
+
+    def update(self, k=1):
+        alive = self.lifetime > 0
+        if not alive.all():
+            self.x, self.y, self.vx, self.vy, self.lifetime, self.radius, self.sprite = (
+                array[alive] for array in (self.x, self.y, self.vx, self.vy, self.lifetime, self.radius, self.sprite))
+        self.x += self.vx * k
+        self.y += self.vy * k
+        self.lifetime -= k
+
+    def draw(self, screen, offset_x=0, offset_y=0):
+        if len(self.x) == 0:
+            return
+        alive = self.lifetime > 0
+        x, y, radius, sprite = self.x, self.y, self.radius, self.sprite
+        if not alive.all():
+            x, y, radius, sprite = x[alive], y[alive], radius[alive], sprite[alive]
+
+        # draw.circle에 int(x + offset)으로 넘기던 것과 같은 자리
+        left = (x + offset_x).astype(int) - radius
+        top = (y + offset_y).astype(int) - radius
+        screen.blits(zip(map(self.sprites.__getitem__, sprite.tolist()), zip(left.tolist(), top.tolist())), doreturn=False)
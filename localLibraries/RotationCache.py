@@ -0,0 +1,71 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class RotationCache:
+    """
+    Rotated copies of one image, and their collision masks, at angles rounded
+    to the nearest `step` degrees.
+
+        rotations = rotation_cache(image, 0.5)
+        image, mask = rotations.get(angle)
+
+    A rotation is made the first time its angle is asked for and kept in an
+    LRU of at most `capacity` entries (a 400x200 sprite turned by 80 degrees is
+    ~450KB, so a full table of every step is not kept). preload() fills a range
+    of angles up front, e.g. while a scene loads.
+
+    step = 0 turns rounding off: every call rotates by the exact angle and
+    nothing is cached.
+    """
+    def __init__(self, image, step=0.5, capacity=64):
+        self.image = image
+        self.step = step
+        self.capacity = capacity
+        self.entries = OrderedDict()    # 각도 번호 -> (image, mask)
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _rotate(self, angle):
+        image = pygame.transform.rotate(self.image, angle)
+        return image, pygame.mask.from_surface(image)
+
+    def get(self, angle):
+        if not self.step:
+            return self._rotate(angle)
+
+        index = round(angle / self.step)
+        entry = self.entries.get(index)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(index)
+            return entry
+
+        self.misses += 1
+        entry = self.entries[index] = self._rotate(index * self.step)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return entry
+
+    def preload(self, low, high):
+        """low~high도 사이의 각도를 미리 만들어 둠 (capacity를 넘는 만큼은 오래된 것부터 빠짐)"""
+        if not self.step:
+            return
+        for index in range(round(low / self.step), round(high / self.step) + 1):
+            self.get(index * self.step)
+
+
+_caches = {}
+
+def rotation_cache(image, step=0.5, capacity=64):
+    """같은 이미지를 쓰는 객체끼리 공유 (AssetManager가 같은 Surface를 돌려주므로 판이 바뀌어도 유지됨)"""
+    key = (image, step)
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = RotationCache(image, step, capacity)
+    return cache
@@ -0,0 +1,211 @@
+import os
+import json
+import time
+import atexit
+import threading
+
+
+# 예전에 게임마다 따로 쓰던 data/<Game>/playdata/saves.txt (첫 줄 = 최고 점수)
+LEGACY_GAMES = ("Lynez", "Airship", "AvoidMine", "MagicCatAcademy")
+
+
+class SaveStore:
+    """
+    Save data for every game in one JSON snapshot, read once into memory.
+
+        saves.get("Lynez", "best", 0)
+        saves.put("Lynez", "best", 1234)      # returns immediately
+        saves.update_best("Lynez", score)     # -> the best score including this one
+
+    put() only changes the in-memory copy and wakes a background writer. The
+    writer dumps the whole snapshot to a temp file, fsyncs it and os.replace()s
+    it over the real file, so on disk there is always one complete snapshot, old
+    or new. Puts that arrive while a write is running are coalesced into the next
+    write. flush() waits for the writer and runs at exit, so leaving through
+    sys.exit() still saves the last score.
+
+    If there is no snapshot yet, the legacy per-game saves.txt best scores are
+    migrated in. A snapshot that doesn't parse is moved to <path>.corrupt (and
+    logged) before migrating. One that exists but can't be read (permissions,
+    a lock held by another process) is never written over: the store keeps
+    puts in memory, retries the read on the next get()/put(), and only starts
+    writing once it has loaded the file and re-applied those puts on top.
+    """
+    VERSION = 1
+
+    def __init__(self, path="data/playdata/saves.json", legacy_root="data"):
+        self.path = path
+        self.legacy_root = legacy_root
+
+        self._data = None
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._version = 0   # put()으로 바뀐 횟수
+        self._written = 0   # 디스크에 반영된 버전
+        self._writer = None
+        self._readable = True   # False: 스냅샷이 있는데 못 읽음 -> 읽힐 때까지 디스크에 쓰지 않음
+        self._pending = []      # 못 읽는 동안의 put (game, key, value, combine)
+
+        self.writes = 0
+        self.errors = 0
+
+    ### Reading ###
+
+    def load(self):
+        """스냅샷을 읽어 캐시에 올림 (이미 올라와 있으면 아무것도 안 함)"""
+        with self._lock:
+            self._load_locked()
+        return self
+
+    def _load_locked(self):
+        if self._data is not None and self._readable:
+            return
+        games = self._read()
+        if games is None:
+            self._readable = False
+            if self._data is None:
+                self._data = {}
+            return
+
+        self._readable = True
+        self._data = games
+        if self._pending:
+            # 못 읽는 동안 바뀐 값을 실제 스냅샷 위에 다시 적용한 뒤에야 씀
+            for game, key, value, combine in self._pending:
+                self._apply(game, key, value, combine)
+            self._pending = []
+            self._version += 1
+            self._start_writer()
+            self._changed.notify_all()
+
+    def _read(self):
+        """게임별 데이터 dict, 파일이 있는데 읽을 수 없으면 None"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)["games"]
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.errors += 1
+            print(f"[saves] could not read {self.path}, not writing until it can be read: {e}")
+            return None
+        except (ValueError, KeyError, TypeError):
+            # 깨진 파일은 지우지 않고 옆에 치워 둔 뒤 옛 세이브에서 다시 시작
+            self.errors += 1
+            try:
+                os.replace(self.path, self.path + ".corrupt")
+                print(f"[saves] {self.path} is corrupt, moved to {self.path}.corrupt; best scores restart from the legacy saves")
+            except OSError as e:
+                print(f"[saves] {self.path} is corrupt and could not be moved aside: {e}")
+
+        games = self._migrate()
+        if games:
+            self._version += 1
+            self._start_writer()
+        return games
+
+    def _migrate(self):
+        games = {}
+        for game in LEGACY_GAMES:
+            path = os.path.join(self.legacy_root, game, "playdata", "saves.txt")
+            try:
+                with open(path, "r") as file:
+                    games[game] = {"best": int(file.read().split()[0])}
+            except (OSError, ValueError, IndexError):
+                continue
+        return games
+
+    def get(self, game, key, default=None):
+        if self._data is None or not self._readable:
+            self.load()
+        return self._data.get(game, {}).get(key, default)
+
+    ### Writing ###
+
+    def put(self, game, key, value):
+        self._put(game, key, value)
+
+    def update_best(self, game, score):
+        return self._put(game, "best", score, max)
+
+    def _put(self, game, key, value, combine=None):
+        """combine(기존 값, 새 값) -> 저장할 값 (None이면 덮어씀). 저장된 값을 돌려줌"""
+        with self._lock:
+            self._load_locked()
+            if not self._readable:
+                self._pending.append((game, key, value, combine))
+                return self._apply(game, key, value, combine)
+
+            values = self._data.get(game, {})
+            had, old = key in values, values.get(key)
+            new = self._apply(game, key, value, combine)
+            if had and old == new:
+                return new
+            self._version += 1
+            self._start_writer()
+            self._changed.notify_all()
+            return new
+
+    def _apply(self, game, key, value, combine):
+        values = self._data.setdefault(game, {})
+        if combine is not None and key in values:
+            value = combine(values[key], value)
+        values[key] = value
+        return value
+
+    def flush(self, timeout=2.0):
+        """지금까지의 put()이 디스크에 쓰일 때까지 대기 (timeout 안에 못 쓰면 False)"""
+        with self._lock:
+            target = self._version
+            return self._changed.wait_for(lambda: self._written >= target, timeout)
+
+    def _start_writer(self):
+        # _lock을 잡은 상태에서 호출됨
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="SaveStore", daemon=True)
+            self._writer.start()
+            atexit.register(self.flush)
+
+    def _write_loop(self):
+        while True:
+            with self._lock:
+                self._changed.wait_for(lambda: self._written < self._version)
+                version = self._version
+                path = self.path
+                text = json.dumps({"version": self.VERSION, "games": self._data}, indent=1, sort_keys=True)
+
+            try:
+                self._write(path, text)
+            except OSError as e:
+                self.errors += 1
+                print(f"[saves] could not write {path}: {e}")
+                time.sleep(1.0)  # 다음 바퀴에 다시 시도
+                continue
+
+            with self._lock:
+                self.writes += 1
+                self._written = version
+                self._changed.notify_all()
+
+    @staticmethod
+    def _write(path, text):
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, path)
+
+        if hasattr(os, "O_DIRECTORY"):
+            # rename 자체도 전원이 나가기 전에 디스크에 남도록 폴더도 fsync (POSIX만)
+            fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+
+saves = SaveStore()
@@ -0,0 +1,97 @@
+import time
+import importlib
+import threading
+
+
+class SceneEntry:
+    def __init__(self, name, module, cls, wait_ms=500, fade_ms=1000, record=False):
+        self.name = name
+        self.module = module
+        self.cls = cls
+        self.wait_ms = wait_ms
+        self.fade_ms = fade_ms
+        self.record = record
+
+    @property
+    def key(self):
+        return f"{self.module}:{self.cls}"
+
+
+class SceneRegistry:
+    """
+    name -> (module path, class) table for the scene switcher.
+
+    Modules are imported the first time a scene is requested, so startup only
+    pays for the menu; the heavy game modules (NumPy, big sprite sheets) load
+    when their tile is confirmed.
+    """
+    def __init__(self):
+        self.entries = {}
+        self._classes = {}
+
+    def register(self, name, module, cls, **options):
+        self.entries[name] = SceneEntry(name, module, cls, **options)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def entry(self, name):
+        return self.entries[name]
+
+    def scene_class(self, name):
+        scene_cls = self._classes.get(name)
+        if scene_cls is None:
+            entry = self.entries[name]
+            scene_cls = getattr(importlib.import_module(entry.module), entry.cls)
+            self._classes[name] = scene_cls
+        return scene_cls
+
+    def preload(self, name, width, height):
+        # 모듈에 preload(width, height)가 있으면 호출해서 에셋 캐시를 미리 채움
+        self.scene_class(name)
+        preload = getattr(importlib.import_module(self.entries[name].module), "preload", None)
+        if preload is not None:
+            preload(width, height)
+
+    def create_async(self, name, width, height, **kwargs):
+        loader = SceneLoader(self, name, width, height, **kwargs)
+        loader.start()
+        return loader
+
+    def create(self, name, width, height, **kwargs):
+        return self.scene_class(name)(width, height, **kwargs)
+
+
+class SceneLoader(threading.Thread):
+    """
+    Imports, preloads and constructs a scene on a worker thread while the
+    previous scene waits and fades out. wait() joins it, re-raises anything it
+    threw and returns the constructed scene.
+    """
+    def __init__(self, registry, name, width, height, **kwargs):
+        super().__init__(name=f"SceneLoader-{name}", daemon=True)
+        self.registry = registry
+        self.scene_name = name
+        self.size = (width, height)
+        self.kwargs = kwargs
+        self.scene = None
+        self.error = None
+        self.load_ms = 0.0
+        self.blocked_ms = 0.0
+
+    def run(self):
+        t0 = time.perf_counter()
+        try:
+            self.registry.preload(self.scene_name, *self.size)
+            self.scene = self.registry.create(self.scene_name, *self.size, **self.kwargs)
+        except BaseException as e:
+            self.error = e
+        self.load_ms = (time.perf_counter() - t0) * 1000
+
+    def wait(self):
+        t0 = time.perf_counter()
+        self.join()
+        self.blocked_ms = (time.perf_counter() - t0) * 1000
+        if self.error is not None:
+            raise self.error
+        return self.scene
@@ -0,0 +1,72 @@
+import numpy as np
+import pygame
+
+
+class Trail:
+    """
+    The last `length` positions of something that moves (a player, a pointer),
+    drawn as one polyline.
+
+        trail = Trail(50)
+        trail.append(x, y)                                   # every tick
+        trail.draw(screen, color, scrollx, scrolly, head=(x, y))
+
+    Points live in a preallocated (length, 2) ring buffer: append() overwrites
+    the oldest point once it is full, and draw() shifts every point by the
+    scroll in one array op and hands the whole line to a single
+    pygame.draw.lines() call (same pixels as one draw.line per segment).
+
+    With fade > 0 the line is split into `fade` parts from oldest to newest
+    whose colors go from `fade_to` (usually the background) to `color`, one
+    draw.lines() call per part.
+    """
+    def __init__(self, length, fade=0):
+        self.length = max(1, int(length))
+        self.fade = fade
+        self.points = np.zeros((self.length, 2))
+        self.start = 0      # 가장 오래된 점의 위치
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, x, y):
+        i = (self.start + self.count) % self.length
+        self.points[i] = x, y
+        if self.count < self.length:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.length
+
+    def clear(self):
+        self.start = 0
+        self.count = 0
+
+    def ordered(self):
+        """오래된 점부터 순서대로 (count, 2) 배열"""
+        end = self.start + self.count
+        if end <= self.length:
+            return self.points[self.start:end]
+        return np.concatenate((self.points[self.start:], self.points[:end - self.length]))
+
+    def draw(self, screen, color, scrollx=0, scrolly=0, width=1, head=None, fade_to=None):
+        """head: 버퍼 뒤에 이어 그릴 현재 위치 (보간된 위치 등)"""
+        points = (self.ordered() - (scrollx, scrolly)).tolist()
+        if head is not None:
+            points.append([head[0] - scrollx, head[1] - scrolly])
+        if len(points) < 2:
+            return
+
+        if not self.fade or fade_to is None:
+            pygame.draw.lines(screen, color, False, points, width)
+            return
+
+        # 구간 경계의 점은 양쪽 구간에 모두 넣어야 선이 끊기지 않음
+        segments = len(points) - 1
+        parts = min(self.fade, segments)
+        for part in range(parts):
+            a = part * segments // parts
+            b = (part + 1) * segments // parts
+            t = (part + 1) / parts
+            mixed = [round(f + (c - f) * t) for c, f in zip(color, fade_to)]
+            pygame.draw.lines(screen, mixed, False, points[a:b + 1], width)
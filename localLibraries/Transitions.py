@@ -0,0 +1,231 @@
+import sys
+
+import pygame
+
+from localLibraries.DirtyRectRenderer import DirtyRectRenderer
+
+
+### Easing ###
+
+def linear(t):
+    return t
+
+def ease_in(t):
+    return t * t
+
+def ease_out(t):
+    return 1 - (1 - t) * (1 - t)
+
+def ease_in_out(t):
+    return t * t * (3 - 2 * t)
+
+EASINGS = {
+    "linear": linear,
+    "ease_in": ease_in,
+    "ease_out": ease_out,
+    "ease_in_out": ease_in_out,
+}
+
+
+### Shared surfaces ###
+# 전환마다 화면 크기 Surface를 새로 만들지 않도록 크기별로 한 장씩만 만들어 재사용
+
+_overlays = {}
+_snapshots = {}
+_crossfade_snapshots = {}  # Crossfade는 set_alpha를 바꾸므로 Hold/Fade와 버퍼를 나눔
+
+def overlay_surface(size, color=(0, 0, 0)):
+    key = (size, color)
+    surf = _overlays.get(key)
+    if surf is None:
+        surf = pygame.Surface(size)
+        surf.fill(color)
+        _overlays[key] = surf
+    return surf
+
+def snapshot_surface(source, pool=_snapshots):
+    """source를 크기별 공용 버퍼에 복사해서 반환 (set_alpha로 원본을 건드리지 않기 위함)"""
+    size = source.get_size()
+    surf = pool.get(size)
+    if surf is None:
+        surf = pygame.Surface(size)
+        pool[size] = surf
+    surf.set_alpha(None)
+    surf.blit(source, (0, 0))
+    return surf
+
+def _frozen(surface):
+    # 씬들이 넘겨주는 건 보통 디스플레이 Surface 자체 -> 매 프레임 덮어쓰이므로 한 번 복사해 둠
+    if surface is pygame.display.get_surface():
+        return snapshot_surface(surface)
+    return surface
+
+
+### Transitions ###
+
+class Transition:
+    """
+    Base class: advance with update(dt_ms), render with draw(screen).
+    Scenes can drive one from their own loop, or hand it to run_transition().
+    """
+    def __init__(self, duration=1000, easing="linear"):
+        self.duration = max(0, duration)
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.elapsed = 0
+
+    @property
+    def done(self):
+        return self.elapsed >= self.duration
+
+    @property
+    def progress(self):
+        if self.duration == 0:
+            return 1.0
+        return self.easing(min(1.0, self.elapsed / self.duration))
+
+    def update(self, dt):
+        self.elapsed = min(self.duration, self.elapsed + dt)
+
+    def changed(self):
+        """지난 draw() 이후 화면이 달라지는지 (False면 run_transition이 다시 그리지 않음)"""
+        return True
+
+    def draw(self, screen):
+        pass
+
+
+class Hold(Transition):
+    """surface를 그대로 보여주며 대기 (pygame.time.wait 대신 - 이벤트 처리가 계속됨)"""
+    def __init__(self, surface, duration=1000):
+        super().__init__(duration)
+        self.surface = _frozen(surface)
+        self.drawn = False
+
+    def changed(self):
+        return not self.drawn
+
+    def draw(self, screen):
+        screen.blit(self.surface, (0, 0))
+        self.drawn = True
+
+
+class Fade(Transition):
+    """surface 위에 color 오버레이의 알파를 start_alpha -> end_alpha로 변화"""
+    def __init__(self, surface, duration=1000, start_alpha=0, end_alpha=255, easing="linear", color=(0, 0, 0)):
+        super().__init__(duration, easing)
+        self.surface = _frozen(surface)
+        self.start_alpha = start_alpha
+        self.end_alpha = end_alpha
+        self.overlay = overlay_surface(surface.get_size(), color)
+        self.drawn_alpha = None
+
+    def alpha(self):
+        return int(self.start_alpha + (self.end_alpha - self.start_alpha) * self.progress)
+
+    def changed(self):
+        return self.alpha() != self.drawn_alpha
+
+    def draw(self, screen):
+        screen.blit(self.surface, (0, 0))
+        alpha = self.drawn_alpha = self.alpha()
+        if alpha > 0:
+            self.overlay.set_alpha(alpha)
+            screen.blit(self.overlay, (0, 0))
+
+
+class FadeOut(Fade):
+    def __init__(self, surface, duration=1000, easing="linear", color=(0, 0, 0)):
+        super().__init__(surface, duration, 0, 255, easing, color)
+
+
+class FadeIn(Fade):
+    def __init__(self, surface, duration=1000, easing="linear", color=(0, 0, 0)):
+        super().__init__(surface, duration, 255, 0, easing, color)
+
+
+class Crossfade(Transition):
+    """from_surface -> to_surface 로 겹쳐서 전환 (from_surface는 Crossfade 전용 버퍼로 복사됨)"""
+    def __init__(self, from_surface, to_surface, duration=1000, easing="ease_in_out"):
+        super().__init__(duration, easing)
+        self.from_surface = snapshot_surface(from_surface, _crossfade_snapshots)
+        self.to_surface = to_surface
+        self.drawn_alpha = None
+
+    def alpha(self):
+        return int(255 * (1 - self.progress))
+
+    def changed(self):
+        return self.alpha() != self.drawn_alpha
+
+    def draw(self, screen):
+        screen.blit(self.to_surface, (0, 0))
+        alpha = self.drawn_alpha = self.alpha()
+        if alpha > 0:
+            self.from_surface.set_alpha(alpha)
+            screen.blit(self.from_surface, (0, 0))
+
+
+class Sequence(Transition):
+    """여러 전환을 순서대로 재생"""
+    def __init__(self, *transitions):
+        super().__init__(sum(t.duration for t in transitions))
+        self.transitions = list(transitions)
+        self.index = 0
+
+    @property
+    def current(self):
+        return self.transitions[min(self.index, len(self.transitions) - 1)]
+
+    def update(self, dt):
+        super().update(dt)
+        while dt > 0 and self.index < len(self.transitions):
+            t = self.transitions[self.index]
+            left = t.duration - t.elapsed
+            t.update(dt)
+            if not t.done:
+                break
+            dt -= left
+            self.index += 1
+
+    def changed(self):
+        return bool(self.transitions) and self.current.changed()
+
+    def draw(self, screen):
+        if self.transitions:
+            self.current.draw(screen)
+
+
+### Driver ###
+
+def run_transition(screen, transition, until=None, on_frame=None, fps=60):
+    """
+    Plays `transition` at `fps`, pumping events so the window stays responsive.
+
+    until: keeps showing the last frame after the transition ends until it returns True
+           (e.g. a background load finishing).
+    on_frame(dt): called once per frame before drawing.
+
+    Frames where the transition reports no change (holds, the settled last frame)
+    are neither redrawn nor uploaded.
+    """
+    clock = pygame.time.Clock()
+    renderer = DirtyRectRenderer(screen.get_size())
+    transition.draw(screen)
+    renderer.present()
+
+    while not transition.done or (until is not None and not until()):
+        dt = clock.tick(fps)
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+        transition.update(dt)
+        if on_frame is not None:
+            on_frame(dt)
+
+        if transition.changed():
+            transition.draw(screen)
+            renderer.mark_full()
+        renderer.present()
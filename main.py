@@ -1,98 +1,73 @@
+import time
+BOOT_T0 = time.perf_counter()
+
 import pygame
 import sys
-from localLibraries.PlayCoreLibraries import fade_out
+import os
+import contextlib
+from localLibraries.Transitions import run_transition, Sequence, Hold, FadeOut
+from localLibraries.SceneRegistry import SceneRegistry
+from localLibraries.SaveStore import saves
+
+# 게임 모듈은 메뉴에서 타일을 확인했을 때 처음 import 됨 (부팅 시에는 메뉴만 로드)
+SCENES = SceneRegistry()
+SCENES.register(0, "PlayCore", "PlayCoreMenu", wait_ms=1200)
+# 게임 씬은 끝난 화면을 그대로 돌려주고, 대기/페이드 아웃 시간은 여기서 정함
+SCENES.register("Lynez", "scenes.Lynez", "LynezScreen", wait_ms=2000, fade_ms=2000, record=True)
+SCENES.register("Magic Cat Academy", "scenes.MagicCatAcademy", "MagicCatAcademyScreen", wait_ms=1000, fade_ms=1000, record=True)
+SCENES.register("Airship", "scenes.Airship", "AirshipScreen", wait_ms=2000, fade_ms=2000, record=True)
+SCENES.register("How To", "scenes.howto", "PlayCoreMenu")
+
+# 설정하면 게임 한 판마다 입력을 녹화함 (python -m bench run --replay 로 재현)
+RECORD_DIR = os.environ.get("PLAYCORE_RECORD_DIR")
 
-from scenes import Lynez, MagicCatAcademy, Airship, howto
-import PlayCore
+def recorded(scene_key, size):
+    if not RECORD_DIR:
+        return contextlib.nullcontext()
+    from localLibraries.InputReplay import InputRecorder
+    os.makedirs(RECORD_DIR, exist_ok=True)
+    name = scene_key.split(":")[-1]
+    path = os.path.join(RECORD_DIR, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.pcrp")
+    return InputRecorder(path, scene=scene_key, size=size)
+
+def report_boot():
+    print(f"[boot] menu first frame after {(time.perf_counter() - BOOT_T0) * 1000:.0f} ms")
 
 def main():
     pygame.init()
-    WIDTH, HEIGHT = 1280, 720   
+    WIDTH, HEIGHT = 1280, 720
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("DSHS PlayCore")
-    
+
+    # 세이브는 부팅 때 한 번만 읽고, 이후 기록은 백그라운드에서 씀
+    saves.load()
+
     running = True
-    
-    curr_screen_idx = 0
-    
-    games = {
-        0:0,
-        "Lynez" : 1,
-        "Magic Cat Academy" : 2,
-        "Airship" : 3,
-        "How To" : 4
-    }
-    
-    """
-    0 : Main Menu
-    1 : Lynez
-    2 : Magic Cat Academy
-    3 : Airship
-    """
-    
+
+    curr_scene = 0
+    curr_screen = SCENES.create(curr_scene, WIDTH, HEIGHT, on_first_frame=report_boot)
+
     while running:
-        if curr_screen_idx == 0:
-            curr_screen = PlayCore.PlayCoreMenu(WIDTH,HEIGHT)
-            
-            next_screen, curr_screen_surface = curr_screen.loop(screen)
-            
-            curr_screen_idx = games[next_screen]
-            
-            pygame.time.wait(1200)
-            fade_out(screen, curr_screen_surface, WIDTH, HEIGHT)
-        
-        elif curr_screen_idx == 1:
-            curr_screen = Lynez.LynezScreen(WIDTH, HEIGHT)
-            
-            next_screen, curr_screen_surface = curr_screen.loop(screen)
-            
-            curr_screen_idx = games[next_screen]
-            
-            pygame.time.wait(500)
-            fade_out(screen, curr_screen_surface, WIDTH, HEIGHT)
-        
-        elif curr_screen_idx == 2:
-            curr_screen = MagicCatAcademy.MagicCatAcademyScreen(WIDTH, HEIGHT)
-            
-            next_screen, curr_screen_surface = curr_screen.loop(screen)
-            
-            curr_screen_idx = games[next_screen]
-            
-            pygame.time.wait(500)
-            fade_out(screen, curr_screen_surface, WIDTH, HEIGHT)
-        
-        elif curr_screen_idx == 3:
-            curr_screen = Airship.AirshipScreen(WIDTH, HEIGHT)
-            
-            next_screen, curr_screen_surface = curr_screen.loop(screen)
-            
-            curr_screen_idx = games[next_screen]
-            
-            pygame.time.wait(500)
-            fade_out(screen, curr_screen_surface, WIDTH, HEIGHT)
-        
-        # elif curr_screen_idx == 4:
-        #     curr_screen = AvoidMine.AvoidMineScreen(WIDTH, HEIGHT)
-            
-        #     next_screen, curr_screen_surface = curr_screen.loop(screen)
-            
-        #     curr_screen_idx = games[next_screen]
-            
-        #     pygame.time.wait(500)
-        #     fade_out(screen, curr_screen_surface, WIDTH, HEIGHT)
-        
-        elif curr_screen_idx == 4:
-            curr_screen = howto.PlayCoreMenu(WIDTH, HEIGHT)
-            
+        entry = SCENES.entry(curr_scene)
+
+        with recorded(entry.key, (WIDTH, HEIGHT)) if entry.record else contextlib.nullcontext():
             next_screen, curr_screen_surface = curr_screen.loop(screen)
-            
-            curr_screen_idx = games[next_screen]
-            
-            pygame.time.wait(500)
-            fade_out(screen, curr_screen_surface, WIDTH, HEIGHT)
-    
+
+        curr_scene = next_screen if next_screen in SCENES else 0
+
+        # 대기 + 페이드 아웃 동안 다음 씬을 백그라운드에서 로드/생성
+        # 로드가 더 오래 걸리면 검은 화면을 유지한 채 이벤트를 계속 처리하며 기다림
+        loader = SCENES.create_async(curr_scene, WIDTH, HEIGHT)
+
+        transition = Sequence(Hold(curr_screen_surface, entry.wait_ms), FadeOut(curr_screen_surface, entry.fade_ms))
+        run_transition(screen, transition, until=lambda: not loader.is_alive())
+
+        curr_screen = loader.wait()
+        if loader.load_ms > transition.duration:
+            print(f"[scene] {curr_scene}: loaded in {loader.load_ms:.0f} ms, longer than the {transition.duration} ms transition")
+
     pygame.quit()
     sys.exit()
-    
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,33 +2,107 @@ import pygame
 import random
 import sys
 import math
+import numpy as np
 
 from collections import deque
-from localLibraries.PlayCoreLibraries import ScreenObject, fade_out, blit_fps
+from localLibraries.PlayCoreLibraries import ScreenObject
+from localLibraries.AssetManager import assets
+from localLibraries.SaveStore import saves
+from localLibraries.Leaderboard import leaderboard, rank_label
+from localLibraries.FrameProfiler import FrameProfiler
+from localLibraries.NumberRenderer import NumberRenderer
+from localLibraries.FixedTimestep import FixedTimestep
+from localLibraries.RotationCache import rotation_cache
+from localLibraries.ParticleSystem import Burst
+
+# 속도/가속도 같은 게임 상수는 60Hz 한 틱 기준 -> 다른 틱 레이트에선 k = 60 / tick_rate 배로 진행
+BASE_RATE = 60
+
+### Cadences (초) ###
+STRIPE_INTERVAL = 0.5   # 옆면 줄무늬 생성 간격
+WALL_CYCLE = 3          # 줄무늬 몇 개마다 벽을 만들지
+SCORE_INTERVAL = 1 / 3  # 1점 오르는 간격
+SIGNAL_INTERVAL = 1.0   # 출발 신호등 불이 하나씩 켜지는 간격
+CRASH_WAIT = 1.5        # 충돌 후 게임오버 화면까지
+SHAKE_TIME = 1 / 3      # 충돌 시 화면 흔들림
+
+ROTATION_STEP = 0.5     # 비행선 회전 이미지를 몇 도 단위로 만들어 쓸지 (0이면 매 틱 정확한 각도로 회전)
+
+def frames(seconds):
+    """초 -> 60Hz 틱 수 (카운터는 k씩 올라가므로 틱 레이트와 상관없이 같은 시간)"""
+    return round(seconds * BASE_RATE)
+
+def approach(rate, k):
+    """틱마다 남은 거리의 rate만큼 따라가는 움직임을 k틱 분량으로"""
+    return rate if k == 1 else 1 - (1 - rate) ** k
+
+def accelerate(speed, acceleration, k):
+    """
+    speed += acceleration 후 speed만큼 움직이는 60Hz 틱 k개 분량을 한 번에 적분.
+    (이동 거리, 새 속도)를 돌려주며 k가 정수가 아니어도 60Hz와 같은 궤적을 따라감
+    """
+    return speed * k + acceleration * k * (k + 1) / 2, speed + acceleration * k
+
+def travelled(acceleration, elapsed):
+    """정지 상태에서 출발해 elapsed 틱 동안 accelerate()를 따라 움직인 거리 (닫힌 식, 배열도 됨)"""
+    return acceleration * elapsed * (elapsed + 1) / 2
+
+# 옆면 영역 0(위), 1(오른쪽), 2(아래), 3(왼쪽)의 줄무늬가 움직이는 방향 (y는 아래로 +)
+STRIPE_DIRECTION = (-1, 1, 1, -1)
+
+# Background.make_stripe_table()의 행
+STRIPE_SIGN, STRIPE_START, STRIPE_ACCELERATION, STRIPE_LIMIT, STRIPE_HORIZONTAL = range(5)
+STRIPE_START_LINE, STRIPE_END_LINE = 5, 8   # 각각 P, Q, R 세 행
+STRIPE_ROWS = 11
+
+### Wall parts ###
+# 벽 조각은 꽉 찬 사각형이라 충돌 마스크와 반투명 그림자가 크기만으로 정해짐 -> 새로 만들지 않고 재사용
+
+_solid_masks = {}
+
+def solid_mask(size):
+    """크기가 size인 꽉 찬 마스크 (비행선과 겹친 부분만 쓰므로 크기가 비행선보다 커지지 않음)"""
+    mask = _solid_masks.get(size)
+    if mask is None:
+        mask = _solid_masks[size] = pygame.Mask(size, fill=True)
+    return mask
+
+_shade = {}
+
+def shade_surface(width, height):
+    """(0, 0, 0, 200)으로 채운 표면 - 필요한 크기보다 클 수 있으니 area로 잘라서 blit"""
+    surf = _shade.get("surface")
+    if surf is None or surf.get_width() < width or surf.get_height() < height:
+        if surf is not None:
+            width, height = max(width, surf.get_width()), max(height, surf.get_height())
+        surf = _shade["surface"] = pygame.Surface((width, height), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 200))
+    return surf
 
 class AirshipMainScreen(ScreenObject):
-    def __init__(self, width, height, show_fps=False):
+    def __init__(self, width, height, show_fps=False, tick_rate=BASE_RATE, fps=60, max_catchup=5):
         super().__init__(width, height)
 
         self.show_fps = show_fps
 
-        self.h1 = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height / 15))
+        self.profiler = FrameProfiler(show_fps)
+
+        self.fps = fps
+        self.timestep = FixedTimestep(tick_rate, max_catchup)
+        self.k = BASE_RATE / tick_rate
+
+        self.h1 = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height / 15))
         self.h1_size = self.h1.size("")
 
-        self.p = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height / 30))
+        self.p = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height / 30))
         self.p_size = self.p.size("")
 
-        self.psmall = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height / 45))
+        self.psmall = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height / 45))
         self.psmall_size = self.psmall.size("")
 
-        ### file data ###
-        # 0: highest score
+        ### Save data ###
 
-        # Reading from a text file
-        with open("data/Airship/playdata/saves.txt", "r") as file:
-            file_data = file.read().split('\n')
-
-        self.best_score = int(file_data[0])
+        self.best_score = saves.get("Airship", "best", 0)
         self.curr_score = 0
 
         ### Colors ###
@@ -57,12 +131,12 @@ class AirshipMainScreen(ScreenObject):
         self.airship = Airship(self.width, self.height, 5, 3, 200)
         self.walls = []
         self.wall_cooldown = 0
-        self.background_cooldown = 30
-        self.wall_make_cycle = 3
+        self.background_cooldown = frames(STRIPE_INTERVAL)
+        self.wall_make_cycle = WALL_CYCLE
         self.speed_constant = 3000
         self.screen_shake = ScreenShake()
         self.after_crash = 0
-        self.after_crash_wait_time = 90
+        self.after_crash_wait_time = frames(CRASH_WAIT)
 
         self.signalLight = SignalLight((self.background.background_line[0][1], self.background.background_line[0][-2]), [self.width / 5, self.width / 16],
                                        (70, 70, 70), (60, 60, 60), (80, 150, 80), 0.05, 0.1)
@@ -117,6 +191,10 @@ class AirshipMainScreen(ScreenObject):
                         self.psmall.size("Remasterd by Yuseung Jang")[0] / 2]
         }
         self.high_score = 0 #선언만 하는 것임
+
+        # 점수처럼 매 프레임 바뀌는 숫자는 글리프를 조합 (값이 같으면 지난 Surface 재사용)
+        self.score_text = NumberRenderer(self.h1, self.white)
+        self.best_text = NumberRenderer(self.p, self.white, prefix="Best ")
         self.texts_index = ['game_over', 'restart', 'title', 'start', 'quit', 'credit1', 'credit2']
 
     def reset(self):
@@ -127,12 +205,12 @@ class AirshipMainScreen(ScreenObject):
         self.airship = Airship(self.width, self.height, 5, 3, 200)
         self.walls = []
         self.wall_cooldown = 0
-        self.background_cooldown = 30
-        self.wall_make_cycle = 3
+        self.background_cooldown = frames(STRIPE_INTERVAL)
+        self.wall_make_cycle = WALL_CYCLE
         self.speed_constant = 3000
         self.screen_shake = ScreenShake()
         self.after_crash = 0
-        self.after_crash_wait_time = 90
+        self.after_crash_wait_time = frames(CRASH_WAIT)
 
         self.signalLight = SignalLight((self.background.background_line[0][1], self.background.background_line[0][-2]),
                                        [self.width / 5, self.width / 16],
@@ -153,20 +231,26 @@ class AirshipMainScreen(ScreenObject):
         self.screen_shake.update()
         return self.screen_shake.offset_x, self.screen_shake.offset_y
 
-    def blit_game_over(self, screen):
-        self.main_menu_scroll += (0 - self.main_menu_scroll) * 0.075
+    def ease_menu_scroll(self):
+        self.main_menu_scroll += (0 - self.main_menu_scroll) * approach(0.075, self.k)
         if self.main_menu_scroll < 0.1:
             self.main_menu_scroll = 0
 
+    def blit_game_over(self, screen):
         # game over
         screen.blit(self.texts['game_over'][0], (self.width / 2 - self.texts['game_over'][1],
                                                  self.height / 5 * 2 - self.h1_size[1] - self.main_menu_scroll))
 
         # score
-        res_score = self.h1.render(f"{self.curr_score}", True, self.white)
-        screen.blit(res_score, (self.width / 2 - self.h1.size(f"{self.curr_score}")[0] / 2,
+        res_score = self.score_text.render(self.curr_score)
+        screen.blit(res_score, (self.width / 2 - res_score.get_width() / 2,
                                 self.height / 2 - self.h1_size[1] / 2 - self.main_menu_scroll / 2))
 
+        # rank
+        if 'rank' in self.texts:
+            screen.blit(self.texts['rank'][0], (self.width / 2 - self.texts['rank'][1],
+                                                self.height / 2 + self.h1_size[1] / 2 + self.main_menu_scroll / 2))
+
         # restart game
         screen.blit(self.texts['restart'][0], (self.width / 2 - self.texts['restart'][1],
                                                self.height / 5 * 3 + self.main_menu_scroll))
@@ -180,8 +264,8 @@ class AirshipMainScreen(ScreenObject):
                                              self.height / 5.5 * 2 - self.h1_size[1] - self.main_menu_scroll))
 
         # high score
-        high_score = self.p.render(f"Best {self.best_score}", True, self.white)
-        screen.blit(high_score, (self.width / 2 - self.p.size(f"Best {self.best_score}")[0] / 2,
+        high_score = self.best_text.render(self.best_score)
+        screen.blit(high_score, (self.width / 2 - high_score.get_width() / 2,
                                  self.height / 5.5 * 2 + self.main_menu_scroll))
 
         # start game
@@ -203,15 +287,12 @@ class AirshipMainScreen(ScreenObject):
                                                    1] + self.main_menu_scroll))
 
     def blit_ingame(self, screen):
-        score = self.h1.render(f"{self.curr_score}", True, self.white)
-        screen.blit(score, (self.width / 2 - self.h1.size(f"{self.curr_score}")[0] / 2, self.height / 5 - self.h1_size[1] / 2))
+        score = self.score_text.render(self.curr_score)
+        screen.blit(score, (self.width / 2 - score.get_width() / 2, self.height / 5 - self.h1_size[1] / 2))
 
     def load_screen(self, target):
         if target == 0:
-            self.best_score = max(self.best_score, self.curr_score)
-            # Writing to a text file
-            with open("data/airship/playdata/saves.txt", "w") as file:
-                file.write(f"{self.best_score}\n")
+            self.best_score = saves.get("Airship", "best", 0)
 
             self.reset()
             self.state = 0
@@ -221,11 +302,17 @@ class AirshipMainScreen(ScreenObject):
         elif target == 1:
             self.state = 0.5
             self.log = 'Start'
+            self.run_start_ms = pygame.time.get_ticks()
 
         elif target == 2:
             ### Game Over ###
             self.state = 2
             self.shake_tick = 25 * self.height / 1280
+            saves.update_best("Airship", self.curr_score)
+
+            rank = leaderboard.record("Airship", self.curr_score, (pygame.time.get_ticks() - self.run_start_ms) / 1000)
+            label = rank_label(rank, leaderboard.count("Airship"))
+            self.texts['rank'] = [self.psmall.render(label, True, self.white), self.psmall.size(label)[0] / 2]
 
             self.last_scrollx = self.scrollx
             self.last_scrolly = self.scrolly
@@ -234,210 +321,227 @@ class AirshipMainScreen(ScreenObject):
 
             self.main_menu_scroll = self.height * 2 / 5
 
-    def loop(self, screen):
-        clock = pygame.time.Clock()
-        self.running = True
+    ### Simulation (고정 틱) ###
 
-        self.state = 0
-        self.log = None
+    def update_tunnel(self):
+        self.background.change_areas()
+        self.background.make_stripe(3, self.speed_constant, self.background_cooldown)
+        self.background.move_stripe(self.k)
 
-        mouse_down = False
-        mouse_down_frames = 0
-        mouse_up_frames = 0
+    def tick(self):
+        k = self.k
 
-        """
-        0: main menu
-        0.5: game start
-        1: gameplay
-        2: gameover
-        """
+        if self.mouse_down:
+            self.mouse_down_frames += k
+        else:
+            self.mouse_up_frames += k
 
-        while self.running:
-            screen.fill(self.main_color)
-            if self.state == 0:
-                self.background.change_areas()
-                self.background.make_stripe(3, self.speed_constant, self.background_cooldown)
-                self.background.move_stripe()
-                self.background.draw(screen)
+        if self.state == 0:
+            self.update_tunnel()
 
-                self.signalLight.draw(screen)
+            for circle in self.circle_effects:
+                circle.update(k=k)
 
-                self.airship.draw(screen, 0, 0)
+                if circle.size > circle.target:
+                    self.circle_effects.remove(circle)
 
-                screen.blit(self.surface, (0, 0))
+        elif self.state == 0.5:
+            self.update_tunnel()
 
-            dt_ms = clock.tick(60)
+            self.time += k
+            if self.signalLight.update(self.time, frames(SIGNAL_INTERVAL)):
+                self.signalLight.move(k)
 
-            dt = dt_ms / 1000.0
+            self.airship.move(5, k)
+            self.airship.turn(3)
 
+            self.surface_cooldown += 1
+            if self.surface_cooldown >= 1 and self.surface_alpha > self.surface_delta_alpha:
+                self.surface_cooldown = 0
+                self.surface_alpha = max(self.surface_delta_alpha, self.surface_alpha - self.surface_delta_alpha * k)
+                self.surface.fill((0, 0, 0, self.surface_alpha))
 
-            if mouse_down:
-                mouse_down_frames += 1
-                if mouse_down_frames >= 60:
-                    pygame.draw.arc(screen, (255, 255, 255),
-                                    (pygame.mouse.get_pos()[0] - self.height / 60,
-                                     pygame.mouse.get_pos()[1] - self.height / 60, self.height / 60 * 2, self.height / 60 * 2),
-                                    math.radians(0), math.radians(min(mouse_down_frames * 2 - 120, 360)), max(int(self.height/200), 1))
-            else:
-                mouse_up_frames += 1
+            if self.signalLight.check():
+                self.state = 1
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+        elif self.state == 1:
+            self.screen_shake.update(k)
 
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    curr_pos = pygame.mouse.get_pos()
-                    self.circle_effects.append(CircleEffect(curr_pos[0], curr_pos[1], 1, self.height // 15, self.white, self.height / 200))
-                    mouse_down = True
+            if not self.airship.crash:
+                self.background.serve_area_cooldown += k
+                self.update_tunnel()
 
-                    if self.state == 1:
-                        self.airship.angle+=5
+            # 벽은 줄무늬 WALL_CYCLE개마다 (남은 시간은 다음 주기로 넘김)
+            wall_interval = self.background_cooldown * self.wall_make_cycle
+            self.wall_cooldown += k
+            if self.wall_cooldown >= wall_interval:
+                self.wall_cooldown -= wall_interval
 
+                self.walls.append(Wall(self.width, self.height, random.randint(0,1), self.level, self.background.corners(),
+                                       self.side_color, speed_constant= self.speed_constant))
 
-                if event.type == pygame.MOUSEBUTTONUP:
-                    if mouse_down == True:
-                        if mouse_down_frames < 60:
-                            if mouse_up_frames > 10:
-                                if self.state == 0:
-                                    self.load_screen(1)
-                                elif self.state == 2:
-                                    self.load_screen(0)
+            for i in range(len(self.walls)):
+                if not self.airship.crash:
+                    self.walls[-i-1].make_parts()
+                    self.walls[-i-1].move(self.background.lines, self.background.middle_lines, k)
+                    self.walls[-i-1].change(k)
+                if self.walls[-i-1].edge[0].middle_point[1] <= 0:
+                    crash_part = self.airship.crash_check(self.walls[-i-1])
+                    if not all(item in self.walls[-i-1].void_number for item in crash_part):
+                        self.airship.crash = True
+                        self.screen_shake.start_shake(frames(SHAKE_TIME))
+
+            if not self.airship.crash:
+                self.walls = [wall for wall in self.walls if not wall.edge[0].middle_point[1] <= 0]
+
+            if not self.airship.crash:
+                self.airship.move(5, k)
+                self.airship.turn(3)
+            self.airship.crash_effect(k)
 
-                        if self.state == 0:
-                            if mouse_down_frames > 240:
-                                return 0, screen
+            if self.airship.crash:
+                self.after_crash += k
+                if self.after_crash >= self.after_crash_wait_time:
+                    self.load_screen(2)
 
-                    mouse_down = False
-                    mouse_down_frames = 0
-                    mouse_up_frames = 0
+            self.score_cooldown += k
+            if self.score_cooldown >= frames(SCORE_INTERVAL) and not self.airship.crash:
+                self.score_cooldown -= frames(SCORE_INTERVAL)
+                self.curr_score += 1
 
+        elif self.state == 2:
+            self.surface_cooldown += 1
+            if self.shake_tick > 0:
+                self.scrollx = self.last_scrollx + (random.random() - 0.5) * self.shake_tick
+                self.prev_scrolly = self.scrolly
+                self.scrolly = self.prev_scrolly + (random.random() - 0.5) * self.shake_tick
+                self.shake_tick -= 0.2 * k
 
-            if self.state == 0:
-                ### Blit background ###
+            step = (self.adjed_scrolly - self.scrolly) * approach(0.03, k)
+            self.scrolly += step if step >= 0.1 else 0
 
-                ### Blit Effects ###
+            if self.surface_cooldown >= 1 and self.surface_max_alpha > self.surface_alpha:
+                self.surface_cooldown = 0
+                self.surface_alpha = min(self.surface_max_alpha, self.surface_alpha + self.surface_delta_alpha * k)
+                self.surface.fill((0, 0, 0, self.surface_alpha))
 
-                for circle in self.circle_effects:
-                    circle.update()
-                    circle.draw(screen)
+            self.ease_menu_scroll()
 
-                    if circle.size > circle.target:
-                        self.circle_effects.remove(circle)
+    ### Rendering ###
 
-                self.blit_menu(screen)
+    def render(self, screen):
+        screen.fill(self.main_color)
 
+        if self.state == 0:
+            self.background.draw(screen)
+            self.signalLight.draw(screen)
+            self.airship.draw(screen, 0, 0)
+            screen.blit(self.surface, (0, 0))
 
-                ### Blit Player ###
+            if self.mouse_down and self.mouse_down_frames >= 60:
+                pygame.draw.arc(screen, (255, 255, 255),
+                                (pygame.mouse.get_pos()[0] - self.height / 60,
+                                 pygame.mouse.get_pos()[1] - self.height / 60, self.height / 60 * 2, self.height / 60 * 2),
+                                math.radians(0), math.radians(min(self.mouse_down_frames * 2 - 120, 360)), max(int(self.height/200), 1))
 
-            elif self.state == 0.5:
-                self.background.change_areas()
-                self.background.make_stripe(3, self.speed_constant, self.background_cooldown)
-                self.background.move_stripe()
-                self.background.draw(screen)
+            for circle in self.circle_effects:
+                circle.draw(screen)
 
-                self.time += 1
-                if self.signalLight.update(self.time, 60):
-                    self.signalLight.move()
-                self.signalLight.draw(screen)
+            self.blit_menu(screen)
 
-                self.airship.move(5)
-                self.airship.turn(3)
-                self.airship.draw(screen, 0, 0)
+        elif self.state == 0.5:
+            self.background.draw(screen)
+            self.signalLight.draw(screen)
+            self.airship.draw(screen, 0, 0)
+            screen.blit(self.surface, (0, 0))
 
-                self.surface_cooldown += 1
-                if self.surface_cooldown >= 1 and self.surface_alpha > self.surface_delta_alpha:
-                    self.surface_cooldown = 0
-                    self.surface_alpha -= self.surface_delta_alpha
-                    self.surface.fill((0, 0, 0, self.surface_alpha))
-                screen.blit(self.surface, (0, 0))
+        elif self.state == 1:
+            self.background.draw(screen)
+            for i in range(len(self.walls)):
+                self.walls[-i-1].draw(screen)
+            self.airship.draw(screen, self.screen_shake.offset_x, self.screen_shake.offset_y)
 
-                if self.signalLight.check():
-                    self.state = 1
+            self.blit_ingame(screen)
 
-            elif self.state == 1:
-                self.screen_shake.update()
-                shake_x, shake_y = self.screen_shake.offset_x, self.screen_shake.offset_y
+        elif self.state == 2:
+            self.background.draw(screen)
+            for i in range(len(self.walls)):
+                self.walls[-i-1].draw(screen)
+            self.airship.draw(screen, 0, 0)
+            screen.blit(self.surface, (0, 0))
 
-                if not self.airship.crash:
-                    self.background.serve_area_cooldown += 1
-                    self.background.change_areas()
-                    self.background.make_stripe(3, self.speed_constant, self.background_cooldown)
-                    self.background.move_stripe()
-                self.background.draw(screen)
+            self.blit_game_over(screen)
 
+    def loop(self, screen):
+        clock = pygame.time.Clock()
+        self.running = True
 
-                self.wall_cooldown += 1
-                if self.wall_cooldown >= self.background_cooldown * self.wall_make_cycle:
-                    self.wall_cooldown = 0
-
-                    self.walls.append(Wall(self.width, self.height, random.randint(0,1), self.level, (self.background.left_up, self.background.right_up, self.background.right_down, self.background.left_down),
-                                           self.side_color, speed_constant= self.speed_constant))
+        self.state = 0
+        self.log = None
 
+        self.mouse_down = False
+        self.mouse_down_frames = 0
+        self.mouse_up_frames = 0
 
-                for i in range(len(self.walls)):
-                    if not self.airship.crash:
-                        self.walls[-i-1].make_parts()
-                        self.walls[-i-1].move(self.background.lines, self.background.middle_lines)
-                        self.walls[-i-1].change()
-                    self.walls[-i-1].draw(screen)
-                    if self.walls[-i-1].edge[0].middle_point[1] <= 0:
-                        crash_part = self.airship.crash_check(self.walls[-i-1])
-                        if not all(item in self.walls[-i-1].void_number for item in crash_part):
-                            self.airship.crash = True
-                            self.screen_shake.start_shake(20)
+        self.timestep.reset()
 
-                if not self.airship.crash:
-                    self.walls = [wall for wall in self.walls if not wall.edge[0].middle_point[1] <= 0]
+        """
+        0: main menu
+        0.5: game start
+        1: gameplay
+        2: gameover
+        """
 
-                if not self.airship.crash:
-                    self.airship.move(5)
-                    self.airship.turn(3)
-                self.airship.draw(screen, shake_x, shake_y)
-                self.airship.crash_effect()
+        while self.running:
+            self.profiler.begin_frame()
 
-                if self.airship.crash:
-                    self.after_crash += 1
-                    if self.after_crash >= self.after_crash_wait_time:
-                        self.load_screen(2)
+            dt_ms = clock.tick(self.fps)
+            self.profiler.idle()
 
-                self.score_cooldown += 1
-                if self.score_cooldown >= 20 and not self.airship.crash:
-                    self.score_cooldown = 0
-                    self.curr_score += 1
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
 
-                self.blit_ingame(screen)
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    curr_pos = pygame.mouse.get_pos()
+                    self.circle_effects.append(CircleEffect(curr_pos[0], curr_pos[1], 1, self.height // 15, self.white, self.height / 200))
+                    self.mouse_down = True
 
-            elif self.state == 2:
-                self.surface_cooldown += 1
-                if self.shake_tick > 0:
-                    self.scrollx = self.last_scrollx + (random.random() - 0.5) * self.shake_tick
-                    self.prev_scrolly = self.scrolly
-                    self.scrolly = self.prev_scrolly + (random.random() - 0.5) * self.shake_tick
-                    self.shake_tick -= 0.2
+                    if self.state == 1:
+                        self.airship.angle+=5
 
 
-                self.scrolly += (self.adjed_scrolly - self.scrolly) * 0.03 if (self.adjed_scrolly - self.scrolly) * 0.03 >= 0.1 else 0
+                if event.type == pygame.MOUSEBUTTONUP:
+                    if self.mouse_down == True:
+                        if self.mouse_down_frames < 60:
+                            if self.mouse_up_frames > 10:
+                                if self.state == 0:
+                                    self.load_screen(1)
+                                elif self.state == 2:
+                                    self.load_screen(0)
 
-                if self.surface_cooldown >= 1 and self.surface_max_alpha > self.surface_alpha:
-                    self.surface_cooldown = 0
-                    self.surface_alpha += self.surface_delta_alpha
-                    self.surface.fill((0, 0, 0, self.surface_alpha))
+                        if self.state == 0:
+                            if self.mouse_down_frames > 240:
+                                return 0, screen
 
+                    self.mouse_down = False
+                    self.mouse_down_frames = 0
+                    self.mouse_up_frames = 0
+            self.profiler.mark("events")
 
-                self.background.draw(screen)
-                for i in range(len(self.walls)):
-                    self.walls[-i-1].draw(screen)
-                self.airship.draw(screen, 0, 0)
-                screen.blit(self.surface, (0, 0))
+            for _ in range(self.timestep.advance(dt_ms)):
+                self.tick()
+            self.profiler.mark("update")
 
-                self.blit_game_over(screen)
+            self.render(screen)
+            self.profiler.mark("draw")
 
             # Show FPS if needed
-            if self.show_fps:
-                blit_fps(screen, clock)
+            self.profiler.draw(screen, clock)
 
             pygame.display.flip()
+            self.profiler.mark("flip")
 
 class AirshipScreen(ScreenObject):
     def __init__(self, width, height, show_fps=False):
@@ -450,9 +554,8 @@ class AirshipScreen(ScreenObject):
         while running:
             curr_AvoidMine_screen = AirshipMainScreen(self.width, self.height, show_fps=self.show_fps)
             next_screen, curr_screen_surface = curr_AvoidMine_screen.loop(screen)
-            pygame.time.wait(2000)
-            fade_out(screen, curr_screen_surface, self.width, self.height, 2000)
-            return 0, screen
+            # 대기 + 페이드 아웃은 main.py가 다음 씬 로드와 겹쳐서 처리
+            return 0, curr_screen_surface
 
 
 
@@ -472,10 +575,11 @@ class CircleEffect:
             self.color = list(color)
             self.second = second
 
-    def update(self, step=0.1, color_step=0.2):
-        self.size += self.target * step
+    def update(self, step=0.1, color_step=0.2, k=1):
+        self.size += self.target * step * k
 
         if self.gradient:
+            color_step = approach(color_step, k)
             for i in range(3):
                 self.color[i] += int((self.second[i] - self.color[i]) * color_step)
                 self.color[i] = min(self.color[i], 255)
@@ -493,24 +597,28 @@ class Airship:
         self.x, self.y = size * 2, size
         self.crash = False
 
-        self.original_image, self.image = pygame.transform.scale(pygame.image.load("data/Airship/imgs/1.png"),(self.x, self.y)), pygame.transform.scale(pygame.image.load("data/Airship/imgs/1.png"), (self.x, self.y))
+        self.original_image = self.image = assets.image("data/Airship/imgs/1.png", (self.x, self.y))
+        self.rotations = rotation_cache(self.original_image, ROTATION_STEP)
         self.rect = self.image.get_rect(center=(screen_width / 2, screen_height / 4 * 3))
-        self.mask = pygame.mask.from_surface(self.image)
-        self.mask_image = self.mask.to_surface()
+        self.mask = self.image_mask = pygame.mask.from_surface(self.image)
 
+        # 파편은 충돌한 틱에 한 번만 만듦
         self.Explosion_size = 150
-        self.explosion = Explosion(self.rect.center[0], self.rect.center[1], self.Explosion_size)
+        self.explosion = Burst([(255, 100, 0), (255, 200, 50), (200, 50, 0)], speed=(2, 6), lifetime=(30, 60), radius=(2, 5))
 
-    def move(self, move_proportion):
-        self.moved_distance += self.speed
+    def move(self, move_proportion, k=1):
+        self.moved_distance += self.speed * k
 
+        # 틱마다 마우스 쪽으로 남은 거리의 1/move_proportion 만큼
+        if k != 1:
+            move_proportion = 1 / approach(1 / move_proportion, k)
         mouse_pos = pygame.mouse.get_pos()
         delta_x, delta_y = (self.location[0] - mouse_pos[0]) / move_proportion, (self.location[1] - mouse_pos[1]) / move_proportion
         self.location = (self.location[0] - delta_x, self.location[1] - delta_y)
 
+        # 충돌 판정용 사각형과 마스크는 같은 이미지(직전 turn의 회전)에서 함께 가져옴
         self.rect = self.image.get_rect(center=self.location)
-        self.mask = pygame.mask.from_surface(self.image)
-        self.mask_image = self.mask.to_surface()
+        self.mask = self.image_mask
 
     def turn(self, turn_proportion):
         mouse_pos = pygame.mouse.get_pos()
@@ -519,27 +627,35 @@ class Airship:
         if self.angle <= -80: self.angle = -80
         elif self.angle >= 80: self.angle = 80
 
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        # 회전 이미지와 마스크는 ROTATION_STEP도 단위로 만들어 둔 것을 씀 (마스크는 다음 move에서 rect와 같이 바뀜)
+        self.image, self.image_mask = self.rotations.get(self.angle)
+
+    def hits_rect(self, rect):
+        # 조각과 비행선 사각형이 겹치는 부분만 보면 되므로 그 크기의 꽉 찬 마스크와 비교
+        clip = rect.clip(self.rect)
+        if clip.width == 0 or clip.height == 0:
+            return False
+        return solid_mask(clip.size).overlap(self.mask, (self.rect.x - clip.x, self.rect.y - clip.y)) is not None
 
     def crash_check(self, wall):
         crash_part = []
-        for i in range(len(wall.parts_mask)):
-            if wall.parts_mask[i].overlap(self.mask, (self.rect.x - wall.parts[i].x, self.rect.y - wall.parts[i].y)):
+        for i in range(len(wall.parts)):
+            if self.hits_rect(wall.parts[i]):
                 crash_part.append(i)
 
         if wall.kind_number == 1:
-            for i in range(len(wall.parts_mask_2)):
-                if wall.parts_mask_2[i].overlap(self.mask,
-                                              (self.rect.x - wall.parts_2[i].x, self.rect.y - wall.parts_2[i].y)):
+            for i in range(len(wall.parts_2)):
+                if self.hits_rect(wall.parts_2[i]):
                     crash_part.append(i)
 
         return crash_part
 
-    def crash_effect(self):
-        if self.crash:
-            self.explosion.update()
-        else:
-            self.explosion = Explosion(self.location[0], self.location[1], self.Explosion_size)
+    def crash_effect(self, k=1):
+        if not self.crash:
+            return
+        if not self.explosion.fired:
+            self.explosion.fire(self.location[0], self.location[1], self.Explosion_size)
+        self.explosion.update(k)
 
     def smoke_effect(self):
         pass
@@ -564,10 +680,9 @@ class Wall:
             2: Line(screen_width, screen_height, 2, points[2], points[3], points, color = color, speed_constant = speed_constant),
             3: Line(screen_width, screen_height, 3, points[3], points[0], points, color = color, speed_constant = speed_constant)
         }
-        self.parts, self.frame_points, self.frame, self.parts_surface, self.parts_mask, self.parts_mask_image = {}, {}, {}, {}, {}, {}
+        self.parts, self.frame_points, self.frame = {}, {}, {}
         self.void_number = []
         if kind_number == 1:
-            self.parts_surface_2, self.parts_mask_2, self.parts_mask_image_2 = {}, {}, {}
             self.speed, self.direction_1, self.direction_2, self.parts_2, self.frame_2 = {}, {}, {}, {}, {}
             self.location_1, self.location_2 = {}, {}
             self.width, self.height, self.proportion, self.cooldown = 0, 0, 100, 0
@@ -585,20 +700,22 @@ class Wall:
                 for i in range(number):
                     self.void_number.append(a.pop(random.randint(0, len(a) - 1)))
 
-            self.frame = {
-                3 : Line(self.screen_width, self.screen_height, 3, [self.edge[0].start_point[0] * 2 / 3 + self.edge[0].end_point[0] * 1 / 3, self.edge[0].middle_point[1]],
-                                [self.edge[0].start_point[0] * 2 / 3 + self.edge[0].end_point[0] * 1 / 3, self.edge[2].middle_point[1]],
-                                self.edge[0].points, color=self.color, width= width),
-                1 : Line(self.screen_width, self.screen_height, 1, [self.edge[0].start_point[0] * 1 / 3 + self.edge[0].end_point[0] * 2 / 3,self.edge[0].middle_point[1]],
-                                [self.edge[0].start_point[0] * 1 / 3 + self.edge[0].end_point[0] * 2 / 3,self.edge[2].middle_point[1]],
-                                self.edge[0].points, color=self.color, width=width),
-                0 : Line(self.screen_width, self.screen_height, 0, [self.edge[3].middle_point[0],self.edge[1].start_point[1] * 2 / 3 + self.edge[1].end_point[1] * 1 / 3],
-                                [self.edge[1].middle_point[0],self.edge[1].start_point[1] * 2 / 3 + self.edge[1].end_point[1] * 1 / 3],
-                                self.edge[0].points, color=self.color, width=width),
-                2 : Line(self.screen_width, self.screen_height, 2, [self.edge[3].middle_point[0],self.edge[1].start_point[1] * 1 / 3 + self.edge[1].end_point[1] * 2 / 3],
-                                [self.edge[1].middle_point[0],self.edge[1].start_point[1] * 1 / 3 + self.edge[1].end_point[1] * 2 / 3],
-                                self.edge[0].points, color=self.color, width=width)
-        }
+            if len(self.frame) == 0:
+                # 칸막이 선과 조각 사각형은 처음 한 번만 만들고 이후엔 좌표만 바꿈
+                for i in (3, 1, 0, 2):
+                    self.frame[i] = Line(self.screen_width, self.screen_height, i, [0, 0], [0, 0], self.edge[0].points, color=self.color, width=width)
+                for i in range(9):
+                    self.parts[i] = pygame.Rect(0, 0, 0, 0)
+
+            self.frame[3].set_points([self.edge[0].start_point[0] * 2 / 3 + self.edge[0].end_point[0] * 1 / 3, self.edge[0].middle_point[1]],
+                                     [self.edge[0].start_point[0] * 2 / 3 + self.edge[0].end_point[0] * 1 / 3, self.edge[2].middle_point[1]])
+            self.frame[1].set_points([self.edge[0].start_point[0] * 1 / 3 + self.edge[0].end_point[0] * 2 / 3,self.edge[0].middle_point[1]],
+                                     [self.edge[0].start_point[0] * 1 / 3 + self.edge[0].end_point[0] * 2 / 3,self.edge[2].middle_point[1]])
+            self.frame[0].set_points([self.edge[3].middle_point[0],self.edge[1].start_point[1] * 2 / 3 + self.edge[1].end_point[1] * 1 / 3],
+                                     [self.edge[1].middle_point[0],self.edge[1].start_point[1] * 2 / 3 + self.edge[1].end_point[1] * 1 / 3])
+            self.frame[2].set_points([self.edge[3].middle_point[0],self.edge[1].start_point[1] * 1 / 3 + self.edge[1].end_point[1] * 2 / 3],
+                                     [self.edge[1].middle_point[0],self.edge[1].start_point[1] * 1 / 3 + self.edge[1].end_point[1] * 2 / 3])
+
             self.frame_points = {
                 0: self.edge[0].start_point,
                 1: (self.frame[3].middle_point[0], self.edge[0].equation(self.frame[3].middle_point[0], None)),
@@ -620,26 +737,10 @@ class Wall:
                 14: (self.frame[1].middle_point[0], self.edge[2].equation(self.frame[1].middle_point[0], None)),
                 15: self.edge[2].start_point,
             }
-            self.parts = {
-                0: pygame.Rect(*self.frame_points[0], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-                1: pygame.Rect(*self.frame_points[1], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-                2: pygame.Rect(*self.frame_points[2], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-
-                3: pygame.Rect(*self.frame_points[4], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-                4: pygame.Rect(*self.frame_points[5], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-                5: pygame.Rect(*self.frame_points[6], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-
-                6: pygame.Rect(*self.frame_points[8], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-                7: pygame.Rect(*self.frame_points[9], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-                8: pygame.Rect(*self.frame_points[10], self.frame_points[1][0] - self.frame_points[0][0], self.frame_points[5][1] - self.frame_points[1][1]),
-            }
-            for i in range(len(self.parts)):
-                self.parts_surface[i] = pygame.Surface(self.parts[i].size, pygame.SRCALPHA)
-                self.parts_surface[i].fill((0, 0, 0, 200))
-            for i in range(len(self.parts_surface)):
-                self.parts_mask[i] = pygame.mask.from_surface(self.parts_surface[i])
-            for i in range(len(self.parts_mask)):
-                self.parts_mask_image[i] = self.parts_mask[i].to_surface()
+            part_width = self.frame_points[1][0] - self.frame_points[0][0]
+            part_height = self.frame_points[5][1] - self.frame_points[1][1]
+            for i, corner in enumerate((0, 1, 2, 4, 5, 6, 8, 9, 10)):
+                self.parts[i].update(*self.frame_points[corner], part_width, part_height)
 
         elif self.kind_number == 1: # 움직이는 레이저 피하기
             line_width = 1
@@ -663,18 +764,14 @@ class Wall:
                     if self.frame[i].number == 8:
                         self.direction_1[i] = -1
                         self.location_1[i] = self.screen_width
-                self.frame[i] = Line(self.screen_width, self.screen_height, 5, (self.edge[0].start_point[0] + self.location_1[i] * self.width, self.edge[0].start_point[1]),
-                                     (self.edge[2].end_point[0] + self.location_1[i] * self.width, self.edge[2].end_point[1]), color=(100, 50, 50), width=line_width)
-                self.parts[i] = pygame.Rect(self.frame[i].start_point[0], self.frame[i].start_point[1], self.width / self.proportion * 2, self.height)
-
-            for i in range(len(self.parts)):
-                self.parts_surface[i] = pygame.Surface(self.parts[i].size, pygame.SRCALPHA)
-                self.parts_surface[i].fill((0, 0, 0, 200))
-            for i in range(len(self.parts_surface)):
-                self.parts_mask[i] = pygame.mask.from_surface(self.parts_surface[i])
-            for i in range(len(self.parts_mask)):
-                self.parts_mask_image[i] = self.parts_mask[i].to_surface()
-
+                start = (self.edge[0].start_point[0] + self.location_1[i] * self.width, self.edge[0].start_point[1])
+                end = (self.edge[2].end_point[0] + self.location_1[i] * self.width, self.edge[2].end_point[1])
+                if self.frame[i].number == 8:
+                    self.frame[i] = Line(self.screen_width, self.screen_height, 5, start, end, color=(100, 50, 50), width=line_width)
+                    self.parts[i] = pygame.Rect(0, 0, 0, 0)
+                else:
+                    self.frame[i].set_points(start, end)
+                self.parts[i].update(self.frame[i].start_point[0], self.frame[i].start_point[1], self.width / self.proportion * 2, self.height)
 
             for i in range(number):
                 self.speed[i] = random.uniform(1, 3)
@@ -686,28 +783,26 @@ class Wall:
                     if self.frame_2[i].number == 8:
                         self.direction_2[i] = -1
                         self.location_2[i] = self.screen_height
-                self.frame_2[i] = Line(self.screen_width, self.screen_height, 5, (self.edge[0].start_point[0], self.edge[0].start_point[1] + self.location_2[i] * self.height),
-                                       (self.edge[0].end_point[0], self.edge[0].end_point[1] + self.location_2[i] * self.height), color=(100, 50, 50), width=line_width)
-                self.parts_2[i] = pygame.Rect(self.frame_2[i].start_point[0], self.frame_2[i].start_point[1], self.width, self.width / self.proportion * 2)
-
-            for i in range(len(self.parts_2)):
-                self.parts_surface_2[i] = pygame.Surface(self.parts_2[i].size, pygame.SRCALPHA)
-                self.parts_surface_2[i].fill((0, 0, 0, 200))
-            for i in range(len(self.parts_surface_2)):
-                self.parts_mask_2[i] = pygame.mask.from_surface(self.parts_surface_2[i])
-            for i in range(len(self.parts_mask_2)):
-                self.parts_mask_image_2[i] = self.parts_mask_2[i].to_surface()
-
-
+                start = (self.edge[0].start_point[0], self.edge[0].start_point[1] + self.location_2[i] * self.height)
+                end = (self.edge[0].end_point[0], self.edge[0].end_point[1] + self.location_2[i] * self.height)
+                if self.frame_2[i].number == 8:
+                    self.frame_2[i] = Line(self.screen_width, self.screen_height, 5, start, end, color=(100, 50, 50), width=line_width)
+                    self.parts_2[i] = pygame.Rect(0, 0, 0, 0)
+                else:
+                    self.frame_2[i].set_points(start, end)
+                self.parts_2[i].update(self.frame_2[i].start_point[0], self.frame_2[i].start_point[1], self.width, self.width / self.proportion * 2)
 
         elif self.kind_number == 2:
             pass
 
-    def move(self, lines, middle_lines):
+    def move(self, lines, middle_lines, k=1):
         for i in range(4):
-            self.edge[i % 4].update(lines[i % 4], middle_lines[i % 4], lines[(i + 1) % 4])
+            self.edge[i % 4].update(lines[i % 4], middle_lines[i % 4], lines[(i + 1) % 4], k)
+        # 이웃한 모서리끼리 꼭짓점 리스트를 공유하므로, 네 모서리가 다 움직인 뒤 절편을 다시 맞춤
+        for edge in self.edge.values():
+            edge.set_intercept()
 
-    def change(self):
+    def change(self, k=1):
         if self.kind_number == 0:
             pass
         elif self.kind_number == 1:
@@ -716,7 +811,7 @@ class Wall:
                 self.cooldown = 0
 
                 for i in range(len(self.frame)):
-                    self.location_1[i] += self.direction_1[i] / self.proportion * self.speed[i]
+                    self.location_1[i] += self.direction_1[i] / self.proportion * self.speed[i] * k
                     if self.location_1[i] >= 1:
                         self.location_1[i] = 1
                         self.direction_1[i] = -1
@@ -725,7 +820,7 @@ class Wall:
                         self.direction_1[i] = 1
 
                 for i in range(len(self.frame_2)):
-                    self.location_2[i] += self.direction_2[i] / self.proportion * self.speed[i]
+                    self.location_2[i] += self.direction_2[i] / self.proportion * self.speed[i] * k
                     if self.location_2[i] >= 1:
                         self.location_2[i] = 1
                         self.direction_2[i] = -1
@@ -745,9 +840,10 @@ class Wall:
 
 
         elif self.kind_number == 0:
-            for i in range(len(self.parts_surface)):
+            for i in range(len(self.parts)):
                 if not i in self.void_number:
-                    screen.blit(self.parts_surface[i], self.parts[i].topleft)
+                    size = self.parts[i].size
+                    screen.blit(shade_surface(*size), self.parts[i].topleft, (0, 0, *size))
             for i in range(len(self.frame)):
                 self.frame[i].draw(screen)
 
@@ -758,16 +854,10 @@ class Wall:
 class Line:
     def __init__(self, screen_width, screen_height, number, start_point, end_point, points = (), color = (255, 255, 255), width = 3, speed_constant = 3000):
         self.number, self.width, self.height = number, screen_width, screen_height
-        self.start_point, self.end_point = start_point, end_point
-        self.middle_point = [(start_point[0] + end_point[0]) / 2 , (start_point[1] + end_point[1]) / 2]
+        self.set_points(start_point, end_point)
         self.x, self.y = 0, 0
-        if not start_point[0] - end_point[0] == 0:
-            self.slope = (start_point[1] - end_point[1]) / (start_point[0] - end_point[0])
-        else: self.slope = 2147483647
-        if self.slope == 0: self.slope = 0.00000000001
-        self.y_intercept = start_point[1] - self.slope * start_point[0]
-        self.speed_constant, self.speed = speed_constant, 0
-        self.acceleration_cooldown = 0
+        self.speed_constant, self.elapsed = speed_constant, 0
+        self.origin = list(self.middle_point)   # update()는 여기서부터 움직인 거리로 위치를 정함
         self.color = color
         self.points = points #흰색 화면의 4개의 꼭짓점
         self.line_width = width
@@ -781,8 +871,20 @@ class Line:
         elif self.number == 3:
             self.acceleration = self.points[3][0] / self.speed_constant
 
-    def equation(self, x, y):
+    def set_points(self, start_point, end_point):
+        self.start_point, self.end_point = start_point, end_point
+        self.middle_point = [(start_point[0] + end_point[0]) / 2 , (start_point[1] + end_point[1]) / 2]
+        if not start_point[0] - end_point[0] == 0:
+            self.slope = (start_point[1] - end_point[1]) / (start_point[0] - end_point[0])
+        else: self.slope = 2147483647
+        if self.slope == 0: self.slope = 0.00000000001
+        self.set_intercept()
+
+    def set_intercept(self):
+        # 점이 바뀔 때만 다시 계산 (equation()은 호출마다 계산하지 않음)
         self.y_intercept = self.start_point[1] - self.slope * self.start_point[0]
+
+    def equation(self, x, y):
         self.x, self.y = x, y
 
         if self.x == None and self.y != None:
@@ -790,14 +892,12 @@ class Line:
         elif self.x != None and self.y == None:
             return self.slope * self.x + self.y_intercept
 
-    def update(self, start_line, middle_line, end_line): # start_line -> middle_line -> end_line 시계방향으로 정함
-        self.acceleration_cooldown += 1
-        if self.acceleration_cooldown >= 1:
-            self.speed += self.acceleration
-            self.acceleration_cooldown = 0
+    def update(self, start_line, middle_line, end_line, k=1): # start_line -> middle_line -> end_line 시계방향으로 정함
+        self.elapsed += k
+        distance = travelled(self.acceleration, self.elapsed)
 
         if self.number == 0:
-            self.middle_point[1] -= self.speed
+            self.middle_point[1] = self.origin[1] - distance
             self.middle_point[0] = middle_line.equation(None, self.middle_point[1])
 
             self.start_point[1], self.end_point[1] = self.middle_point[1], self.middle_point[1]
@@ -805,7 +905,7 @@ class Line:
             self.end_point[0] = end_line.equation(None, self.end_point[1])
 
         elif self.number == 1:
-            self.middle_point[0] += self.speed
+            self.middle_point[0] = self.origin[0] + distance
             self.middle_point[1] = middle_line.equation(self.middle_point[0], None)
 
             self.start_point[0], self.end_point[0] = self.middle_point[0], self.middle_point[0]
@@ -813,7 +913,7 @@ class Line:
             self.end_point[1] = end_line.equation(self.end_point[0], None)
 
         elif self.number == 2:
-            self.middle_point[1] += self.speed
+            self.middle_point[1] = self.origin[1] + distance
             self.middle_point[0] = middle_line.equation(None, self.middle_point[1])
 
             self.start_point[1], self.end_point[1] = self.middle_point[1], self.middle_point[1]
@@ -821,13 +921,15 @@ class Line:
             self.end_point[0] = end_line.equation(None, self.end_point[1])
 
         elif self.number == 3:
-            self.middle_point[0] -= self.speed
+            self.middle_point[0] = self.origin[0] - distance
             self.middle_point[1] = middle_line.equation(self.middle_point[0], None)
 
             self.start_point[0], self.end_point[0] = self.middle_point[0], self.middle_point[0]
             self.start_point[1] = start_line.equation(self.start_point[0], None)
             self.end_point[1] = end_line.equation(self.end_point[0], None)
 
+        self.set_intercept()
+
     def draw(self, screen):
         pygame.draw.line(screen, self.color, self.start_point, self.end_point, self.line_width)
 
@@ -839,20 +941,35 @@ class Background:
         self.speed, self.main_color, self.side_color, self.base_color = speed, main_color, side_color, base_color
         self.size_proportion = proportion
         self.size_x, self.size_y = self.width // (2 * self.size_proportion), self.height // (2 * self.size_proportion)
-        self.edge, self.main_areas, self.lines, self.middle_lines, self.side_areas = [], [], [], [], [[] for i in range(4)]
+        self.edge, self.main_areas, self.lines, self.middle_lines = [], [], [], []
         self.serve_area_cooldown = 0
+        self.stripe_time = 0                        # move_stripe로 흐른 틱 수
+        self.stripe_spawns = np.zeros(0)            # 살아 있는 줄무늬가 나온 시각
+        self.stripe_areas = np.zeros(0, dtype=int)  # 그 줄무늬가 있는 옆면 (0 위, 1 오른쪽, 2 아래, 3 왼쪽)
+        self.stripe_thickness = 0
+        self.stripe_table = None                    # make_stripe_table()
         self.left_up, self.right_up, self.right_down, self.left_down, self.left_middle, self.right_middle, self.up_middle, self.down_middle = None, None, None, None, None, None, None, None
         self.points = [self.left_up, self.right_up, self.right_down, self.left_down, self.left_middle, self.right_middle, self.up_middle, self.down_middle]
         self.background_line_number = 5
         self.background_line = [[] for i in range(4)]
+        self.geometry = None    # 지금 선들을 만든 (화면 크기, 소실점, 안쪽 사각형 크기)
+        self.layers = None      # 줄무늬 아래/위에 그려지는 고정된 부분 (under, over)
 
     def change_areas(self):
+        """소실점이나 크기가 바뀌었을 때만 터널의 선과 면을 다시 만듦 (매 틱 호출됨)"""
 
         '''mouse_pos = pygame.mouse.get_pos()
         self.vp_x = mouse_pos[0]
         self.vp_y = mouse_pos[1]'''
         self.vp_x, self.vp_y = self.width // 2, self.height // 2 * 5/4
 
+        geometry = (self.width, self.height, self.vp_x, self.vp_y, self.size_x, self.size_y)
+        if geometry == self.geometry:
+            return
+        self.geometry = geometry
+        self.layers = None
+        self.stripe_table = None
+
         self.left_up = [self.vp_x - self.size_x, self.vp_y - self.size_y]
         self.right_up = [self.vp_x + self.size_x, self.vp_y - self.size_y]
         self.right_down = [self.vp_x + self.size_x, self.vp_y + self.size_y]
@@ -903,119 +1020,123 @@ class Background:
             self.background_line[3].append(Line(self.width, self.height, 5, [self.lines[3].start_point[0], self.lines[3].start_point[1] + (self.lines[0].start_point[1] - self.lines[3].start_point[1]) / (self.background_line_number - 1) * i],
                                                 [self.lines[3].end_point[0], self.lines[3].end_point[1] + (self.lines[0].end_point[1] - self.lines[3].end_point[1]) / (self.background_line_number - 1) * i], color= self.side_color))
 
+    def corners(self):
+        """안쪽 사각형 꼭짓점의 복사본 - 벽의 모서리 선이 받은 리스트를 직접 움직이므로 캐시된 좌표를 그대로 넘기면 안 됨"""
+        return tuple(list(point) for point in (self.left_up, self.right_up, self.right_down, self.left_down))
+
     def make_stripe(self, thickness, speed_constant, cooldown):
+        if self.stripe_table is None:
+            self.stripe_table = self.make_stripe_table(speed_constant)
+
         if self.serve_area_cooldown >= cooldown:
-            self.serve_area_cooldown = 0
-
-            # 0 area (윗 부분)
-            front_line_0 = Line(self.width, self.height, 0, [self.lines[0].equation(None,  self.left_up[1]), self.left_up[1]],
-                            [self.lines[1].equation(None, self.right_up[1]), self.right_up[1]],
-                                (self.left_up, self.right_up, self.right_down, self.left_down),
-                                speed_constant = speed_constant)
-            behind_line_0 = Line(self.width, self.height, 0, [self.lines[0].equation(None,  self.left_up[1] + thickness), self.left_up[1] + thickness],
-                            [self.lines[1].equation(None, self.right_up[1] + thickness), self.right_up[1] + thickness],
-                                 (self.left_up, self.right_up, self.right_down, self.left_down),
-                                 speed_constant = speed_constant)
-
-            # 1 area (오른쪽)
-            front_line_1  = Line(self.width, self.height, 1, [self.right_up[0], self.lines[1].equation(self.right_up[0], None)],
-                                 [self.right_down[0], self.lines[2].equation(self.right_down[0], None)],
-                                 (self.left_up, self.right_up, self.right_down, self.left_down),
-                                 speed_constant = speed_constant)
-            behind_line_1 = Line(self.width, self.height, 1, [self.right_up[0] - thickness, self.lines[1].equation(self.right_up[0] - thickness, None)],
-                                 [self.right_down[0] - thickness, self.lines[2].equation(self.right_down[0] - thickness, None)],
-                                 (self.left_up, self.right_up, self.right_down, self.left_down),
-                                 speed_constant = speed_constant)
-
-
-            # 2 area (아래)
-            front_line_2 = Line(self.width, self.height, 2, [self.lines[2].equation(None, self.right_down[1]), self.right_down[1]],
-                                [self.lines[3].equation(None, self.left_down[1]), self.left_down[1]],
-                                (self.left_up, self.right_up, self.right_down, self.left_down),
-                                speed_constant = speed_constant)
-            behind_line_2 = Line(self.width, self.height, 2, [self.lines[2].equation(None, self.right_down[1] - thickness), self.right_down[1] - thickness],
-                                [self.lines[3].equation(None, self.left_down[1] - thickness), self.left_down[1] - thickness],
-                                 (self.left_up, self.right_up, self.right_down, self.left_down),
-                                 speed_constant = speed_constant)
-
-
-            # 3 area (왼쪽)
-            front_line_3 = Line(self.width, self.height, 3, [self.left_down[0], self.lines[3].equation(self.left_down[0], None)],
-                                 [self.left_up[0], self.lines[0].equation(self.left_up[0], None)],
-                                (self.left_up, self.right_up, self.right_down, self.left_down),
-                                speed_constant = speed_constant)
-            behind_line_3 = Line(self.width, self.height, 3, [self.left_down[0] + thickness, self.lines[3].equation(self.left_down[0] + thickness, None)],
-                                 [self.left_up[0] + thickness, self.lines[0].equation(self.left_up[0] + thickness, None)],
-                                 (self.left_up, self.right_up, self.right_down, self.left_down),
-                                 speed_constant = speed_constant)
-
-
-            self.side_areas[0].append((front_line_0, behind_line_0))
-            self.side_areas[1].append((front_line_1, behind_line_1))
-            self.side_areas[2].append((front_line_2, behind_line_2))
-            self.side_areas[3].append((front_line_3, behind_line_3))
-
-        self.side_areas[0] = [i for i in self.side_areas[0] if not (i[1].start_point[1] < 0 and i[1].end_point[1] < 0)]
-        self.side_areas[1] = [i for i in self.side_areas[1] if not (i[1].start_point[0] > self.width and i[1].end_point[0] > self.width)]
-        self.side_areas[2] = [i for i in self.side_areas[2] if not (i[1].start_point[1] > self.height and i[1].end_point[1] > self.height)]
-        self.side_areas[3] = [i for i in self.side_areas[3] if not (i[1].start_point[0] < 0 and i[1].end_point[0] < 0)]
-
-    def move_stripe(self):
+            self.serve_area_cooldown -= cooldown
+
+            self.stripe_thickness = thickness
+            # 네 옆면에 하나씩, 같은 시각에 나옴
+            self.stripe_spawns = np.append(self.stripe_spawns, np.full(4, float(self.stripe_time)))
+            self.stripe_areas = np.append(self.stripe_areas, np.arange(4))
+
+        # 뒤쪽 선까지 화면 밖으로 나간 줄무늬는 버림
+        if len(self.stripe_spawns):
+            table = self.stripe_table[:, self.stripe_areas]
+            behind = self.stripe_positions(table)[1]
+            alive = table[STRIPE_SIGN] * behind <= table[STRIPE_LIMIT]
+            if not alive.all():
+                self.stripe_spawns, self.stripe_areas = self.stripe_spawns[alive], self.stripe_areas[alive]
+
+    def make_stripe_table(self, speed_constant):
+        """
+        Per side area (columns 0 top, 1 right, 2 bottom, 3 left), one row per
+        STRIPE_* index. A stripe starts on an edge of the inner square and
+        accelerates by that side's distance to the screen border / speed_constant,
+        like a wall edge. Its ends lie on the tunnel corner lines: x = (c - b) / m
+        for the horizontal stripes and y = (m * c + b) / 1 for the vertical ones,
+        written as (c * P + Q) / R so both come out exactly as Line.equation().
+        """
+        table = np.zeros((STRIPE_ROWS, 4))
+        table[STRIPE_SIGN] = STRIPE_DIRECTION
+        table[STRIPE_START] = self.left_up[1], self.right_up[0], self.right_down[1], self.left_down[0]
+        table[STRIPE_ACCELERATION] = (self.left_up[1] / speed_constant, (self.width - self.right_up[0]) / speed_constant,
+                                      (self.height - self.right_down[1]) / speed_constant, self.left_down[0] / speed_constant)
+        table[STRIPE_LIMIT] = 0, self.width, self.height, 0
+        table[STRIPE_HORIZONTAL] = 1, 0, 1, 0
         for number in range(4):
-            for area in self.side_areas[number]:
-                area[0].update(self.lines[number % 4], self.middle_lines[number % 4], self.lines[(number + 1) % 4])
-                area[1].update(self.lines[number % 4], self.middle_lines[number % 4], self.lines[(number + 1) % 4])
+            for row, line in ((STRIPE_START_LINE, self.lines[number]), (STRIPE_END_LINE, self.lines[(number + 1) % 4])):
+                if number % 2 == 0:
+                    table[row:row + 3, number] = 1, -line.y_intercept, line.slope
+                else:
+                    table[row:row + 3, number] = line.slope, line.y_intercept, 1
+        return table
 
-    def draw(self, screen):
+    def move_stripe(self, k=1):
+        self.stripe_time += k
+
+    def stripe_positions(self, table=None):
+        """
+        (front, behind) of every stripe: y of the horizontal lines in areas 0 and
+        2, x of the vertical ones in areas 1 and 3. Computed from the time since
+        each stripe was made, so nothing is integrated per tick.
+        """
+        if table is None:
+            table = self.stripe_table[:, self.stripe_areas]
+        sign, start = table[STRIPE_SIGN], table[STRIPE_START]
+        distance = sign * travelled(table[STRIPE_ACCELERATION], self.stripe_time - self.stripe_spawns)
+        return start + distance, (start - sign * self.stripe_thickness) + distance
+
+    def stripe_quads(self):
+        """(N, 4, 2): 앞 선 시작, 앞 선 끝, 뒤 선 끝, 뒤 선 시작"""
+        quads = np.empty((len(self.stripe_spawns), 4, 2))
+        if len(quads) == 0:
+            return quads
+        table = self.stripe_table[:, self.stripe_areas]
+        coords = np.stack(self.stripe_positions(table))
+        horizontal = table[STRIPE_HORIZONTAL] == 1
+
+        for row, corners in ((STRIPE_START_LINE, (0, 3)), (STRIPE_END_LINE, (1, 2))):
+            other = (coords * table[row] + table[row + 1]) / table[row + 2]
+            x, y = np.where(horizontal, other, coords), np.where(horizontal, coords, other)
+            for line, corner in enumerate(corners):     # 0: 앞 선, 1: 뒤 선
+                quads[:, corner, 0] = x[line]
+                quads[:, corner, 1] = y[line]
+        return quads
+
+    def render_layers(self):
+        """
+        Everything but the stripes, drawn once: `under` (background color, side
+        faces, grid lines) covers the whole screen, `over` (inner square, corner
+        lines, edges) is a colorkey layer drawn on top of the stripes.
+        """
+        under = pygame.Surface((self.width, self.height))
+        over = pygame.Surface((self.width, self.height))
+        if pygame.display.get_surface() is not None:
+            under, over = under.convert(), over.convert()
+
+        under.fill(self.main_color)
         for area in self.main_areas:
-            pygame.draw.polygon(screen, self.main_color, area)
+            pygame.draw.polygon(under, self.main_color, area)
         for lines in self.background_line:
             for line in lines:
-                line.draw(screen)
-        for areas in self.side_areas:
-            for area in areas:
-                pygame.draw.polygon(screen, self.side_color, (area[0].start_point, area[0].end_point, area[1].end_point, area[1].start_point))
-        pygame.draw.polygon(screen, (150, 150, 150), (self.left_up, self.right_up, self.right_down, self.left_down))
+                line.draw(under)
+
+        key = (0, 0, 0) if (0, 0, 0) not in (tuple(self.base_color), (150, 150, 150)) else (255, 0, 255)
+        over.fill(key)
+        pygame.draw.polygon(over, (150, 150, 150), (self.left_up, self.right_up, self.right_down, self.left_down))
         for line in self.lines:
-            line.draw(screen)
+            line.draw(over)
         for line in self.edge:
-            line.draw(screen)
-
-
-
-class Particle:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.lifetime = random.randint(30, 60)  # 파편 수명
-        self.angle = random.uniform(0, 2 * math.pi)  # 방사형 방향
-        self.speed = random.uniform(2, 6)  # 파편 속도
-        self.color = random.choice([(255, 100, 0), (255, 200, 50), (200, 50, 0)])  # 불꽃 색상
-        self.radius = random.randint(2, 5)
-
-    def update(self):
-        self.x += math.cos(self.angle) * self.speed
-        self.y += math.sin(self.angle) * self.speed
-        self.lifetime -= 1  # 수명 감소
-
-    def draw(self, screen, shake_x, shake_y):
-        if self.lifetime > 0:
-            pygame.draw.circle(screen, self.color, (int(self.x + shake_x), int(self.y + shake_y)), self.radius)
-
-
-
-class Explosion:
-    def __init__(self, x, y, number):
-        self.particles = [Particle(x, y) for _ in range(number)]  # 50개의 파편 생성
+            line.draw(over)
+        over.set_colorkey(key, pygame.RLEACCEL)
+        return under, over
 
-    def update(self):
-        self.particles = [p for p in self.particles if p.lifetime > 0]  # 살아있는 파편만 유지
-        for p in self.particles:
-            p.update()
+    def draw(self, screen):
+        if self.layers is None:
+            self.layers = self.render_layers()
+        under, over = self.layers
 
-    def draw(self, screen, shake_x, shake_y):
-        for p in self.particles:
-            p.draw(screen, shake_x, shake_y)
+        screen.blit(under, (0, 0))
+        for quad in self.stripe_quads().tolist():
+            pygame.draw.polygon(screen, self.side_color, quad)
+        screen.blit(over, (0, 0))
 
 
 
@@ -1030,12 +1151,12 @@ class ScreenShake:
         """ 흔들림 시작 """
         self.shake_duration = duration
 
-    def update(self):
+    def update(self, k=1):
         """ 흔들림 업데이트 (지속 시간 동안 화면을 랜덤 이동) """
         if self.shake_duration > 0:
             self.offset_x = random.randint(-self.shake_intensity, self.shake_intensity)
             self.offset_y = random.randint(-self.shake_intensity, self.shake_intensity)
-            self.shake_duration -= 1  # 흔들림 지속 시간 감소
+            self.shake_duration -= k  # 흔들림 지속 시간 감소
         else:
             self.offset_x = 0
             self.offset_y = 0
@@ -1063,13 +1184,13 @@ class SignalLight:
 
         self.supports_space_proportion = self.supports_size[0] / (self.supports[1].left - self.supports[0].right)
 
-    def move(self):
-        self.speed += self.speed_constant
+    def move(self, k=1):
+        distance, self.speed = accelerate(self.speed, self.speed_constant, k)
 
         self.supports = [
-            pygame.Rect(self.lines[0].equation(None, self.supports[0].top - self.speed) - self.supports_size[0], self.supports[0].top - self.speed,
+            pygame.Rect(self.lines[0].equation(None, self.supports[0].top - distance) - self.supports_size[0], self.supports[0].top - distance,
                         self.supports_size[0], self.supports_size[1]),
-            pygame.Rect(self.lines[1].equation(None, self.supports[1].top - self.speed), self.supports[1].top - self.speed,
+            pygame.Rect(self.lines[1].equation(None, self.supports[1].top - distance), self.supports[1].top - distance,
                         self.supports_size[0], self.supports_size[1])
         ]
 
@@ -1113,6 +1234,14 @@ class SignalLight:
 
 
 
+def preload(width, height):
+    """씬 전환 중 백그라운드에서 호출됨 - 폰트, 비행선 이미지, 리더보드를 미리 준비"""
+    for size in (height / 15, height / 30, height / 45):
+        assets.font("data/fonts/SairaCondensed-Light.ttf", int(size))
+    assets.image("data/Airship/imgs/1.png", (200 * 2, 200))
+    leaderboard.load()
+
+
 # Run standalone
 if __name__ == "__main__":
     pygame.init()
@@ -4,7 +4,12 @@ import sys
 import math
 
 from collections import deque
-from localLibraries.PlayCoreLibraries import ScreenObject, fade_out, blit_fps
+from localLibraries.PlayCoreLibraries import ScreenObject
+from localLibraries.AssetManager import assets
+from localLibraries.SaveStore import saves
+from localLibraries.FrameProfiler import FrameProfiler
+from localLibraries.NumberRenderer import NumberRenderer
+from localLibraries.DirtyRectRenderer import DirtyRectRenderer
 
 class AvoidMineMainScreen(ScreenObject):
     def __init__(self, width, height, show_fps=False):
@@ -12,23 +17,20 @@ class AvoidMineMainScreen(ScreenObject):
 
         self.show_fps = show_fps
 
-        self.h1 = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height / 15))
+        self.profiler = FrameProfiler(show_fps)
+
+        self.h1 = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height / 15))
         self.h1_size = self.h1.size("")
 
-        self.p = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height / 30))
+        self.p = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height / 30))
         self.p_size = self.p.size("")
 
-        self.psmall = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height / 45))
+        self.psmall = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height / 45))
         self.psmall_size = self.psmall.size("")
 
-        ### file data ###
-        # 0: highest score
-
-        # Reading from a text file
-        with open("data/AvoidMine/playdata/saves.txt", "r") as file:
-            file_data = file.read().split('\n')
+        ### Save data ###
 
-        self.best_score = int(file_data[0])
+        self.best_score = saves.get("AvoidMine", "best", 0)
         self.curr_score = 0
 
         ### Colors ###
@@ -98,6 +100,11 @@ class AvoidMineMainScreen(ScreenObject):
                         self.psmall.size("Remasterd by Yuesung Jang")[0] / 2]
         }
         self.high_score = 0 #선언만 하는 것임
+
+        # 점수처럼 매 프레임 바뀌는 숫자는 글리프를 조합 (값이 같으면 지난 Surface 재사용)
+        self.score_text = NumberRenderer(self.h1, self.white)
+        self.ingame_score_text = NumberRenderer(self.h1, (0, 0, 0))
+        self.best_text = NumberRenderer(self.p, self.text_color, prefix="Best ")
         self.texts_index = ['game_over', 'restart', 'title', 'start', 'quit', 'credit1', 'credit2']
 
     def reset(self):
@@ -196,8 +203,8 @@ class AvoidMineMainScreen(ScreenObject):
                                                  self.height / 5 * 2 - self.h1_size[1] - self.main_menu_scroll))
 
         # score
-        res_score = self.h1.render(f"{self.curr_score}", True, self.white)
-        screen.blit(res_score, (self.width / 2 - self.h1.size(f"{self.curr_score}")[0] / 2,
+        res_score = self.score_text.render(self.curr_score)
+        screen.blit(res_score, (self.width / 2 - res_score.get_width() / 2,
                                 self.height / 2 - self.h1_size[1] / 2 - self.main_menu_scroll / 2))
 
         # restart game
@@ -219,8 +226,8 @@ class AvoidMineMainScreen(ScreenObject):
                                              self.height / 7 * 2 - self.h1_size[1] - self.main_menu_scroll))
 
         # high score
-        self.high_score = self.p.render(f"Best {self.best_score}", True, (75, 75, 75))
-        screen.blit(self.high_score, (self.width / 2 - self.p.size(f"Best {self.best_score}")[0] / 2,
+        self.high_score = self.best_text.render(self.best_score)
+        screen.blit(self.high_score, (self.width / 2 - self.high_score.get_width() / 2,
                                  self.height / 10 * 3 + self.main_menu_scroll))
 
         # start game
@@ -269,15 +276,12 @@ class AvoidMineMainScreen(ScreenObject):
                 }
 
     def blit_ingame(self, screen):
-        score = self.h1.render(f"{self.curr_score}", True, (0, 0, 0))
-        screen.blit(score, (self.width / 2 - self.h1.size(f"{self.curr_score}")[0] / 2, self.height / 2 - self.h1_size[1] / 2))
+        score = self.ingame_score_text.render(self.curr_score)
+        screen.blit(score, (self.width / 2 - score.get_width() / 2, self.height / 2 - self.h1_size[1] / 2))
 
     def load_screen(self, target):
         if target == 0:
-            self.best_score = max(self.best_score, self.curr_score)
-            # Writing to a text file
-            with open("data/AvoidMine/playdata/saves.txt", "w") as file:
-                file.write(f"{self.best_score}\n")
+            self.best_score = saves.get("AvoidMine", "best", 0)
 
             self.reset()
             self.state = 0
@@ -293,6 +297,7 @@ class AvoidMineMainScreen(ScreenObject):
             ### Game Over ###
             self.state = 2
             self.shake_tick = 25 * self.height / 1280
+            saves.update_best("AvoidMine", self.curr_score)
 
             self.last_scrollx = self.scrollx
             self.last_scrolly = self.scrolly
@@ -366,20 +371,29 @@ class AvoidMineMainScreen(ScreenObject):
         2: gameover
         """
 
+        # 메뉴에서 빛이 멈춘 뒤엔 클릭 원/홀드 원호만 바뀜 -> 그 부분만 업로드
+        renderer = DirtyRectRenderer((self.width, self.height))
+        prev_state = None
+        drawn_texts = None
+
         while self.running:
+            self.profiler.begin_frame()
             screen.fill((75, 75, 75))
 
+            self.profiler.mark("draw")
+
             dt_ms = clock.tick(60)
+            self.profiler.idle()
 
             dt = dt_ms / 1000.0
 
             if mouse_down:
                 mouse_down_frames += 1
                 if mouse_down_frames >= 60:
-                    pygame.draw.arc(screen, (255, 255, 255),
+                    renderer.mark(pygame.draw.arc(screen, (255, 255, 255),
                                     (pygame.mouse.get_pos()[0] - self.height / 60,
                                      pygame.mouse.get_pos()[1] - self.height / 60, self.height / 60 * 2, self.height / 60 * 2),
-                                    math.radians(0), math.radians(min(mouse_down_frames * 2 - 120, 360)), max(int(self.height/200), 1))
+                                    math.radians(0), math.radians(min(mouse_down_frames * 2 - 120, 360)), max(int(self.height/200), 1)))
             else:
                 mouse_up_frames += 1
 
@@ -409,6 +423,7 @@ class AvoidMineMainScreen(ScreenObject):
                     mouse_down = False
                     mouse_down_frames = 0
                     mouse_up_frames = 0
+            self.profiler.mark("events")
 
 
             if self.state == 0:
@@ -417,15 +432,23 @@ class AvoidMineMainScreen(ScreenObject):
 
                 ### Blit Effects ###
 
+                light_moving = self.light.speed != 0
+                texts = self.texts
+
                 for circle in self.circle_effects:
                     circle.update()
-                    circle.draw(screen)
+                    renderer.mark(circle.draw(screen))
 
                     if circle.size > circle.target:
                         self.circle_effects.remove(circle)
 
                 self.blit_menu(screen)
 
+                # 빛이 돌거나 텍스트 색이 바뀐 프레임은 전체
+                if light_moving or texts is not drawn_texts:
+                    renderer.mark_full()
+                drawn_texts = texts
+
 
                 ### Blit Player ###
 
@@ -489,11 +512,15 @@ class AvoidMineMainScreen(ScreenObject):
 
                 self.blit_game_over(screen)
 
+            if self.state != 0 or self.state != prev_state:
+                renderer.mark_full()
+            prev_state = self.state
+
             # Show FPS if needed
-            if self.show_fps:
-                blit_fps(screen, clock)
+            renderer.mark(self.profiler.draw(screen, clock))
 
-            pygame.display.flip()
+            renderer.present()
+            self.profiler.mark("flip")
 
 class AvoidMineScreen(ScreenObject):
     def __init__(self, width, height, show_fps=False):
@@ -506,9 +533,8 @@ class AvoidMineScreen(ScreenObject):
         while running:
             curr_AvoidMine_screen = AvoidMineMainScreen(self.width, self.height, show_fps=self.show_fps)
             next_screen, curr_screen_surface = curr_AvoidMine_screen.loop(screen)
-            pygame.time.wait(2000)
-            fade_out(screen, curr_screen_surface, self.width, self.height, 2000)
-            return 0, screen
+            # 대기 + 페이드 아웃은 main.py가 다음 씬 로드와 겹쳐서 처리
+            return 0, curr_screen_surface
 
 
 
@@ -537,16 +563,17 @@ class CircleEffect:
                 self.color[i] = min(self.color[i], 255)
 
     def draw(self, screen, scrollx=0, scrolly=0):
-        pygame.draw.circle(screen, self.color, (self.x - scrollx, self.y - scrolly), self.size, self.width)
+        return pygame.draw.circle(screen, self.color, (self.x - scrollx, self.y - scrolly), self.size, self.width)
 
 
 
 class Mine:
+    image_path = "data/AvoidMine/imgs/trap_mine.png"
+
     def __init__(self, location, size):
         self.location, self.size = location, size
         self.distance, self.image_number = 0, 1
-        self.image_1 = pygame.transform.scale(pygame.image.load("data/AvoidMine/imgs/trap_mine.png"), (self.size, self.size))
-        self.image_2 = pygame.transform.scale(pygame.image.load("data/AvoidMine/imgs/trap_mine.png"), (self.size, self.size))
+        self.image_1 = self.image_2 = assets.image(self.image_path, (self.size, self.size))
 
     def check(self):
         mouse_pos_x, mouse_pos_y = pygame.mouse.get_pos()
@@ -567,20 +594,17 @@ class Mine:
 
 
 class TrapMine(Mine): #건들면 게임 오버
-    def __init__(self, location, size):
-        super().__init__(location, size)
-        self.image_1 = pygame.transform.scale(pygame.image.load("data/AvoidMine/imgs/trap_mine.png"), (self.size, self.size))
-        self.image_2 = pygame.transform.scale(pygame.image.load("data/AvoidMine/imgs/trap_mine.png"), (self.size, self.size))
+    image_path = "data/AvoidMine/imgs/trap_mine.png"
 
 
 
 class ScoreMine(Mine): #건들면 점수 얻음
+    image_path = "data/AvoidMine/imgs/score_mine.png"
+
     def __init__(self, screen_width, screen_height, location, size):
         self.screen_width = screen_width
         self.screen_height = screen_height
         super().__init__(location, size)
-        self.image_1 = pygame.transform.scale(pygame.image.load("data/AvoidMine/imgs/score_mine.png"), (self.size, self.size))
-        self.image_2 = pygame.transform.scale(pygame.image.load("data/AvoidMine/imgs/score_mine.png"), (self.size, self.size))
 
     def give_score(self, score, mine):
         if mine.check():
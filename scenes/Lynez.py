@@ -1,18 +1,164 @@
 import pygame
 import random
 import math
+import bisect
 import sys
-from collections import deque
-from localLibraries.PlayCoreLibraries import ScreenObject, fade_in, fade_out, blit_fps
+from localLibraries.PlayCoreLibraries import ScreenObject
+from localLibraries.Transitions import run_transition, Sequence, FadeIn, Hold, FadeOut
+from localLibraries.AssetManager import assets
+from localLibraries.SaveStore import saves
+from localLibraries.Leaderboard import leaderboard, rank_label
+from localLibraries.FrameProfiler import FrameProfiler
+from localLibraries.NumberRenderer import NumberRenderer
+from localLibraries.FixedTimestep import FixedTimestep
+from localLibraries.ParticleSystem import ParticleSystem
+from localLibraries.Trail import Trail
 import numpy as np
 
+# 게임 상수는 모두 60Hz 한 틱 기준 -> 다른 틱 레이트에선 k = 60 / tick_rate 배로 진행
+BASE_RATE = 60
+
+# 충돌 후보가 이만큼 이상이면 NumPy로 한 번에 검사 (적으면 ufunc 호출 비용이 더 큼, bench micro kernel 참고)
+BATCH_MIN = 40
+
+def approach(rate, k):
+    """매 틱 남은 거리의 rate만큼 다가가는 보간을 k틱 분량으로 환산"""
+    return rate if k == 1 else 1 - (1 - rate) ** k
+
+def lerp(a, b, t):
+    return a + (b - a) * t
+
+class LineIndex:
+    """
+    Lines kept in insertion order, bucketed into horizontal bands `band` px tall.
+
+    A line is registered in every band its bounding box touches, so query() only
+    looks at lines in the bands covered by the player's swept box instead of the
+    whole list. Keys grow with each append, and query() returns keys in
+    insertion order.
+
+    Endpoints are also kept as rows of one NumPy array (rows of discarded lines
+    are reused), so the batch hit test gathers its candidates with one index.
+    """
+    def __init__(self, band):
+        self.band = band
+        self.lines = {}     # key -> line (dict 순서 = 추가된 순서)
+        self.boxes = {}     # key -> (min_x, min_y, max_x, max_y)
+        self.buckets = {}   # band 번호 -> key 목록 (정렬 상태 유지)
+        self.next_key = 0
+        
+        self.ends = np.zeros((64, 4))   # row -> (Ax, Ay, Bx, By)
+        self.rows = {}                  # key -> row
+        self.free_rows = []
+    
+    def __len__(self):
+        return len(self.lines)
+    
+    def __iter__(self):
+        return iter(self.lines.values())
+    
+    def items(self):
+        return self.lines.items()
+    
+    def _bands(self, min_y, max_y):
+        return range(math.floor(min_y / self.band), math.floor(max_y / self.band) + 1)
+    
+    def append(self, line):
+        key = self.next_key
+        self.next_key += 1
+        (x1, y1), (x2, y2) = line
+        box = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        self.lines[key] = line
+        self.boxes[key] = box
+        for band in self._bands(box[1], box[3]):
+            self.buckets.setdefault(band, []).append(key)   # key가 계속 커지므로 append만 해도 정렬됨
+        
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            row = len(self.rows)
+            if row == len(self.ends):
+                self.ends = np.concatenate([self.ends, np.zeros_like(self.ends)])
+        self.ends[row] = (x1, y1, x2, y2)
+        self.rows[key] = row
+        return key
+    
+    def extend(self, lines):
+        for line in lines:
+            self.append(line)
+    
+    def discard(self, key):
+        if key not in self.lines:
+            return
+        del self.lines[key]
+        self.free_rows.append(self.rows.pop(key))
+        box = self.boxes.pop(key)
+        for band in self._bands(box[1], box[3]):
+            bucket = self.buckets[band]
+            del bucket[bisect.bisect_left(bucket, key)]
+            if not bucket:
+                del self.buckets[band]
+    
+    def clear(self):
+        self.lines.clear()
+        self.boxes.clear()
+        self.buckets.clear()
+        self.rows.clear()
+        self.free_rows.clear()
+    
+    def endpoints(self, keys):
+        """keys 순서대로 (n, 4) 배열 [Ax, Ay, Bx, By]"""
+        return self.ends[[self.rows[key] for key in keys]]
+    
+    def query(self, x1, y1, x2, y2):
+        """(x1, y1)-(x2, y2) 상자와 bounding box가 겹치는 선들의 key (추가된 순서)"""
+        min_x, max_x = (x1, x2) if x1 <= x2 else (x2, x1)
+        min_y, max_y = (y1, y2) if y1 <= y2 else (y2, y1)
+        bands = self._bands(min_y, max_y)
+        if len(bands) == 1:
+            keys = self.buckets.get(bands[0], ())
+        else:
+            keys = sorted({key for band in bands for key in self.buckets.get(band, ())})
+        
+        boxes = self.boxes
+        hits = []
+        for key in keys:
+            bx1, by1, bx2, by2 = boxes[key]
+            if bx1 <= max_x and min_x <= bx2 and by1 <= max_y and min_y <= by2:
+                hits.append(key)
+        return hits
+    
+    def discard_below(self, y):
+        """bounding box 전체가 y보다 아래(y가 더 큼)에 있는 선을 모두 버림"""
+        if not self.buckets:
+            return 0
+        dropped = 0
+        for band in range(math.floor(y / self.band), max(self.buckets) + 1):
+            for key in list(self.buckets.get(band, ())):
+                if self.boxes[key][1] > y:
+                    self.discard(key)
+                    dropped += 1
+        return dropped
+
 class Lines:
-    def __init__(self, color_bright, width, radius, circle_width):
-        self.lines_list = []
+    """
+    The platforms the player draws and bounces off.
+
+    A line never changes once added, so instead of being drawn every frame (twice,
+    with the shadow pass) each line is drawn once per color into a small colorkey
+    sprite the first time it is on screen, and a pass is a single blits() of the
+    visible sprites. Sprites of lines that left the screen are dropped. Lines are
+    drawn at whole-pixel world positions, so they may land up to 1px away from
+    the old per-frame drawing.
+    """
+    def __init__(self, color_bright, width, radius, circle_width, band):
+        self.lines_list = LineIndex(band)
         self.color_bright = color_bright
         self.width =  max(int(width), 1)
         self.radius = radius
         self.circle_width = max(int(circle_width), 1)
+        
+        self.sprites = {}   # color -> {선 key: (sprite, 월드 x, 월드 y)}
     
     def adj_line(self, A, y):
         return ((A[0][0], A[0][1]+y), (A[1][0], A[1][1]+y))
@@ -20,50 +166,70 @@ class Lines:
     def adj_pos(self, A, x, y):
         return (A[0]-x, A[1]-y)
     
-    def draw(self, screen, scrollx, scrolly, height):
-        for line in self.lines_list:
-            nPos1 = self.adj_pos(line[0], scrollx, scrolly)
-            nPos2 = self.adj_pos(line[1], scrollx, scrolly)
-            pygame.draw.circle(screen, self.color_bright, nPos1, self.radius,self.circle_width)
-            pygame.draw.circle(screen, self.color_bright, nPos2, self.radius,self.circle_width)
-            pygame.draw.line(screen, self.color_bright, nPos1, nPos2, self.width)
-            
-            if nPos1[1] > height * 1.2 + 1000 and nPos2[1] > height * 1.2 + 1000:
-                self.lines_list.remove(line)
-        
-    def draw_dark(self, screen, scrollx, scrolly, color):
-        for line in self.lines_list:
-            nPos1 = self.adj_pos(line[0], scrollx, scrolly)
-            nPos2 = self.adj_pos(line[1], scrollx, scrolly)
-            pygame.draw.circle(screen, color, nPos1, self.radius,self.circle_width)
-            pygame.draw.circle(screen, color, nPos2, self.radius,self.circle_width)
-            pygame.draw.line(screen, color, nPos1, nPos2, self.width)
-        
-class PlayerParticle:
-    def __init__(self, x, y, speedx, speedy, size, dissolve, color):
-        self.x = x
-        self.y = y
-        self.speedx = speedx
-        self.speedy = speedy
-        self.size = size
-        self.dissolve = dissolve
-        self.color = color
+    def add(self, line):
+        return self.lines_list.append(line)
     
-    def update(self):
-        self.size -= self.dissolve
-        self.x += self.speedx
-        self.y -= self.speedy
+    def reset(self, lines):
+        self.lines_list.clear()
+        self.sprites.clear()
+        self.lines_list.extend(lines)
     
-    def draw(self, screen, scrollx, scrolly):
-        pygame.draw.circle(screen, self.color,
-                        Lines.adj_pos(None, (int(self.x-self.size/4), int(self.y-self.size/4)), scrollx, scrolly),
-                        self.size)
+    def prune(self, scrolly, height):
+        """
+        Drops lines that can never be on screen again. The view only moves up
+        while playing, and the game-over pan moves it back down by at most 1000,
+        so anything entirely below scrolly + height*1.2 + 1000 is gone for good.
+        """
+        return self.lines_list.discard_below(scrolly + height * 1.2 + 1000)
     
-    def draw_dark(self, screen, scrollx, scrolly, color):
-        pygame.draw.circle(screen, color,
-                        Lines.adj_pos(None, (int(self.x-self.size/4), int(self.y-self.size/4)), scrollx, scrolly),
-                        self.size)
+    ### Sprites ###
     
+    def build_sprite(self, color, line):
+        x1, y1 = math.floor(line[0][0]), math.floor(line[0][1])
+        x2, y2 = math.floor(line[1][0]), math.floor(line[1][1])
+        pad = int(self.radius) + self.width + 1
+        left, top = min(x1, x2) - pad, min(y1, y2) - pad
+        
+        key = (0, 0, 0) if tuple(color) != (0, 0, 0) else (255, 255, 255)
+        sprite = pygame.Surface((abs(x2 - x1) + 2 * pad + 1, abs(y2 - y1) + 2 * pad + 1))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()   # RLE blit은 화면과 같은 포맷일 때만 빠름
+        sprite.fill(key)
+        pos1, pos2 = (x1 - left, y1 - top), (x2 - left, y2 - top)
+        pygame.draw.circle(sprite, color, pos1, self.radius, self.circle_width)
+        pygame.draw.circle(sprite, color, pos2, self.radius, self.circle_width)
+        pygame.draw.line(sprite, color, pos1, pos2, self.width)
+        sprite.set_colorkey(key, pygame.RLEACCEL)
+        return sprite, left, top
+    
+    def blit_lines(self, screen, scrollx, scrolly, color):
+        margin = self.radius + self.width
+        width, height = screen.get_size()
+        keys = self.lines_list.query(scrollx - margin, scrolly - margin, scrollx + width + margin, scrolly + height + margin)
+        
+        sprites = self.sprites.setdefault(color, {})
+        lines = self.lines_list.lines
+        sx, sy = math.floor(scrollx), math.floor(scrolly)
+        blits = []
+        for key in keys:
+            entry = sprites.get(key)
+            if entry is None:
+                entry = sprites[key] = self.build_sprite(color, lines[key])
+            blits.append((entry[0], (entry[1] - sx, entry[2] - sy)))
+        screen.blits(blits, doreturn=False)
+        
+        if len(sprites) > 2 * len(keys) + 16:
+            # 화면을 벗어난 선의 스프라이트 정리 (다시 보이면 새로 만듦)
+            visible = set(keys)
+            for key in [key for key in sprites if key not in visible]:
+                del sprites[key]
+    
+    def draw(self, screen, scrollx, scrolly):
+        self.blit_lines(screen, scrollx, scrolly, self.color_bright)
+        
+    def draw_dark(self, screen, scrollx, scrolly, color):
+        self.blit_lines(screen, scrollx, scrolly, color)
+        
 class Player:
     def __init__(self, x, y, speedx, speedy, size, color, height):
         self.x = x
@@ -76,6 +242,7 @@ class Player:
         self.height = height
         self.gravity = 0.15 * self.adj_constant
         self.reaction = 0
+        self.prev = (x, y)
     
     def point_line_distance(self, A, B, C):
         A_coeff = B[1] - A[1]
@@ -159,45 +326,119 @@ class Player:
                     return True
                 return False
     
-    def check_collitions(self, A, B, prev_player_pos):
-        if self.segments_intersect(prev_player_pos, (self.x, self.y), A, B):
+    def hit_time(self, A, B, prev_player_pos):
+        """이동 구간(이전 위치 0 -> 현재 위치 1)에서 선 AB의 직선과 만나는 지점 (평행하면 0)"""
+        dx = self.x - prev_player_pos[0]
+        dy = self.y - prev_player_pos[1]
+        ex = B[0] - A[0]
+        ey = B[1] - A[1]
+        denom = dx * ey - dy * ex
+        if denom == 0:
+            return 0.0
+        return ((A[0] - prev_player_pos[0]) * ey - (A[1] - prev_player_pos[1]) * ex) / denom
+    
+    def first_hit_scalar(self, lines, prev_player_pos):
+        best, best_t = None, None
+        for i, (A, B) in enumerate(lines):
+            if A[0] == B[0] and A[1] == B[1]:
+                continue  # 길이 0인 선 (시작 지점 표시, 끌지 않은 클릭)은 튕길 방향이 없음
+            if self.segments_intersect(prev_player_pos, (self.x, self.y), A, B) and self.check_side(A, B, prev_player_pos):
+                t = self.hit_time(A, B, prev_player_pos)
+                if best is None or t < best_t:
+                    best, best_t = i, t
+        return best
+    
+    def first_hit_batch(self, ends, prev_player_pos):
+        """
+        first_hit_scalar over an (n, 4) array of [Ax, Ay, Bx, By] rows.
+
+        The orientation tests of segments_intersect run on the whole array, with
+        the same operations in the same order as ccw(), so they come out bit for
+        bit the same. The few lines that cross the path then go through the
+        scalar check_side / hit_time.
+        """
+        ax, ay, bx, by = ends[:, 0], ends[:, 1], ends[:, 2], ends[:, 3]
+        px, py = prev_player_pos
+        cx, cy = self.x, self.y
+        
+        d1 = (cx - px) * (ay - py) - (cy - py) * (ax - px)   # ccw(p1, p2, A)
+        d2 = (cx - px) * (by - py) - (cy - py) * (bx - px)   # ccw(p1, p2, B)
+        d3 = (bx - ax) * (py - ay) - (by - ay) * (px - ax)   # ccw(A, B, p1)
+        d4 = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)   # ccw(A, B, p2)
+        crossing = (d1 * d2 < 0) & (d3 * d4 < 0)
+        
+        touching = (d1 == 0) | (d2 == 0) | (d3 == 0) | (d4 == 0)
+        point = (ax == bx) & (ay == by)
+        if point.any():
+            crossing &= ~point
+            touching &= ~point
+        if touching.any():
+            # 끝점이 경로 위에 있거나 평행한 경우 (드묾) -> 그 선들만 on_segment까지 스칼라로
+            rows = np.flatnonzero(touching & ~crossing)
+            for i, (x1, y1, x2, y2) in zip(rows.tolist(), ends[rows].tolist()):
+                crossing[i] = self.segments_intersect(prev_player_pos, (cx, cy), (x1, y1), (x2, y2))
+        
+        best, best_t = None, None
+        rows = np.flatnonzero(crossing)
+        for i, (x1, y1, x2, y2) in zip(rows.tolist(), ends[rows].tolist()):
+            A, B = (x1, y1), (x2, y2)
             if self.check_side(A, B, prev_player_pos):
-                self.x = prev_player_pos[0]
-                self.y = prev_player_pos[1]
-                self.speedx, self.speedy = self.reflect_velocity(A, B, -1 * self.speedx, self.speedy)
-                self.speedx *= -1
-                return True
-        
-        return False
+                t = self.hit_time(A, B, prev_player_pos)
+                if best is None or t < best_t:
+                    best, best_t = i, t
+        return best
     
-    def handle_collision(self, lines, prev_player_pos, lasers):
-        for line in lines:
-            if self.check_collitions(line[0], line[1], prev_player_pos):
-                break
+    def first_hit(self, index, keys, prev_player_pos):
+        """keys 중 이번 틱 이동 구간에서 가장 먼저 닿는 선의 key (없으면 None)"""
+        if len(keys) >= BATCH_MIN:
+            i = self.first_hit_batch(index.endpoints(keys), prev_player_pos)
+        else:
+            i = self.first_hit_scalar([index.lines[key] for key in keys], prev_player_pos)
+        return None if i is None else keys[i]
+    
+    def bounce(self, A, B, prev_player_pos):
+        self.x = prev_player_pos[0]
+        self.y = prev_player_pos[1]
+        self.speedx, self.speedy = self.reflect_velocity(A, B, -1 * self.speedx, self.speedy)
+        self.speedx *= -1
+    
+    def handle_collision(self, lines, prev_player_pos, lasers, k=1):
+        # 이번 틱에 지나간 구간의 상자와 겹치는 선만 정밀 검사, 그중 경로상 가장 먼저 닿는 선에서 튕김
+        keys = lines.query(prev_player_pos[0], prev_player_pos[1], self.x, self.y)
+        hit = self.first_hit(lines, keys, prev_player_pos)
+        if hit is not None:
+            A, B = lines.lines[hit]
+            self.bounce(A, B, prev_player_pos)
         
         for laser in lasers:
             if laser.charging or laser.frame_count < 180 or laser.frame_count > 200:
                 continue
             if self.x > laser.left and self.x < laser.right:
                 if self.x < laser.center:
-                    self.speedx -= 8 * self.adj_constant
+                    self.speedx -= 8 * self.adj_constant * k
                 else:
-                    self.speedx += 8 * self.adj_constant
+                    self.speedx += 8 * self.adj_constant * k
     
-    def update(self):
-        self.speedy -= self.gravity
+    def update(self, k=1):
+        self.prev = (self.x, self.y)
+        self.speedy -= self.gravity * k
         self.speedy = max(self.speedy, -8 * self.adj_constant)
-        self.x += self.speedx
-        self.y -= self.speedy
+        self.x += self.speedx * k
+        self.y -= self.speedy * k
     
-    def draw(self, screen, scrollx, scrolly):
+    def lerped(self, alpha):
+        return lerp(self.prev[0], self.x, alpha), lerp(self.prev[1], self.y, alpha)
+    
+    def draw(self, screen, scrollx, scrolly, alpha=1):
+        x, y = self.lerped(alpha)
         pygame.draw.circle(screen, self.color,
-                        Lines.adj_pos(None, (int(self.x-self.size/4), int(self.y-self.size/4)), scrollx, scrolly),
+                        Lines.adj_pos(None, (int(x-self.size/4), int(y-self.size/4)), scrollx, scrolly),
                         self.size)
     
-    def draw_dark(self, screen, scrollx, scrolly, color):
+    def draw_dark(self, screen, scrollx, scrolly, color, alpha=1):
+        x, y = self.lerped(alpha)
         pygame.draw.circle(screen, color,
-                        Lines.adj_pos(None, (int(self.x-self.size/4), int(self.y-self.size/4)), scrollx, scrolly),
+                        Lines.adj_pos(None, (int(x-self.size/4), int(y-self.size/4)), scrollx, scrolly),
                         self.size)
 
 class CircleEffect:
@@ -216,16 +457,32 @@ class CircleEffect:
             self.color = list(color)
             self.second = second
     
-    def update(self, step = 0.1, color_step=0.2):
-        self.size += self.target * step
+    def update(self, step = 0.1, color_step=0.2, k=1):
+        self.size += self.target * step * k
         
         if self.gradient:
+            color_step = approach(color_step, k)
             for i in range(3):
                 self.color[i] += int((self.second[i]-self.color[i]) * color_step)
                 self.color[i] = min(self.color[i], 255)
     
+    def on_screen(self, screen, x, y):
+        """고리가 화면에 한 픽셀이라도 걸치는지 (화면 밖이거나, 화면 전체가 고리 안쪽 구멍에 들어가면 False)"""
+        width, height = screen.get_size()
+        if x + self.size < 0 or x - self.size > width or y + self.size < 0 or y - self.size > height:
+            return False
+        if self.width > 0:
+            far_x = max(x, width - x)
+            far_y = max(y, height - y)
+            hole = self.size - self.width - 2
+            if hole > 0 and far_x * far_x + far_y * far_y < hole * hole:
+                return False
+        return True
+    
     def draw(self, screen, scrollx = 0, scrolly = 0):
-        pygame.draw.circle(screen, self.color, Lines.adj_pos(None, (self.x, self.y), scrollx, scrolly), self.size, self.width)
+        x, y = Lines.adj_pos(None, (self.x, self.y), scrollx, scrolly)
+        if self.on_screen(screen, x, y):
+            pygame.draw.circle(screen, self.color, (x, y), self.size, self.width)
 
 class Laser:
     def __init__(self, left, width, height, color, target_color, particle_color, screen_width):
@@ -243,29 +500,30 @@ class Laser:
         self.lines = []
         
         self.frame_count = 0
+        self.next_line = 0
         
         self.charging = True
         
-        self.particles = []
+        # 양쪽 벽에서 가운데 반대편으로 튀어 나가며 작아지는 파편
+        self.particles = ParticleSystem(particle_color, 100, gravity=height/2000, pull=0.025, decay=0.05, min_size=0.1)
     
     def zap(self):
         cnt = 50
         ramdoms = np.random.randn(1,100) + 1
         size = self.height/80
         margin = self.height/50
-        currY = size
+        currY = size + np.arange(cnt) * margin
         targetx1 = (self.right - self.left) * 1.5 + self.left
         targetx2 = self.left - (self.right - self.left) * 0.5
         
-        for i in range(cnt):
-            self.particles.append(LaserEffect(self.left + ramdoms[0][i+50]*self.height/100, currY, max(1, size*min(ramdoms[0][i],1.5)),
-                                            self.particle_color, targetx1, self.height/200, self.height/2000))
-            self.particles.append(LaserEffect(self.right + ramdoms[0][i]*self.height/100, currY, max(1,size*min(ramdoms[0][i+50],1.5)),
-                                            self.particle_color, targetx2, self.height/200, self.height/2000))
-            currY += margin
+        self.particles.emit_many(self.left + ramdoms[0][50:]*self.height/100, currY, vy=self.height/200,
+                                size=np.maximum(1, size*np.minimum(ramdoms[0][:50], 1.5)), target_x=targetx1)
+        self.particles.emit_many(self.right + ramdoms[0][:50]*self.height/100, currY, vy=self.height/200,
+                                size=np.maximum(1, size*np.minimum(ramdoms[0][50:], 1.5)), target_x=targetx2)
     
-    def update(self):
-        if self.frame_count == 180:
+    def update(self, k=1):
+        # frame_count는 60Hz 틱 단위 시간 (k만큼 진행)
+        if self.charging and self.frame_count >= 180:
             self.charging = False
             self.zap()
         
@@ -273,11 +531,11 @@ class Laser:
         
         for line in self.lines:
             line_x, color = line
-            new_line = line_x + 3 * self.adj_constant
+            new_line = line_x + 3 * self.adj_constant * k
             
-            new_color = (int(color[0] - (self.color[0] - self.target_color[0]) * 0.03),
-                        int(color[1] - (self.color[1] - self.target_color[1]) * 0.03),
-                        int(color[2] - (self.color[2] - self.target_color[2]) * 0.03))
+            new_color = (int(color[0] - (self.color[0] - self.target_color[0]) * 0.03 * k),
+                        int(color[1] - (self.color[1] - self.target_color[1]) * 0.03 * k),
+                        int(color[2] - (self.color[2] - self.target_color[2]) * 0.03 * k))
 
             if new_color[0] < 10:
                 continue
@@ -287,18 +545,16 @@ class Laser:
         
         self.lines = new_lines
         
-        for paricle in self.particles:
-            paricle.update()
-            if paricle.size <= 0.1:
-                self.particles.remove(paricle)
+        self.particles.update(k)
         
         if self.charging:
-            if self.frame_count % 10 == 0:
+            if self.frame_count >= self.next_line:
                 self.lines.append((0, self.color))
+                self.next_line += 10
         
-        self.frame_count += 1
+        self.frame_count += k
     
-    def draw(self, screen, scrollx, scrolly):
+    def draw(self, screen, scrollx, scrolly, alpha=1):
         if self.charging:
             pygame.draw.line(screen, self.color, (self.left-scrollx, 0), (self.left-scrollx, self.height), self.width)
             pygame.draw.line(screen, self.color, (self.right-scrollx, 0), (self.right-scrollx, self.height), self.width)
@@ -309,52 +565,38 @@ class Laser:
             pygame.draw.line(screen, line[1], (self.right - line[0]-scrollx, 0),
                             (self.right - line[0]-scrollx, self.height), self.width)
         
-        for paricle in self.particles:
-            paricle.draw(screen, scrollx, scrolly)
-
-class LaserEffect:
-    def __init__(self, x, y, size, color, targetx, speedy, gravity):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.dissolve_target = 0
-        self.color = color
-        self.targetx = targetx
-        self.speedy = speedy
-        self.gravity = gravity
-    
-    def update(self):
-        self.x += (self.targetx - self.x) * 0.025
-        self.y -= self.speedy
-        self.size += (self.dissolve_target - self.size) * 0.05
-        self.speedy -= self.gravity
-    
-    def draw(self, screen, scrollx, scrolly):
-        pygame.draw.circle(screen, self.color, Lines.adj_pos(None, (int(self.x), int(self.y)), scrollx, 0), self.size)
+        self.particles.draw(screen, scrollx, 0, alpha)
 
 class LynezMainScreen(ScreenObject):
-    def __init__(self, width, height, show_fps=False):
+    """
+    tick_rate: 시뮬레이션 틱/초 (고정), fps: 렌더링 상한 (0이면 제한 없음)
+    렌더링은 마지막 두 틱 사이를 보간해서 그림
+    """
+    def __init__(self, width, height, show_fps=False, tick_rate=BASE_RATE, fps=60, max_catchup=5):
         super().__init__(width, height)
         
         self.show_fps = show_fps
         
-        self.h1 = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height/15))
+        self.profiler = FrameProfiler(show_fps)
+        
+        self.fps = fps
+        self.timestep = FixedTimestep(tick_rate, max_catchup)
+        self.k = BASE_RATE / tick_rate
+        self.trail_len = max(2, round(50 / self.k))
+        self.particle_debt = 0.0
+        
+        self.h1 = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height/15))
         self.h1_size = self.h1.size("")
         
-        self.p = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height/30))
+        self.p = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height/30))
         self.p_size = self.p.size("")
         
-        self.psmall = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(height/45))
+        self.psmall = assets.font("data/fonts/SairaCondensed-Light.ttf", int(height/45))
         self.psmall_size = self.psmall.size("")
         
-        ### file data ###
-        # 0: highest score
+        ### Save data ###
         
-        # Reading from a text file
-        with open("data/Lynez/playdata/saves.txt", "r") as file:
-            file_data = file.read().split('\n')
-        
-        self.best_score = int(file_data[0])
+        self.best_score = saves.get("Lynez", "best", 0)
         self.curr_score = 0
         
         ### Colors ###
@@ -376,15 +618,16 @@ class LynezMainScreen(ScreenObject):
         
         self.scrollx = 0
         self.scrolly = 0
+        self.prev_scroll = (0, 0)
         
-        self.player_particles = []
+        self.player_particles = ParticleSystem(self.blue, 64, center_shift=0.25)
         self.circle_effects = []
         
-        self.lines = Lines(self.white, self.height/200, self.height/80, self.height/200)
-        self.lines.lines_list =[((0,height-self.height/400), (width,height-self.height/400)),
-                                ((width/2,height-self.height/400), (width/2,height-self.height/400))]
+        self.lines = Lines(self.white, self.height/200, self.height/80, self.height/200, self.height/8)
+        self.lines.reset([((0,height-self.height/400), (width,height-self.height/400)),
+                        ((width/2,height-self.height/400), (width/2,height-self.height/400))])
         
-        self.trail = deque()
+        self.trail = Trail(self.trail_len - 1)   # 틱이 끝났을 때 남는 점 수
 
         self.shake_tick = 0
         
@@ -413,6 +656,10 @@ class LynezMainScreen(ScreenObject):
                     self.psmall.size("Remasterd by Jiwon Yu")[0]/2]
         }
         
+        # 점수처럼 매 프레임 바뀌는 숫자는 글리프를 조합 (값이 같으면 지난 Surface 재사용)
+        self.score_text = NumberRenderer(self.h1, self.white)
+        self.best_text = NumberRenderer(self.p, self.white, prefix="Best ")
+        
         self.last_platform = 0
         self.last_pos = (width/2,height-self.height/400)
         
@@ -425,12 +672,14 @@ class LynezMainScreen(ScreenObject):
         
         self.scrollx = 0
         self.scrolly = 0
+        self.prev_scroll = (0, 0)
+        self.particle_debt = 0.0
         
         self.player_particles.clear()
         self.circle_effects.clear()
         
-        self.lines.lines_list = [((0,self.height-self.height/400), (self.width,self.height-self.height/400)),
-                    ((self.width/2,self.height-self.height/400), (self.width/2,self.height-self.height/400))]
+        self.lines.reset([((0,self.height-self.height/400), (self.width,self.height-self.height/400)),
+                        ((self.width/2,self.height-self.height/400), (self.width/2,self.height-self.height/400))])
 
         self.trail.clear()
 
@@ -445,36 +694,38 @@ class LynezMainScreen(ScreenObject):
         
         self.circle_effects_dead.clear()
     
-    def blit_game_over(self, screen):
-        self.main_menu_scroll += (0 - self.main_menu_scroll) * 0.075
+    def ease_menu_scroll(self):
+        self.main_menu_scroll += (0 - self.main_menu_scroll) * approach(0.075, self.k)
         if self.main_menu_scroll < 0.1:
             self.main_menu_scroll = 0
-        
+    
+    def blit_game_over(self, screen):
         # game over
         screen.blit(self.texts['game_over'][0], (self.width/2 - self.texts['game_over'][1],
                                                 self.height/5*2 - self.h1_size[1] - self.main_menu_scroll))
         
         # score
-        res_score = self.h1.render(f"{self.curr_score}", True, self.white)
-        screen.blit(res_score, (self.width/2 - self.h1.size(f"{self.curr_score}")[0]/2,
+        res_score = self.score_text.render(self.curr_score)
+        screen.blit(res_score, (self.width/2 - res_score.get_width()/2,
                                 self.height/2 - self.h1_size[1]/2 - self.main_menu_scroll/2))
         
+        # rank
+        if 'rank' in self.texts:
+            screen.blit(self.texts['rank'][0], (self.width/2 - self.texts['rank'][1],
+                                                self.height/2 + self.h1_size[1]/2 + self.main_menu_scroll/2))
+        
         # restart game
         screen.blit(self.texts['restart'][0], (self.width/2 - self.texts['restart'][1],
                                                 self.height/5*3 + self.main_menu_scroll))
     
     def blit_menu(self, screen):
-        self.main_menu_scroll += (0 - self.main_menu_scroll) * 0.075
-        if self.main_menu_scroll < 0.1:
-            self.main_menu_scroll = 0
-        
         # title
         screen.blit(self.texts['title'][0], (self.width/2 - self.texts['title'][1],
                                             self.height/5*2 - self.h1_size[1] - self.main_menu_scroll))
         
         # high score
-        high_score = self.p.render(f"Best {self.best_score}", True, self.white)
-        screen.blit(high_score, (self.width/2 - self.p.size(f"Best {self.best_score}")[0]/2,
+        high_score = self.best_text.render(self.best_score)
+        screen.blit(high_score, (self.width/2 - high_score.get_width()/2,
                                 self.height/5*3 + self.main_menu_scroll))
         
         # start game
@@ -493,16 +744,13 @@ class LynezMainScreen(ScreenObject):
                                             self.height/5*3 + self.p_size[1]*3 + self.psmall_size[1] + self.main_menu_scroll))
     
     def blit_ingame(self, screen):
-        score = self.h1.render(f"{self.curr_score}", True, self.white)
-        screen.blit(score, (self.width/2 - self.h1.size(f"{self.curr_score}")[0]/2,
+        score = self.score_text.render(self.curr_score)
+        screen.blit(score, (self.width/2 - score.get_width()/2,
                             self.height/2 - self.height/5 - self.h1_size[1]/2))
     
     def load_screen(self, target):
         if target == 0:
-            self.best_score = max(self.best_score, self.curr_score)
-            # Writing to a text file
-            with open("data/Lynez/playdata/saves.txt", "w") as file:
-                file.write(f"{self.best_score}\n")
+            self.best_score = saves.get("Lynez", "best", 0)
 
             self.reset()
             self.state = 0
@@ -512,11 +760,17 @@ class LynezMainScreen(ScreenObject):
         elif target == 1:
             self.state = 1
             self.log = 'Start'
+            self.run_start_ms = pygame.time.get_ticks()
         
         elif target == 2:
             ### Game Over ###
             self.player_particles.clear()
             self.state = 2
+            saves.update_best("Lynez", self.curr_score)
+            
+            rank = leaderboard.record("Lynez", self.curr_score, (pygame.time.get_ticks() - self.run_start_ms) / 1000)
+            label = rank_label(rank, leaderboard.count("Lynez"))
+            self.texts['rank'] = [self.psmall.render(label, True, self.white), self.psmall.size(label)[0]/2]
             self.shake_tick = 25 * self.height/1280
             
             self.last_scrollx = self.scrollx
@@ -541,6 +795,212 @@ class LynezMainScreen(ScreenObject):
             self.circle_effects_dead.append(CircleEffect(self.player.x, self.player.y, self.height/16, self.height,
                                                         self.dark_blue, self.height/50, True, self.red))
     
+    def spawn_player_particle(self):
+        self.player_particles.emit(self.player.x + random.random()*self.player.size - self.player.size/2,
+                                    self.player.y + random.random()*self.player.size - self.player.size/2,
+                                    (-1 * self.player.speedx*0.5 + random.random() - 0.5)*self.height/1280,
+                                    (-1 * self.player.speedy*0.5 + random.random() - 0.5)*self.height/1280,
+                                    self.player.size,
+                                    self.player.size*0.05)
+    
+    def update_particles(self):
+        self.player_particles.update(self.k)
+    
+    def update_circles(self):
+        for circle in self.circle_effects:
+            circle.update(k=self.k)
+            
+            if circle.size > circle.target:
+                self.circle_effects.remove(circle)
+    
+    ### Simulation (고정 틱) ###
+    
+    def tick(self):
+        k = self.k
+        self.prev_scroll = (self.scrollx, self.scrolly)
+        self.player.prev = (self.player.x, self.player.y)
+        
+        if self.mouse_down:
+            self.mouse_down_frames += k
+        else:
+            self.mouse_up_frames += k
+        
+        # 60Hz에선 매 틱 1개 (다른 레이트에서도 초당 개수 유지)
+        # 게임 오버(state 2)에선 파티클을 갱신/그리지 않으므로 생성도 하지 않음
+        if self.state in (0, 1):
+            self.particle_debt += k
+            while self.particle_debt >= 1:
+                self.particle_debt -= 1
+                self.spawn_player_particle()
+        
+        if self.state == 0:
+            self.update_circles()
+            self.ease_menu_scroll()
+            self.update_particles()
+        
+        elif self.state == 1:
+            
+            ### Add line ###
+            
+            if -(self.scrolly) - self.last_platform > self.height/7:
+                if random.randint(1, 3) <= 2:
+                    base_y = self.scrolly - self.height/10
+                    base_x = random.randint(0, self.width)
+                    new_line = [[base_x, base_y], [base_x + (random.random() - 0.5) * self.width*2/3, base_y + (random.random() - 0.5) * self.height/5]]
+                    self.lines.add(new_line)
+                self.last_platform += self.height/7
+            
+            ### Update Player State ###
+            player_start_pos = (self.player.x, self.player.y)
+            self.trail.append(*player_start_pos)
+            
+            self.player.update(k)
+            self.player.handle_collision(self.lines.lines_list, player_start_pos, self.lasers, k)
+            
+            self.scrolly = min(self.player.y - self.height / 2, self.scrolly)
+            self.lines.prune(self.scrolly, self.height)
+            
+            self.curr_score = int(-1 * self.scrolly * self.height / 1280)
+            
+            if self.curr_score > 300:
+                if random.random() * int(150 * (1 + len(self.lasers) * 2) * (1-1/self.curr_score)) < k:
+                    self.lasers.append(Laser(random.random() * self.width, self.width/6, 
+                                            self.height, self.red, self.dark_blue, self.red_particle, self.width))
+            
+            for laser in self.lasers:
+                laser.update(k)
+                
+                if len(laser.lines) == 0 and len(laser.particles) == 0:
+                    self.lasers.remove(laser)
+            
+            self.update_circles()
+            
+            self.update_particles()
+            
+            if self.player.y - self.scrolly > self.height or self.player.x < 0 or self.player.x > self.width:
+                self.load_screen(2)
+        
+        elif self.state == 2:
+            if self.shake_tick>0:
+                self.scrollx = self.last_scrollx + (random.random()-0.5)*self.shake_tick
+                self.prev_scrolly = self.scrolly
+                self.scrolly = self.prev_scrolly + (random.random()-0.5)*self.shake_tick
+                self.shake_tick -= 0.2 * k
+            
+            self.update_circles()
+            
+            cnt = 0 # for effects(more informations in load function)
+            for circle in self.circle_effects_dead:
+                cnt += 1
+                if cnt > 2:
+                    circle.update(0.015, 0.05, k)
+                else:
+                    circle.update(0.015, k=k)
+                
+                if circle.size > circle.target:
+                    self.circle_effects_dead.remove(circle)
+            
+            step = (self.adjed_scrolly-self.scrolly)*approach(0.03, k)
+            self.scrolly += step if step >= 0.1 else 0
+            
+            self.ease_menu_scroll()
+    
+    ### Rendering (틱 사이 보간) ###
+    
+    def render(self, screen, alpha):
+        scrollx = lerp(self.prev_scroll[0], self.scrollx, alpha)
+        scrolly = lerp(self.prev_scroll[1], self.scrolly, alpha)
+        shadow_y = scrolly - self.height/45
+        
+        screen.fill(self.dark_blue)
+        
+        if self.mouse_down and self.mouse_down_frames >= 60:
+            pygame.draw.arc(screen, (255, 255, 255),
+                    (pygame.mouse.get_pos()[0]-self.height/60,
+                    pygame.mouse.get_pos()[1]-self.height/60, self.height/60*2, self.height/60*2), 
+                    math.radians(0), math.radians(min(self.mouse_down_frames*2-120, 360)), self.lines.width)
+        
+        if self.state == 0:
+            ### Blit background ###
+            self.lines.draw_dark(screen, scrollx, shadow_y, self.gray)
+            
+            self.player_particles.draw(screen, scrollx, shadow_y, alpha, self.blue_shadow)
+            
+            self.player.draw_dark(screen, scrollx, shadow_y, self.blue_shadow, alpha)
+            
+            ### Blit Effects ###
+            
+            for circle in self.circle_effects:
+                circle.draw(screen)
+            
+            self.blit_menu(screen)
+            self.lines.draw(screen, scrollx, scrolly)
+            
+            ### Blit Player ###
+            
+            self.player_particles.draw(screen, scrollx, scrolly, alpha)
+            
+            self.player.draw(screen, scrollx, scrolly, alpha)
+        
+        elif self.state == 1:
+            # 꼬리는 틱마다 찍힌 점 + 보간된 현재 위치까지
+            trail_head = self.player.lerped(alpha)
+            trail_width = max(int(self.lines.width/4), 1)
+            
+            ### Blit background ###
+            self.lines.draw_dark(screen, scrollx, shadow_y, self.gray)
+            pygame.draw.line(screen, self.blue__,
+                            self.lines.adj_pos(self.last_pos, scrollx, shadow_y),
+                            self.lines.adj_pos(pygame.mouse.get_pos(), 0, -self.height/45),
+                            int(self.lines.width/2))
+            
+            self.trail.draw(screen, self.trail_blue_shadow, scrollx, shadow_y, trail_width, trail_head)
+            
+            self.player_particles.draw(screen, scrollx, shadow_y, alpha, self.blue_shadow)
+            
+            self.player.draw_dark(screen, scrollx, shadow_y, self.blue_shadow, alpha)
+            
+            for laser in self.lasers:
+                laser.draw(screen, scrollx, scrolly, alpha)
+            
+            ### Blit Effects ###
+            
+            for circle in self.circle_effects:
+                circle.draw(screen)
+            
+            ### Score ###
+            self.blit_ingame(screen)
+            
+            self.lines.draw(screen, scrollx, scrolly)
+            pygame.draw.line(screen, self.blue_,
+                            self.lines.adj_pos(self.last_pos, scrollx, scrolly),
+                            pygame.mouse.get_pos(),
+                            int(self.lines.width/2))
+            
+            ### Blit Player ###
+            
+            self.trail.draw(screen, self.trail_blue, scrollx, scrolly, trail_width, trail_head)
+            
+            self.player_particles.draw(screen, scrollx, scrolly, alpha)
+            
+            self.player.draw(screen, scrollx, scrolly, alpha)
+        
+        elif self.state == 2:
+            ### Blit background ###
+            self.lines.draw_dark(screen, scrollx, shadow_y, self.gray)
+            
+            ### Blit Effects ###
+            
+            for circle in self.circle_effects:
+                circle.draw(screen)
+            
+            for circle in self.circle_effects_dead:
+                circle.draw(screen, scrollx, scrolly)
+            
+            self.lines.draw(screen, scrollx, scrolly)
+            
+            self.blit_game_over(screen)
+    
     def loop(self, screen):
         clock = pygame.time.Clock()
         self.running = True
@@ -548,9 +1008,11 @@ class LynezMainScreen(ScreenObject):
         self.state = 0
         self.log = None
         
-        mouse_down = False
-        mouse_down_frames = 0
-        mouse_up_frames = 0
+        self.mouse_down = False
+        self.mouse_down_frames = 0
+        self.mouse_up_frames = 0
+        
+        self.timestep.reset()
         
         """
         0: main menu
@@ -559,26 +1021,10 @@ class LynezMainScreen(ScreenObject):
         """
         
         while self.running:
-            screen.fill(self.dark_blue)
-            
-            dt_ms = clock.tick(60)
-
-            dt = dt_ms / 1000.0
+            self.profiler.begin_frame()
             
-            if mouse_down:
-                mouse_down_frames += 1
-                if mouse_down_frames >= 60:
-                    pygame.draw.arc(screen, (255, 255, 255),
-                            (pygame.mouse.get_pos()[0]-self.height/60,
-                            pygame.mouse.get_pos()[1]-self.height/60, self.height/60*2, self.height/60*2), 
-                            math.radians(0), math.radians(min(mouse_down_frames*2-120, 360)), self.lines.width)
-            else:
-                mouse_up_frames += 1
-            
-            ### Check of Exit ###
-            if self.state == 0:
-                if mouse_down_frames == 240:
-                    return 0, screen
+            dt_ms = clock.tick(self.fps)
+            self.profiler.idle()
             
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -588,12 +1034,12 @@ class LynezMainScreen(ScreenObject):
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     curr_pos = pygame.mouse.get_pos()
                     self.circle_effects.append(CircleEffect(curr_pos[0], curr_pos[1], 1, self.height//15, self.white, self.height/200))
-                    mouse_down = True
+                    self.mouse_down = True
                 
                 if event.type == pygame.MOUSEBUTTONUP:
-                    if mouse_down == True:
-                        if mouse_down_frames < 60:
-                            if mouse_up_frames > 10:
+                    if self.mouse_down == True:
+                        if self.mouse_down_frames < 60:
+                            if self.mouse_up_frames > 10:
                                 if self.state == 0:
                                     self.load_screen(1)
                                 elif self.state == 2:
@@ -602,191 +1048,31 @@ class LynezMainScreen(ScreenObject):
                     if self.state == 1:
                         if self.log != 'Start':
                             curr_point = self.lines.adj_pos(pygame.mouse.get_pos(), 0, -1 * self.scrolly)
-                            self.lines.lines_list.append((self.last_pos, curr_point))
+                            self.lines.add((self.last_pos, curr_point))
                             self.last_pos = curr_point
                         else:
                             self.log = None
 
-                    mouse_down = False
-                    mouse_down_frames = 0
-                    mouse_up_frames = 0
-            
-            self.player_particles.append(PlayerParticle(self.player.x + random.random()*self.player.size - self.player.size/2,
-                                                        self.player.y + random.random()*self.player.size - self.player.size/2,
-                                                        (-1 * self.player.speedx*0.5 + random.random() - 0.5)*self.height/1280,
-                                                        (-1 * self.player.speedy*0.5 + random.random() - 0.5)*self.height/1280,
-                                                        self.player.size,
-                                                        self.player.size*0.05,
-                                                        self.blue
-                                                        ))
-            
-            if self.state == 0:
-                ### Blit background ###
-                self.lines.draw_dark(screen, self.scrollx, self.scrolly-self.height/45, self.gray)
-                
-                for particle in self.player_particles:
-                    particle.draw_dark(screen, self.scrollx, self.scrolly-self.height/45, self.blue_shadow)
-                
-                self.player.draw_dark(screen, self.scrollx, self.scrolly-self.height/45, self.blue_shadow)
-                
-                ### Blit Effects ###
-                
-                for circle in self.circle_effects:
-                    circle.update()
-                    circle.draw(screen)
-                    
-                    if circle.size > circle.target:
-                        self.circle_effects.remove(circle)
-                
-                self.blit_menu(screen)
-                self.lines.draw(screen, self.scrollx, self.scrolly, self.height)
-                
-                ### Blit Player ###
-                
-                for particle in self.player_particles:
-                    particle.update()
-                    particle.draw(screen, self.scrollx, self.scrolly)
-                    if particle.size <= 0:
-                        self.player_particles.remove(particle)
-                
-                self.player.draw(screen, self.scrollx, self.scrolly)
+                    self.mouse_down = False
+                    self.mouse_down_frames = 0
+                    self.mouse_up_frames = 0
+            self.profiler.mark("events")
             
-            elif self.state == 1:
-                
-                ### Add line ###
-                
-                if -(self.scrolly) - self.last_platform > self.height/7:
-                    if random.randint(1, 3) <= 2:
-                        base_y = self.scrolly - self.height/10
-                        base_x = random.randint(0, self.width)
-                        new_line = [[base_x, base_y], [base_x + (random.random() - 0.5) * self.width*2/3, base_y + (random.random() - 0.5) * self.height/5]]
-                        self.lines.lines_list.append(new_line)
-                    self.last_platform += self.height/7
-                
-                ### Update Player State ###
-                player_start_pos = (self.player.x, self.player.y)
-                self.trail.append(player_start_pos)
-                
-                self.player.update()
-                self.player.handle_collision(self.lines.lines_list, player_start_pos, self.lasers)
-                
-                self.scrolly = min(self.player.y - self.height / 2, self.scrolly)
-                
-                self.curr_score = int(-1 * self.scrolly * self.height / 1280)
-                
-                ### Blit background ###
-                self.lines.draw_dark(screen, self.scrollx, self.scrolly-self.height/45, self.gray)
-                pygame.draw.line(screen, self.blue__,
-                                self.lines.adj_pos(self.last_pos, self.scrollx, self.scrolly-self.height/45),
-                                self.lines.adj_pos(pygame.mouse.get_pos(), 0, -self.height/45),
-                                int(self.lines.width/2))
-                
-                for i in range(len(self.trail)-1):
-                    pygame.draw.line(screen, self.trail_blue_shadow,
-                                        self.lines.adj_pos(self.trail[i], self.scrollx, self.scrolly-self.height/45),
-                                        self.lines.adj_pos(self.trail[i+1], self.scrollx, self.scrolly-self.height/45),
-                                        max(int(self.lines.width/4), 1))
-                
-                for particle in self.player_particles:
-                    particle.draw_dark(screen, self.scrollx, self.scrolly-self.height/45, self.blue_shadow)
-                
-                self.player.draw_dark(screen, self.scrollx, self.scrolly-self.height/45, self.blue_shadow)
-                
-                if self.curr_score > 300:
-                    if random.randint(1, int(150 * (1 + len(self.lasers) * 2) * (1-1/self.curr_score))) == 1:
-                        self.lasers.append(Laser(random.random() * self.width, self.width/6, 
-                                                self.height, self.red, self.dark_blue, self.red_particle, self.width))
-                
-                for laser in self.lasers:
-                    laser.update()
-                    laser.draw(screen, self.scrollx, self.scrolly)
-                    
-                    if len(laser.lines) == 0 and len(laser.particles) == 0:
-                        self.lasers.remove(laser)
+            for _ in range(self.timestep.advance(dt_ms)):
+                self.tick()
                 
-                ### Blit Effects ###
-                
-                for circle in self.circle_effects:
-                    circle.update()
-                    circle.draw(screen)
-                    
-                    if circle.size > circle.target:
-                        self.circle_effects.remove(circle)
-                
-                ### Score ###
-                self.blit_ingame(screen)
-    
-                self.lines.draw(screen, self.scrollx, self.scrolly, self.height)
-                pygame.draw.line(screen, self.blue_,
-                                self.lines.adj_pos(self.last_pos, self.scrollx, self.scrolly),
-                                pygame.mouse.get_pos(),
-                                int(self.lines.width/2))
-                
-                ### Blit Player ###
-                
-                for i in range(len(self.trail)-1):
-                    pygame.draw.line(screen, self.trail_blue,
-                                        self.lines.adj_pos(self.trail[i], self.scrollx, self.scrolly),
-                                        self.lines.adj_pos(self.trail[i+1], self.scrollx, self.scrolly),
-                                        max(int(self.lines.width/4), 1))
-                
-                if len(self.trail) == 50:
-                    self.trail.popleft()
-                
-                for particle in self.player_particles:
-                    particle.update()
-                    particle.draw(screen, self.scrollx, self.scrolly)
-                    if particle.size <= 0:
-                        self.player_particles.remove(particle)
-                
-                self.player.draw(screen, self.scrollx, self.scrolly)
-                
-                if self.player.y - self.scrolly > self.height or self.player.x < 0 or self.player.x > self.width:
-                    self.load_screen(2)
-                    
-            elif self.state == 2:
-                if self.shake_tick>0:
-                    self.scrollx = self.last_scrollx + (random.random()-0.5)*self.shake_tick
-                    self.prev_scrolly = self.scrolly
-                    self.scrolly = self.prev_scrolly + (random.random()-0.5)*self.shake_tick
-                    self.shake_tick -= 0.2
-                
-                ### Blit background ###
-                self.lines.draw_dark(screen, self.scrollx, self.scrolly-self.height/45, self.gray)
-                
-                ### Blit Effects ###
-                
-                for circle in self.circle_effects:
-                    circle.update()
-                    circle.draw(screen)
-                    
-                    if circle.size > circle.target:
-                        self.circle_effects.remove(circle)
-                
-                cnt = 0 # for effects(more informations in load function)
-                for circle in self.circle_effects_dead:
-                    cnt += 1
-                    if cnt > 2:
-                        circle.update(0.015, 0.05)
-                    else:
-                        circle.update(0.015)
-                    
-                    circle.draw(screen, self.scrollx, self.scrolly)
-                    
-                    if circle.size > circle.target:
-                        self.circle_effects_dead.remove(circle)
-                
-                self.lines.draw(screen, self.scrollx, self.scrolly, self.height)
-                
-                self.scrolly += (self.adjed_scrolly-self.scrolly)*0.03 if (self.adjed_scrolly-self.scrolly)*0.03 >= 0.1 else 0
-                
-                self.blit_game_over(screen)
+                ### Check of Exit ###
+                if self.state == 0 and self.mouse_down_frames >= 240:
+                    return 0, screen
+            self.profiler.mark("update")
+            
+            self.render(screen, self.timestep.alpha)
             
             # Show FPS if needed
-            if self.show_fps:
-                blit_fps(screen, clock)
+            self.profiler.draw(screen, clock)
 
             pygame.display.flip()
+            self.profiler.mark("flip")
 
 class LynezLoadingScreen(ScreenObject):
     def __init__(self, width, height):
@@ -799,7 +1085,7 @@ class LynezLoadingScreen(ScreenObject):
         surface = pygame.Surface((self.width, self.height))
         surface.fill(self.dark_blue)
 
-        title_font = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(self.height // 10))
+        title_font = assets.font("data/fonts/SairaCondensed-Light.ttf", int(self.height // 10))
         title_text = title_font.render("Lynez", True, self.white)
         
         title_text_rect = title_text.get_rect()
@@ -807,7 +1093,12 @@ class LynezLoadingScreen(ScreenObject):
         
         surface.blit(title_text, title_text_rect)
         
-        fade_in(screen, surface, self.width, self.height, 2000)
+        # 페이드 인 -> 대기 -> 페이드 아웃을 한 번에 (이벤트는 계속 처리됨)
+        run_transition(screen, Sequence(
+            FadeIn(surface, 2000),
+            Hold(surface, 2000),
+            FadeOut(surface, 2000),
+        ))
         
         return "menu", screen
 
@@ -830,15 +1121,19 @@ class LynezScreen(ScreenObject):
                 curr_lynez_screen = LynezLoadingScreen(self.width, self.height)
                 next_screen, curr_screen_surface = curr_lynez_screen.loop(screen)
                 curr_lynez_screen_idx = screen_ids[next_screen]
-                pygame.time.wait(2000)
-                fade_out(screen, curr_screen_surface, self.width, self.height, 2000)
             
             elif curr_lynez_screen_idx == 1:
                 curr_lynez_screen = LynezMainScreen(self.width, self.height, show_fps=self.show_fps)
                 next_screen, curr_screen_surface = curr_lynez_screen.loop(screen)
-                pygame.time.wait(2000)
-                fade_out(screen, curr_screen_surface, self.width, self.height, 2000)
-                return 0, screen
+                # 대기 + 페이드 아웃은 main.py가 다음 씬 로드와 겹쳐서 처리
+                return 0, curr_screen_surface
+
+def preload(width, height):
+    """씬 전환 중 백그라운드에서 호출됨 - 폰트와 리더보드 인덱스를 미리 준비"""
+    for size in (height // 10, height / 15, height / 30, height / 45):
+        assets.font("data/fonts/SairaCondensed-Light.ttf", int(size))
+    leaderboard.load()
+
 
 if __name__ == "__main__":
     pygame.init()
@@ -3,7 +3,14 @@ import sys
 import math
 import random
 
-from localLibraries.PlayCoreLibraries import ScreenObject, fade_out, blit_fps
+from localLibraries.PlayCoreLibraries import ScreenObject
+from localLibraries.Transitions import run_transition, Sequence, Hold, FadeOut
+from localLibraries.AssetManager import assets
+from localLibraries.SaveStore import saves
+from localLibraries.Leaderboard import leaderboard, rank_label
+from localLibraries.FrameProfiler import FrameProfiler
+from localLibraries.NumberRenderer import NumberRenderer
+from localLibraries.DirtyRectRenderer import DirtyRectRenderer
 
 class StrokeRecognizer:
     def __init__(self):
@@ -156,19 +163,11 @@ class StrokeRecognizer:
         else:
             return ""
 
-class Ghost:
-    AVAILABLE_SPELLS = ["horizontal", "vertical", "vspell", "ivspell", "lighting"]
-    
-    def __init__(self, x, y, spell_length, width, speed=50, direction=1):
-        self.x = x
-        self.y = y
-        
-        self.spells = random.choices(Ghost.AVAILABLE_SPELLS, k=spell_length)
-        self.spell_idx = 0
-        self.alive = True
-        
-        self.state = "moving"
-        self.animation_frame_cnt = 0
+class GhostPrototype:
+    """(width, direction)별로 한 번만 만들어서 모든 Ghost가 공유하는 애니메이션/주문 이미지"""
+    def __init__(self, width, direction=1):
+        self.width = width
+        self.direction = direction
         
         self.animation_frames = {}
         self.animation_adj = {}
@@ -212,14 +211,11 @@ class Ghost:
         for anim_id in self.animation_frames:
             new_list = []
             for img_path in self.animation_frames[anim_id]:
-                img = pygame.image.load(img_path).convert_alpha()
-                
-                if direction == 0:
-                    img = pygame.transform.flip(img, True, False)
+                img_w, img_h = assets.source_size(img_path)
                 
                 scale_x = int(width * 0.1 * size_adj[anim_id])
-                scale_y = int(width * 0.1 * (img.get_height()/img.get_width()) * size_adj[anim_id])
-                img_scaled = pygame.transform.scale(img, (scale_x, scale_y))
+                scale_y = int(width * 0.1 * (img_h/img_w) * size_adj[anim_id])
+                img_scaled = assets.image(img_path, (scale_x, scale_y), flip_x=(direction == 0))
                 new_list.append(img_scaled)
             self.animation_frames[anim_id] = new_list
         
@@ -258,15 +254,48 @@ class Ghost:
         
         for spell_id in self.spell_imgs:
             img_path = self.spell_imgs[spell_id]
-            img = pygame.image.load(img_path).convert_alpha()
+            img_w, img_h = assets.source_size(img_path)
             
-            scale_x = int(width * 0.02 * (img.get_width()/img.get_height()) * size_adj_spell[spell_id])
+            scale_x = int(width * 0.02 * (img_w/img_h) * size_adj_spell[spell_id])
             scale_y = int(width * 0.02 * size_adj_spell[spell_id])
             
-            img_scaled = pygame.transform.scale(img, (scale_x, scale_y))
+            img_scaled = assets.image(img_path, (scale_x, scale_y))
             self.spell_imgs[spell_id] = img_scaled
         
         self.spell_width = self.spell_imgs['horizontal'].get_width()
+
+_ghost_prototypes = {}
+
+def ghost_prototype(width, direction):
+    """GameScreen끼리 공유 - 백그라운드 preload에서 만든 것을 실제 게임 화면이 그대로 씀 (Ghost는 읽기만 함)"""
+    key = (width, direction)
+    prototype = _ghost_prototypes.get(key)
+    if prototype is None:
+        prototype = _ghost_prototypes[key] = GhostPrototype(width, direction)
+    return prototype
+
+class Ghost:
+    AVAILABLE_SPELLS = ["horizontal", "vertical", "vspell", "ivspell", "lighting"]
+    
+    def __init__(self, x, y, spell_length, prototype, speed=50):
+        self.x = x
+        self.y = y
+        
+        self.spells = random.choices(Ghost.AVAILABLE_SPELLS, k=spell_length)
+        self.spell_idx = 0
+        self.alive = True
+        
+        self.state = "moving"
+        self.animation_frame_cnt = 0
+        
+        # 이미지/오프셋은 prototype의 것을 그대로 참조 (복사 X)
+        self.prototype = prototype
+        self.animation_frames = prototype.animation_frames
+        self.animation_adj = prototype.animation_adj
+        self.animation_frame_delay = prototype.animation_frame_delay
+        self.shift_pos = prototype.shift_pos
+        self.spell_imgs = prototype.spell_imgs
+        self.spell_width = prototype.spell_width
         
         self.speed = speed
     
@@ -418,10 +447,10 @@ class Player:
         for anim_id in self.animation_frames:
             new_list = []
             for path in self.animation_frames[anim_id]:
-                img = pygame.image.load(path).convert_alpha()
+                img_w, img_h = assets.source_size(path)
                 scale_x = int(width * 0.1 * size_adj[anim_id])
-                scale_y = int(width * 0.1 * (img.get_height()/img.get_width()) * size_adj[anim_id])
-                scaled_img = pygame.transform.scale(img, (scale_x, scale_y))
+                scale_y = int(width * 0.1 * (img_h/img_w) * size_adj[anim_id])
+                scaled_img = assets.image(path, (scale_x, scale_y))
                 new_list.append(scaled_img)
             self.animation_frames[anim_id] = new_list
         
@@ -465,7 +494,7 @@ class Player:
         
         draw_x = self.x - self.shift_pos[0] + adj_x
         draw_y = self.y - self.shift_pos[1] + adj_y
-        screen.blit(img, (draw_x, draw_y))
+        return screen.blit(img, (draw_x, draw_y))
 
 class TitleScreen(ScreenObject):
     """'Click to Start'라고 표시하고 클릭 시 GameScreen으로 이동"""
@@ -477,16 +506,9 @@ class TitleScreen(ScreenObject):
         self.background_imgs = []
         
         for i in range(2):
-            img = pygame.image.load(
-                f"data/MagicCatAcademy/imgs/game/menu{i+1}.jpg"
-            ).convert_alpha()
-            
-            img = pygame.transform.scale(
-                img,
-                (
-                    int(self.width),
-                    int(self.width * (img.get_height() / img.get_width()))
-                )
+            img = assets.image_to_width(
+                f"data/MagicCatAcademy/imgs/game/menu{i+1}.jpg",
+                self.width
             )
             
             self.background_imgs.append(img)
@@ -499,22 +521,15 @@ class TitleScreen(ScreenObject):
         self.text_background_imgs = []
         
         for i in range(2):
-            img = pygame.image.load(
-                f"data/MagicCatAcademy/imgs/game/text_background{i+1}.png"
-            ).convert_alpha()
-            
-            img = pygame.transform.scale(
-                img,
-                (
-                    int(self.width*0.6),
-                    int(self.width*0.6 * (img.get_height() / img.get_width()))
-                )
+            img = assets.image_to_width(
+                f"data/MagicCatAcademy/imgs/game/text_background{i+1}.png",
+                self.width*0.6
             )
             
             self.text_background_imgs.append(img)
         
-        self.fontH1 = pygame.font.Font("data/fonts/jua.ttf", int(self.height // 10))
-        self.fontP = pygame.font.Font("data/fonts/jua.ttf", int(self.height // 30))
+        self.fontH1 = assets.font("data/fonts/jua.ttf", int(self.height // 10))
+        self.fontP = assets.font("data/fonts/jua.ttf", int(self.height // 30))
         
         self.player = Player(width*3/4, height*3/5, width*1.5, hp=5)
         
@@ -528,16 +543,29 @@ class TitleScreen(ScreenObject):
         mouse_down_frames = 0
         mouse_up_frames = 0
         
-        data = []
-        with open("data/MagicCatAcademy/playdata/saves.txt", "r") as file:
-            lines = file.read().split('\n')
-            for line in lines:
-                if not line.strip():
-                    continue
-                data.append(line)
+        best_score = saves.get("MagicCatAcademy", "best", 0)
+        
+        
+        self.menu_texts = ['Click to Start', 'Hold to Quit', f'Best {best_score}']
         
+        # 배경/텍스트는 고정 -> 한 번만 그려 두고, 매 프레임 고양이와 홀드 원호만 갱신
+        static = pygame.Surface((self.width, self.height)).convert()
+        static.fill(self.gray)
+        static.blit(self.background_imgs[0], self.background_img_pos)
+        
+        for i in range(3):
+            static.blit(self.text_background_imgs[i%2], (
+                ((i+1) * (-0.05) - 0.02) * self.width,
+                self.height*(0.25 + i*0.15)
+            ))
+            
+            text_surface = self.fontH1.render(self.menu_texts[i], False, (0, 0, 0))
+            static.blit(text_surface, (self.height // 10, self.height*(0.25 + i*0.15)))
         
-        self.menu_texts = ['Click to Start', 'Hold to Quit', f'Best {data[0]}']
+        text_surface = self.fontP.render("Original Game by Google Doodle Games. Remade by Jiwon Yu", False, (0, 0, 0))
+        static.blit(text_surface, (10, self.height*0.8))
+        
+        renderer = DirtyRectRenderer((self.width, self.height))
         
         while self.running:
             dt_ms = clock.tick(60)
@@ -570,56 +598,38 @@ class TitleScreen(ScreenObject):
             
             self.player.update(frame_cnt)
             
-            screen.fill(self.gray)
-            screen.blit(self.background_imgs[0], self.background_img_pos)
-            
-            for i in range(3):
-                screen.blit(self.text_background_imgs[i%2], (
-                    ((i+1) * (-0.05) - 0.02) * self.width,
-                    self.height*(0.25 + i*0.15)
-                ))
-                
-                text_surface = self.fontH1.render(self.menu_texts[i], False, (0, 0, 0))
-                screen.blit(text_surface, (self.height // 10, self.height*(0.25 + i*0.15)))
-            
-            text_surface = self.fontP.render("Original Game by Google Doodle Games. Remade by Jiwon Yu", False, (0, 0, 0))
-            screen.blit(text_surface, (10, self.height*0.8))
+            screen.blit(static, (0, 0))
             
-            self.player.draw(screen)
+            renderer.mark(self.player.draw(screen))
             
             if mouse_down:
                 mouse_down_frames += 1
                 if mouse_down_frames >= 60:
-                    pygame.draw.arc(screen, (255, 255, 255),
+                    renderer.mark(pygame.draw.arc(screen, (255, 255, 255),
                             (pygame.mouse.get_pos()[0]-self.height/60,
                             pygame.mouse.get_pos()[1]-self.height/60, self.height/60*2, self.height/60*2), 
-                            math.radians(0), math.radians(min(mouse_down_frames*2-120, 360)), 5)
+                            math.radians(0), math.radians(min(mouse_down_frames*2-120, 360)), 5))
             else:
                 mouse_up_frames += 1
             
-            pygame.display.flip()
+            renderer.present()
             
             frame_cnt+=1
         
         return "game", screen
 
 class GameScreen(ScreenObject):
-    def __init__(self, width, height):
+    def __init__(self, width, height, show_fps=False):
         super().__init__(width, height)
         
+        self.profiler = FrameProfiler(show_fps)
+        
         self.background_imgs = []
         
         for i in range(4):
-            img = pygame.image.load(
-                f"data/MagicCatAcademy/imgs/game/main_game{i+1}.png"
-            ).convert_alpha()
-            
-            img = pygame.transform.scale(
-                img,
-                (
-                    int(self.height * (img.get_width() / img.get_height())),
-                    int(self.height)
-                )
+            img = assets.image_to_height(
+                f"data/MagicCatAcademy/imgs/game/main_game{i+1}.png",
+                self.height
             )
             
             self.background_imgs.append(img)
@@ -635,35 +645,27 @@ class GameScreen(ScreenObject):
         
         self.wave = 0
         self.point = 0
+        self.play_time = 0.0
         self.ghosts = []
         
+        # 웨이브 스폰 시 끊김이 없도록 양방향 prototype을 미리 만들어 둠 (preload에서 이미 만들었으면 그대로 씀)
+        for direction in (0, 1):
+            ghost_prototype(self.width, direction)
+        
         self.is_drawing = False
         self.current_stroke = []
         
-        self.fontH1 = pygame.font.Font("data/fonts/jua.ttf", int(self.height // 10))
+        self.fontH1 = assets.font("data/fonts/jua.ttf", int(self.height // 10))
+        self.point_text = NumberRenderer(self.fontH1, (242,169,59))  # 점수가 오를 때만 다시 조합
         
-        self.heart_img_filled = pygame.image.load(
-                "data/MagicCatAcademy/imgs/game/heart_filled.png"
-            ).convert_alpha()
-            
-        self.heart_img_filled = pygame.transform.scale(
-            self.heart_img_filled,
-            (
-                int(self.width/20),
-                int(self.width/20 * (self.heart_img_filled.get_height() / self.heart_img_filled.get_width()))
-            )
+        self.heart_img_filled = assets.image_to_width(
+            "data/MagicCatAcademy/imgs/game/heart_filled.png",
+            self.width/20
         )
         
-        self.heart_img_blank = pygame.image.load(
-                "data/MagicCatAcademy/imgs/game/heart_blank.png"
-            ).convert_alpha()
-            
-        self.heart_img_blank = pygame.transform.scale(
-            self.heart_img_blank,
-            (
-                int(self.width/20),
-                int(self.width/20 * (self.heart_img_blank.get_height() / self.heart_img_blank.get_width()))
-            )
+        self.heart_img_blank = assets.image_to_width(
+            "data/MagicCatAcademy/imgs/game/heart_blank.png",
+            self.width/20
         )
     
     def reset(self):
@@ -720,7 +722,7 @@ class GameScreen(ScreenObject):
         
         direction = 0 if x < width/2 else 1
         
-        return Ghost(x, y, spell_length, width, speed=speed, direction=direction)
+        return Ghost(x, y, spell_length, ghost_prototype(width, direction), speed=speed)
     
     def spawn_wave(self):
         wave_ghost_count = min(self.wave//3+1, 12)
@@ -756,8 +758,12 @@ class GameScreen(ScreenObject):
         
         prev_mouse_pos = pygame.mouse.get_pos()
         
+        start_ms = pygame.time.get_ticks()
+        
         while running:
+            self.profiler.begin_frame()
             dt_ms = clock.tick(60)
+            self.profiler.idle()
             dt = dt_ms / 1000.0
             
             ### moved to the front for early update ###
@@ -773,6 +779,7 @@ class GameScreen(ScreenObject):
                 waitng_frame -= 1
                 
                 if waitng_frame == 0:
+                    self.play_time = (pygame.time.get_ticks() - start_ms) / 1000
                     return "gameover", screen, self.point
             
             for event in pygame.event.get():
@@ -838,6 +845,7 @@ class GameScreen(ScreenObject):
                             else:
                                 self.player.update_state('waiting')
                             self.current_stroke = []
+            self.profiler.mark("events")
             
             for g in self.ghosts:
                 g.update(dt, self.player.x, self.player.y, frame_cnt)
@@ -865,6 +873,7 @@ class GameScreen(ScreenObject):
                     self.spawn_wave()
             
             self.point = min(self.point+point_increase_vel, point_target)
+            self.profiler.mark("update")
             
             screen.blit(self.background_imgs[min(self.wave//10,3)], self.background_img_pos)
             
@@ -887,12 +896,15 @@ class GameScreen(ScreenObject):
                 screen.blit(self.heart_img_blank, (start_x, self.width/40))
                 start_x+=self.width/20
 
-            wave_text = self.fontH1.render(f"{self.point}", True, (242,169,59))
+            wave_text = self.point_text.render(self.point)
             text_rect = wave_text.get_rect()
             text_rect.topright = (screen.get_width() - self.width/40, self.width/110)
             screen.blit(wave_text, text_rect)
             
+            self.profiler.draw(screen, clock)
+            
             pygame.display.flip()
+            self.profiler.mark("flip")
             frame_cnt += 1
         
         return "gameover", screen
@@ -905,41 +917,23 @@ class GameOverScreen(ScreenObject):
                 
         self.white = (255, 255, 255)
         
-        self.background_img = pygame.image.load(
-            "data/MagicCatAcademy/imgs/game/game_over.png"
-        ).convert_alpha()
-        
-        self.background_img = pygame.transform.scale(
-            self.background_img,
-            (
-                int(self.width),
-                int(self.width * (self.background_img.get_height() / self.background_img.get_width()))
-            )
+        self.background_img = assets.image_to_width(
+            "data/MagicCatAcademy/imgs/game/game_over.png",
+            self.width
         )
         self.background_img_pos = (
             (self.width - self.background_img.get_width()) / 2,
             (self.height - self.background_img.get_height()) / 2
         )
         
-        self.fontH1 = pygame.font.Font("data/fonts/jua.ttf", int(self.height // 8))
-        self.fontP = pygame.font.Font("data/fonts/jua.ttf", int(self.height // 15))
+        self.fontH1 = assets.font("data/fonts/jua.ttf", int(self.height // 8))
+        self.fontP = assets.font("data/fonts/jua.ttf", int(self.height // 15))
     
-    def loop(self, screen, point):
+    def loop(self, screen, point, play_time=0.0):
         self.point = point
         
-        data = []
-        
-        with open("data/MagicCatAcademy/playdata/saves.txt", "r") as file:
-            lines = file.read().split('\n')
-            for line in lines:
-                if not line.strip():
-                    continue
-                data.append(line)
-        
-        if point > int(data[0]):
-            with open("data/MagicCatAcademy/playdata/saves.txt", "w") as file:
-                file.write(f"{point}\n")
-                file.close()
+        saves.update_best("MagicCatAcademy", point)
+        rank = leaderboard.record("MagicCatAcademy", point, play_time)
         
         text_point_surface = self.fontH1.render(f'{point}', False, (255, 255, 255))
         text_point_rect = text_point_surface.get_rect(center = (self.width * 13/18, self.height * 3/7))
@@ -947,8 +941,22 @@ class GameOverScreen(ScreenObject):
         text_info_surface = self.fontP.render('Click to Restart', False, (255, 255, 255))
         text_info_rect =text_info_surface.get_rect(center = (self.width * 13/18, self.height * 4/7))
         
+        text_rank_surface = self.fontP.render(rank_label(rank, leaderboard.count("MagicCatAcademy")), False, (255, 255, 255))
+        text_rank_rect = text_rank_surface.get_rect(center = (self.width * 13/18, self.height * 5/7))
+        
         clock = pygame.time.Clock()
         
+        # 화면이 변하지 않으므로 첫 프레임만 그리고 이후엔 업로드하지 않음
+        renderer = DirtyRectRenderer((self.width, self.height))
+        
+        screen.fill(self.white)
+        
+        screen.blit(self.background_img, self.background_img_pos)
+        
+        screen.blit(text_point_surface, text_point_rect)
+        screen.blit(text_info_surface, text_info_rect)
+        screen.blit(text_rank_surface, text_rank_rect)
+        
         while self.running:
             dt = clock.tick(60)
             for event in pygame.event.get():
@@ -958,14 +966,7 @@ class GameOverScreen(ScreenObject):
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     return "title", screen
             
-            screen.fill(self.white)
-            
-            screen.blit(self.background_img, self.background_img_pos)
-            
-            screen.blit(text_point_surface, text_point_rect)
-            screen.blit(text_info_surface, text_info_rect)
-            
-            pygame.display.flip()
+            renderer.present()
         
         return "title", screen
 
@@ -980,7 +981,7 @@ class MagicCatAcademyMainScreen(ScreenObject):
         current_state = "title"
         
         title_screen = TitleScreen(self.width, self.height)
-        game_screen = GameScreen(self.width, self.height)
+        game_screen = GameScreen(self.width, self.height, show_fps=self.show_fps)
         gameover_screen = GameOverScreen(self.width, self.height)
         
         while running:
@@ -994,7 +995,7 @@ class MagicCatAcademyMainScreen(ScreenObject):
                 current_state = next_state
             
             elif current_state == "gameover":
-                next_state, _ = gameover_screen.loop(screen, point)
+                next_state, _ = gameover_screen.loop(screen, point, game_screen.play_time)
                 current_state = next_state
             
             if current_state == "exit":
@@ -1007,6 +1008,7 @@ class MagicCatAcademyLoadingScreen:
         self.width = width
         self.height = height
         self.show_fps = show_fps
+        self.profiler = FrameProfiler(show_fps)
 
         self.white = (255, 255, 255)
         self.dark_gray = (45, 48, 56)
@@ -1014,15 +1016,9 @@ class MagicCatAcademyLoadingScreen:
         
         self.button_color = list(self.dark_gray)
 
-        self.background_img = pygame.image.load(
-            "data/MagicCatAcademy/imgs/game/level0_background.png"
-        ).convert_alpha()
-        self.background_img = pygame.transform.scale(
-            self.background_img,
-            (
-                int(self.width * 0.6),
-                int(self.width * 0.6 * (self.background_img.get_height() / self.background_img.get_width()))
-            )
+        self.background_img = assets.image_to_width(
+            "data/MagicCatAcademy/imgs/game/level0_background.png",
+            self.width * 0.6
         )
         self.background_img_pos = (
             (self.width - self.background_img.get_width()) / 2,
@@ -1111,7 +1107,9 @@ class MagicCatAcademyLoadingScreen:
         self.hovered = False
         
         while self.running:
+            self.profiler.begin_frame()
             dt_ms = clock.tick(60)
+            self.profiler.idle()
             dt = dt_ms / 1000.0
         
             for event in pygame.event.get():
@@ -1123,6 +1121,7 @@ class MagicCatAcademyLoadingScreen:
                     if self.hovered:
                         self.running = False
                         return "menu", screen
+            self.profiler.mark("events")
 
             if self.button_rect.collidepoint(pygame.mouse.get_pos()):
                 self.hovered = True
@@ -1155,10 +1154,10 @@ class MagicCatAcademyLoadingScreen:
             
             pygame.draw.polygon(screen, self.button_color, self.triangle_points)
 
-            if self.show_fps:
-                blit_fps(screen, clock)
+            self.profiler.draw(screen, clock)
 
             pygame.display.flip()
+            self.profiler.mark("flip")
 
         return "menu", screen
 
@@ -1184,8 +1183,7 @@ class MagicCatAcademyScreen(ScreenObject):
                 next_screen, curr_screen_surface = curr_magiccat_screen.loop(screen)
                 curr_magiccat_screen_idx = screen_ids[next_screen]
                 
-                pygame.time.wait(1000)
-                fade_out(screen, curr_screen_surface, self.width, self.height, 1000)
+                run_transition(screen, Sequence(Hold(curr_screen_surface, 1000), FadeOut(curr_screen_surface, 1000)))
             
             elif curr_magiccat_screen_idx == 1:
                 curr_magiccat_screen = MagicCatAcademyMainScreen(
@@ -1193,10 +1191,17 @@ class MagicCatAcademyScreen(ScreenObject):
                 )
                 next_screen, curr_screen_surface = curr_magiccat_screen.loop(screen)
                 
-                pygame.time.wait(1000)
-                fade_out(screen, curr_screen_surface, self.width, self.height, 1000)
-                
-                return 0, screen
+                # 대기 + 페이드 아웃은 main.py가 다음 씬 로드와 겹쳐서 처리
+                return 0, curr_screen_surface
+
+def preload(width, height):
+    """씬 전환 중 백그라운드에서 호출됨 - 각 화면을 한 번 만들어서 에셋 캐시와 모듈 단위 유령 prototype 캐시를 채움"""
+    MagicCatAcademyLoadingScreen(width, height, show_fps=False)
+    TitleScreen(width, height)
+    GameScreen(width, height)
+    GameOverScreen(width, height)
+    leaderboard.load()  # 첫 게임오버 때 journal을 읽느라 멈추지 않도록
+
 
 if __name__ == "__main__":
     pygame.init()
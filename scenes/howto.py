@@ -6,9 +6,9 @@ from enum import Enum, auto
 from collections import deque
 from typing import Dict, Tuple
 
-from localLibraries.PlayCoreLibraries import ScreenObject, blit_fps  # 그대로 사용
-
-pygame.init()
+from localLibraries.PlayCoreLibraries import ScreenObject  # 그대로 사용
+from localLibraries.AssetManager import assets
+from localLibraries.FrameProfiler import FrameProfiler
 
 # ---------------------------------------------------------------------------
 # Game states
@@ -206,17 +206,18 @@ class PlayCoreMenu(ScreenObject):
     def __init__(self, width, height, show_fps=False):
         super().__init__(width, height)
         self.show_fps = show_fps
+        self.profiler = FrameProfiler(show_fps)
 
         font_size = int(self.height * 0.05)
         # body font (smaller)
         
         try:
-            self.font = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", font_size)
+            self.font = assets.font("data/fonts/SairaCondensed-Light.ttf", font_size)
         except:
             self.font = pygame.font.SysFont("arial", font_size)
         
         try:
-            self.body_font = pygame.font.Font("data/fonts/SairaCondensed-Light.ttf", int(self.height * 0.028))
+            self.body_font = assets.font("data/fonts/SairaCondensed-Light.ttf", int(self.height * 0.028))
         except:
             self.body_font = pygame.font.SysFont("arial", int(self.height * 0.028))
 
@@ -809,7 +810,9 @@ class PlayCoreMenu(ScreenObject):
         running = True
 
         while running:
+            self.profiler.begin_frame()
             dt_ms = clock.tick(60)
+            self.profiler.idle()
             dt = dt_ms / 1000.0
 
             # ----- 롱프레스 카운트 & 씬 탈출 트리거 -----
@@ -827,6 +830,7 @@ class PlayCoreMenu(ScreenObject):
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 self.handle_input(event, dt)
+            self.profiler.mark("events")
 
             # 되돌아가기 즉시 반환
             if self.go_back_requested:
@@ -876,6 +880,8 @@ class PlayCoreMenu(ScreenObject):
                     self.scroll = lerp(self.scroll, self.max_scroll, min(12.0 * dt, 1.0))
                     if not self.dragging: self.velocity = 0.0
 
+            self.profiler.mark("update")
+
             # background
             screen.blit(self._bg, (0, 0))
             self.update_squares(dt)
@@ -907,14 +913,21 @@ class PlayCoreMenu(ScreenObject):
                     max(int(self.height / 200), 2)
                 )
 
-            if self.show_fps:
-                blit_fps(screen, clock)
+            self.profiler.draw(screen, clock)
             pygame.display.flip()
+            self.profiler.mark("flip")
+
+def preload(width, height):
+    """씬 전환 중 백그라운드에서 호출됨 - 폰트를 미리 캐시"""
+    for size in (height * 0.05, height * 0.028):
+        assets.font("data/fonts/SairaCondensed-Light.ttf", int(size))
+
 
 # ---------------------------------------------------------------------------
 # Run
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    pygame.init()
     WIDTH, HEIGHT = 1280, 720
     try:
         screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)